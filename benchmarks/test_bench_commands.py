@@ -0,0 +1,14 @@
+import itertools
+import pytest
+from ddd.management.commands.bench import BENCH_ENTITY_NAME, benchDirectory, createCommands, runCreateCommand
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("command", createCommands(), ids=lambda command: command['name'])
+def test_create_command(benchmark, command):
+    counter = itertools.count()
+
+    with benchDirectory():
+        # Cada ronda genera una entidad nueva en el mismo directorio temporal (tmpfs si existe)
+        benchmark.pedantic(lambda: runCreateCommand(command, f"{BENCH_ENTITY_NAME}{next(counter)}"), rounds=10, warmup_rounds=1)
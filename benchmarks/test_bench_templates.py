@@ -0,0 +1,15 @@
+import pytest
+from ddd.management.commands.bench import renderParams, templateNames
+from ddd.management.commands.utils import renderTemplate
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("templateName,fileName", templateNames(), ids=lambda value: value)
+def test_render_template(benchmark, templateName, fileName):
+    params = renderParams()
+    renderTemplate(templateName, fileName, params)  # compilar antes de medir
+
+    content = benchmark(renderTemplate, templateName, fileName, params)
+
+    assert content
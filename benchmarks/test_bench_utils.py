@@ -0,0 +1,23 @@
+import itertools
+import os
+import pytest
+from ddd.management.commands.bench import BENCH_APP_PATH, benchDirectory
+from ddd.management.commands.utils import create__init__files, decodeAppPath
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_decode_app_path(benchmark):
+    assert benchmark(decodeAppPath, BENCH_APP_PATH) == ('apps.bench.catalog', 'catalog', 'bench:catalog', 'bench/catalog')
+
+
+def test_create_init_files(benchmark):
+    counter = itertools.count()
+
+    def setup():
+        path = os.path.join(f"pkg{next(counter)}", 'a', 'b', 'c')
+        os.makedirs(path)
+        return (path,), {}
+
+    with benchDirectory():
+        benchmark.pedantic(create__init__files, setup=setup, rounds=200)
@@ -1,39 +1,71 @@
 import argparse
-from ddd.management.commands.create_entity import CreateEntityCommand
-from ddd.management.commands.create_service import CreateServiceCommand
-from ddd.management.commands.create_repository import CreateRepositoryCommand
-from ddd.management.commands.create_dto import CreateDTOCommand
-from ddd.management.commands.create_serializer import CreateSerializerCommand
-from ddd.management.commands.create_view_api_apiview import CreateViewApiApiViewCommand
-from ddd.management.commands.create_view_api_viewset import CreateViewApiViewSetCommand
-from ddd.management.commands.create_view import CreateViewCommand
+import os
+import sys
+from ddd.management.commands.registry import add_subparsers, load_command
 from .version import version
 
 class CLI:
     def __init__(self):
         self.parser = argparse.ArgumentParser(description=f"CLI for DDD support in Python/Django projects v{version}")
+        self.parser.add_argument("--startup-profile", action="store_true", help="Run the command under -X importtime and print the slowest imports and the total startup time")
         self.subparsers = self.parser.add_subparsers(dest="subcommand", help="Available subcommands")
 
-        # Registro de subcomandos
-        CreateEntityCommand(self.subparsers)
-        CreateServiceCommand(self.subparsers)
-        CreateRepositoryCommand(self.subparsers)
-        CreateDTOCommand(self.subparsers)
-        CreateSerializerCommand(self.subparsers)
-        CreateViewApiApiViewCommand(self.subparsers)
-        CreateViewApiViewSetCommand(self.subparsers)
-        CreateViewCommand(self.subparsers)
+        # Registro de subcomandos (los módulos se importan solo al ejecutar el subcomando elegido)
+        add_subparsers(self.subparsers)
 
     def run(self):
+        # Autocompletado opcional en shell (pip install argcomplete)
+        if "_ARGCOMPLETE" in os.environ:
+            try:
+                import argcomplete
+                argcomplete.autocomplete(self.parser)
+            except ImportError:
+                pass
+
+        # --startup-profile se atiende antes de parsear para poder perfilar también --help
+        if "--startup-profile" in sys.argv[1:]:
+            startup_profile([arg for arg in sys.argv[1:] if arg != "--startup-profile"])
+            return
+
         args = self.parser.parse_args()
         if not args.subcommand:
             self.parser.print_help()
         else:
             # Ejecutar el subcomando seleccionado
-            args.func(args)
+            load_command(args.command).execute(args)
+
+def startup_profile(argv, limit=20):
+    """
+    Ejecuta el CLI en un subproceso con -X importtime y muestra los imports más costosos
+    (mismo formato que -X importtime, ordenados por tiempo acumulado) y el tiempo total.
+    """
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "ddd.management.cli", *argv], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(result.stdout)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            sys.stderr.write(line + "\n")
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            imports.append((int(fields[0]), int(fields[1]), fields[2].rstrip()))
+
+    print(f"\nimport time: self [us] | cumulative | imported package")
+    for self_us, cumulative_us, package in sorted(imports, key=lambda item: item[1], reverse=True)[:limit]:
+        print(f"import time: {self_us:>9} | {cumulative_us:>10} | {package}")
+
+    total_imports = sum(self_us for self_us, _, _ in imports) / 1000
+    print(f"\n{len(imports)} modules imported in {total_imports:.1f} ms, total run {elapsed * 1000:.1f} ms")
 
 def main():
-    CLI().run()            
+    CLI().run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,207 @@
+import contextlib
+import io
+import json
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from .utils import *
+from .registry import COMMANDS, load_command
+from colorama import Fore, Style
+
+# App y parámetros de ejemplo con los que se renderiza cada plantilla
+BENCH_APP_PATH = 'apps/bench/catalog'
+BENCH_ENTITY_NAME = 'product'
+
+# Directorios candidatos para los comandos end-to-end (tmpfs primero, para no medir el disco)
+TMPFS_DIRS = ('/dev/shm',)
+
+
+class BenchCommand:
+    def execute(self, args):
+        self.bench(output=args.output, repeat=args.repeat, only=args.only)
+
+    def bench(self, output=None, repeat=20, only=None, **kwargs):
+        """
+        Mide el generador: render de cada plantilla (tiempo y memoria), los comandos create-*
+        de principio a fin en un directorio temporal, decodeAppPath y create__init__files.
+
+        Muestra una tabla por consola y, si se indica output, guarda los resultados en JSON
+        para compararlos entre versiones.
+        """
+        sections = only or ['templates', 'commands', 'utils']
+        results = {
+            'version': version,
+            'python': platform.python_version(),
+            'repeat': repeat,
+        }
+
+        if 'templates' in sections:
+            results['templates'] = benchTemplates(repeat)
+            printTable('Templates', results['templates'], 'template', extra=('lines', 'alloc_kib', 'peak_kib'))
+
+        if 'commands' in sections:
+            results['commands'] = benchCommands(max(1, repeat // 4))
+            printTable('Commands (end-to-end)', results['commands'], 'command', extra=('files',))
+
+        if 'utils' in sections:
+            results['utils'] = benchUtils(repeat * 50)
+            printTable('Utils', results['utils'], 'function')
+
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            print(Fore.GREEN + f"Results written to {output}" + Style.RESET_ALL)
+
+        return results
+
+
+def renderParams() -> dict:
+    """Parámetros de ejemplo para cualquier plantilla (las plantillas ignoran los que no usan)"""
+    app_name, last_app_name, app_route, relative_app_path = decodeAppPath(BENCH_APP_PATH)
+    return {
+        'app_path': BENCH_APP_PATH,
+        'app_name': app_name,
+        'last_app_name': last_app_name,
+        'app_route': app_route,
+        'relative_app_path': relative_app_path,
+        'entity_name': BENCH_ENTITY_NAME,
+        'dto_name': BENCH_ENTITY_NAME,
+        'serializer_name': BENCH_ENTITY_NAME,
+    }
+
+
+def templateNames() -> list:
+    """Todas las plantillas del paquete como (templateName, fileName)"""
+    return sorted(
+        (path.parent.name, path.name)
+        for path in TEMPLATES_DIR.glob('*/*')
+        if path.is_file() and path.parent.name != '__pycache__'
+    )
+
+
+def timeCalls(function, repeat: int) -> dict:
+    """Tiempos de `repeat` llamadas a function (en milisegundos)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'mean_ms': round(statistics.fmean(times), 4),
+        'median_ms': round(statistics.median(times), 4),
+        'min_ms': round(min(times), 4),
+        'max_ms': round(max(times), 4),
+    }
+
+
+def measureAllocations(function) -> dict:
+    """Memoria asignada (neta) y pico de memoria de una llamada a function, en KiB"""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        function()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'alloc_kib': round((after - before) / 1024, 2),
+        'peak_kib': round((peak - before) / 1024, 2),
+    }
+
+
+def benchTemplates(repeat: int = 20) -> list:
+    """Tiempo y memoria de renderTemplate para cada plantilla (ya compilada: se mide solo el render)"""
+    params = renderParams()
+    results = []
+
+    for templateName, fileName in templateNames():
+        render = lambda: renderTemplate(templateName, fileName, params)
+        content = render()
+
+        results.append({
+            'template': f"{templateName}/{fileName}",
+            'lines': (TEMPLATES_DIR / templateName / fileName).read_text(encoding='utf-8').count('\n') + 1,
+            'output_bytes': len(content.encode('utf-8')),
+            **timeCalls(render, repeat),
+            **measureAllocations(render),
+        })
+
+    return results
+
+
+def createCommands() -> list:
+    """Subcomandos create-* del registro"""
+    return [command for command in COMMANDS if command['name'].startswith('create-')]
+
+
+@contextlib.contextmanager
+def benchDirectory():
+    """Directorio de trabajo temporal (en tmpfs si existe) que se usa como directorio actual"""
+    tmpfs = next((path for path in TMPFS_DIRS if os.path.isdir(path) and os.access(path, os.W_OK)), None)
+    previous = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix='ddd-bench-', dir=tmpfs) as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(previous)
+
+
+def runCreateCommand(command: dict, entity_name: str, app_path: str = BENCH_APP_PATH):
+    """Ejecuta un comando create-* como desde el CLI (lote de escritura incluido), sin salida por consola"""
+    instance = load_command(command)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with writeBatch():
+            getattr(instance, command['module'])(app_path, entity_name)
+
+
+def benchCommands(repeat: int = 5) -> list:
+    """Tiempo de cada comando create-* de principio a fin (cada ejecución genera una entidad nueva)"""
+    results = []
+
+    for command in createCommands():
+        with benchDirectory() as directory:
+            counter = iter(range(repeat + 1))
+            run = lambda: runCreateCommand(command, f"{BENCH_ENTITY_NAME}{next(counter)}")
+
+            run()   # primera ejecución: crea directorios y archivos compartidos
+            timings = timeCalls(run, repeat)
+            files = sum(len(names) for root, _, names in os.walk(directory) if '.ddd' not in root.split(os.sep))
+
+        results.append({'command': command['name'], 'files': files, **timings})
+
+    return results
+
+
+def benchUtils(repeat: int = 1000) -> list:
+    """Tiempo de decodeAppPath y create__init__files"""
+    results = [{'function': 'decodeAppPath', **timeCalls(lambda: decodeAppPath(BENCH_APP_PATH), repeat)}]
+
+    with benchDirectory() as directory:
+        counter = iter(range(repeat))
+
+        def create_init_files():
+            path = os.path.join(f"pkg{next(counter)}", 'a', 'b', 'c')
+            os.makedirs(path)
+            create__init__files(path)
+
+        results.append({'function': 'create__init__files', **timeCalls(create_init_files, repeat)})
+
+    return results
+
+
+def printTable(title: str, rows: list, key: str, extra=()):
+    """Muestra los resultados de una sección como tabla"""
+    columns = ('mean_ms', 'median_ms', 'min_ms') + tuple(extra)
+    width = max([len(key)] + [len(str(row[key])) for row in rows])
+
+    print(Fore.CYAN + f"\n{title}" + Style.RESET_ALL)
+    print(f"{key:<{width}}  " + '  '.join(f"{column:>10}" for column in columns))
+    for row in rows:
+        print(f"{row[key]:<{width}}  " + '  '.join(f"{row[column]:>10}" for column in columns))
@@ -1,20 +1,29 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan
 from colorama import Fore, Style
 
 class CreateDTOCommand:
-    def __init__(self, subparsers):
-        parser = subparsers.add_parser('create-dto', help='Create a new DTO (DataClass or Pydantic)')
-        parser.add_argument('app_path', type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument('dto_name', type=str, help='The name of the DTO')
-        parser.add_argument("--pydantic", action="store_true", help="Create a Pydantic structure for this dto")              
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")
-        parser.set_defaults(func=self.execute) 
-
     def execute(self, args):
-        self.create_dto(args.app_path, args.dto_name, args.pydantic, args.simulate)
+        if args.plan:
+            steps = self.plan(args.app_path, args.dto_name, args.pydantic)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_dto(args.app_path, args.dto_name, args.pydantic, simulate, regenerate=args.regenerate)
 
-    def create_dto(self, app_path, dto_name, pydantic=False, simulate=False, **kwargs):
+    def create_dto(self, app_path, dto_name, pydantic=False, simulate=False, regenerate=False, **kwargs):
         """Crea un nuevo DTO"""
+        if not self.prepare(app_path, dto_name, simulate, regenerate):
+            return
+
+        executePlan(buildPlan(self.plan(app_path, dto_name, pydantic)), simulate, regenerate)
+
+    def prepare(self, app_path, dto_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que el DTO no exista. Devuelve False si no se puede crear"""
         dtos_dir = os.path.join(app_path, 'dtos')
         dtos_path = os.path.join(dtos_dir, dto_name.lower() + '_dto.py')
 
@@ -26,31 +35,22 @@ class CreateDTOCommand:
                 
             except OSError as e:
                 print(Fore.RED + f"Failed to create directory '{dtos_dir}': {e}" + Style.RESET_ALL)
-                return
+                return False
             
             #si ya existe el archivo mostrar error
-            if os.path.exists(dtos_path):
+            if not regenerate and os.path.exists(dtos_path):
                 print(Fore.RED + f"File '{dtos_path}' already exists. Cannot create separate file" + Style.RESET_ALL)
-                return
-
-        # Escribir imports en el archivo 
-        # si no existe el archivo template_imports
-        if not os.path.exists(dtos_path) or simulate:
-            readWriteTemplate(
-                templateName='dto',
-                fileName='imports_dataclass.py' if not pydantic else 'imports_pydantic.py',
-                render_params={'dto_name': dto_name},
-                repository_path=dtos_path,
-                failIfError=True,
-                simulate=simulate
-            )
-
-        readWriteTemplate(
-            templateName='dto',
-            fileName='class_dataclass.py' if not pydantic else 'class_pydantic.py',
-            render_params={'dto_name': dto_name},
-            repository_path=dtos_path,
-            failIfError=True,
-            addition=True,
-            simulate=simulate
-        )
+                return False
+
+        return True
+
+    def plan(self, app_path, dto_name, pydantic=False, **kwargs):
+        """Plan de render de un DTO"""
+        dtos_path = os.path.join(app_path, 'dtos', dto_name.lower() + '_dto.py')
+
+        return [
+            # Escribir imports en el archivo si no existe
+            renderStep('dto', 'imports_dataclass.py' if not pydantic else 'imports_pydantic.py', dtos_path, {'dto_name': dto_name}, only_if_new=True),
+
+            renderStep('dto', 'class_dataclass.py' if not pydantic else 'class_pydantic.py', dtos_path, {'dto_name': dto_name}, addition=True),
+        ]
@@ -1,117 +1,82 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan, SCOPE_APP
 from colorama import Fore, Style
 
 class CreateRepositoryCommand:
-    def __init__(self, subparsers):
-        parser = subparsers.add_parser("create-repository", help='Create a new repository  (DataClass or Pydantic)')
-        parser.add_argument('app_path', type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument('entity_name', type=str, help='The name of the entity')
-        parser.add_argument("--pydantic", action="store_true", help="Create a Pydantic structure for this repository")
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")        
-        parser.set_defaults(func=self.execute)
-
     def execute(self, args):
-        self.create_repository(args.app_path, args.entity_name, args.pydantic, args.simulate)
-
-    def create_repository(self, app_path, entity_name, pydantic=False, simulate=False, **kwargs):
-            """Crea un nuevo repositorio"""
-            utils_dir = os.path.join(app_path, 'utils')
-            repository_dir = os.path.join(app_path, 'infrastructure')
-            repository_path = os.path.join(repository_dir, entity_name.lower() + '_repository.py')
-            mappers_path = os.path.join(repository_dir, 'mappers.py')
-            exceptions_path = os.path.join(repository_dir, 'exceptions.py')
-            filter_dict_path = os.path.join(utils_dir, 'filter_dict.py')
-            is_integer_path = os.path.join(utils_dir, 'is_integer.py')
-            is_uuid_path = os.path.join(utils_dir, 'is_uuid.py')
-            extract_validation_error_path = os.path.join(utils_dir, 'extract_validation_error.py')
-
-            # decodficar app_path
-            app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
-
-            if not simulate:
-                # Crear directorios si no existen
-                try:
-                    os.makedirs(repository_dir, exist_ok=True)
-                    create__init__files(repository_dir)
-                    
-                    os.makedirs(utils_dir, exist_ok=True)
-                    create__init__files(utils_dir)
-
-                except OSError as e:
-                    print(Fore.RED + f"Failed to create directory '{repository_dir}': {e}" + Style.RESET_ALL)
-                    return    
-            
-                #si ya existe el archivo mostrar error
-                if os.path.exists(repository_path):
-                    print(Fore.RED + f"The file '{repository_path}' already exists" + Style.RESET_ALL)
-                    return
-            
-            # Crear archivo de mappers.py        
-            readWriteTemplate(
-                templateName = 'repository', 
-                fileName='mappers_dataclass.py' if not pydantic else 'mappers_pydantic.py',
-                render_params={'entity_name':entity_name, 'app_name':app_name}, 
-                repository_path=mappers_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
+        if args.plan:
+            steps = self.plan(args.app_path, args.entity_name, args.pydantic)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_repository(args.app_path, args.entity_name, args.pydantic, simulate, regenerate=args.regenerate)
+
+    def create_repository(self, app_path, entity_name, pydantic=False, simulate=False, regenerate=False, **kwargs):
+        """Crea un nuevo repositorio"""
+        if not self.prepare(app_path, entity_name, simulate, regenerate):
+            return
+
+        executePlan(buildPlan(self.plan(app_path, entity_name, pydantic)), simulate, regenerate)
+
+    def prepare(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que el repositorio no exista. Devuelve False si no se puede crear"""
+        utils_dir = os.path.join(app_path, 'utils')
+        repository_dir = os.path.join(app_path, 'infrastructure')
+        repository_path = os.path.join(repository_dir, entity_name.lower() + '_repository.py')
+
+        if not simulate:
+            # Crear directorios si no existen
+            try:
+                os.makedirs(repository_dir, exist_ok=True)
+                create__init__files(repository_dir)
+                
+                os.makedirs(utils_dir, exist_ok=True)
+                create__init__files(utils_dir)
+
+            except OSError as e:
+                print(Fore.RED + f"Failed to create directory '{repository_dir}': {e}" + Style.RESET_ALL)
+                return False
+        
+            #si ya existe el archivo mostrar error
+            if not regenerate and os.path.exists(repository_path):
+                print(Fore.RED + f"The file '{repository_path}' already exists" + Style.RESET_ALL)
+                return False
+
+        return True
+
+    def plan(self, app_path, entity_name, pydantic=False, **kwargs):
+        """
+        Plan de render de un repositorio.
+
+        mappers.py, exceptions.py y los utils son compartidos por todos los repositorios de la app.
+        """
+        utils_dir = os.path.join(app_path, 'utils')
+        repository_dir = os.path.join(app_path, 'infrastructure')
+        repository_path = os.path.join(repository_dir, entity_name.lower() + '_repository.py')
+
+        # decodficar app_path
+        app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
+        render_params = {'entity_name': entity_name, 'app_name': app_name}
+
+        return [
+            # Crear archivo de mappers.py
+            renderStep('repository', 'mappers_dataclass.py' if not pydantic else 'mappers_pydantic.py', os.path.join(repository_dir, 'mappers.py'), render_params, scope=SCOPE_APP, required=False),
 
             # Crear archivo de exceptions.py
-            readWriteTemplate(
-                templateName = 'repository', 
-                fileName='exceptions.py', 
-                render_params={'entity_name':entity_name, 'app_name':app_name}, 
-                repository_path=exceptions_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
-
-            # Crear archivo filter_dict.py
-            readWriteTemplate(
-                templateName = 'utils', 
-                fileName='filter_dict.py',
-                render_params={}, 
-                repository_path=filter_dict_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
-
-            # Crear archivo is_integer.py
-            readWriteTemplate(
-                templateName = 'utils', 
-                fileName='is_integer.py', 
-                render_params={}, 
-                repository_path=is_integer_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
-
-            # Crear archivo is_uuid.py
-            readWriteTemplate(
-                templateName = 'utils', 
-                fileName='is_uuid.py', 
-                render_params={}, 
-                repository_path=is_uuid_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
-            
-            # Crear archivo extract_validation_error.py
-            readWriteTemplate(
-                templateName = 'utils', 
-                fileName='extract_validation_error.py', 
-                render_params={}, 
-                repository_path=extract_validation_error_path, 
-                failIfError=False, 
-                simulate=simulate
-            )
+            renderStep('repository', 'exceptions.py', os.path.join(repository_dir, 'exceptions.py'), render_params, scope=SCOPE_APP, required=False),
+
+            # Crear archivos de utils
+            renderStep('utils', 'filter_dict.py', os.path.join(utils_dir, 'filter_dict.py'), scope=SCOPE_APP, required=False),
+            renderStep('utils', 'is_integer.py', os.path.join(utils_dir, 'is_integer.py'), scope=SCOPE_APP, required=False),
+            renderStep('utils', 'is_uuid.py', os.path.join(utils_dir, 'is_uuid.py'), scope=SCOPE_APP, required=False),
+            renderStep('utils', 'extract_validation_error.py', os.path.join(utils_dir, 'extract_validation_error.py'), scope=SCOPE_APP, required=False),
+            renderStep('utils', 'cursor.py', os.path.join(utils_dir, 'cursor.py'), scope=SCOPE_APP, required=False),
+            renderStep('utils', 'entity_cache.py', os.path.join(utils_dir, 'entity_cache.py'), scope=SCOPE_APP, required=False),
 
             #renderizar class.py
-            readWriteTemplate(
-                templateName = 'repository', 
-                fileName='class.py', 
-                render_params={'entity_name':entity_name, 'app_name':app_name}, 
-                repository_path=repository_path, 
-                failIfError=True, 
-                simulate=simulate
-            )
+            renderStep('repository', 'class.py', repository_path, render_params),
+        ]
@@ -1,19 +1,29 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan
 from colorama import Fore, Style
 
 class CreateSerializerCommand:
-    def __init__(self, subparsers):
-        parser = subparsers.add_parser('create-serializer', help='Create a new Serializer')
-        parser.add_argument('app_path', type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument('serializer_name', type=str, help='The name of the Serializer')     
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")         
-        parser.set_defaults(func=self.execute) 
-
     def execute(self, args):
-        self.create_serializer(args.app_path, args.serializer_name, args.simulate)
+        if args.plan:
+            steps = self.plan(args.app_path, args.serializer_name)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_serializer(args.app_path, args.serializer_name, simulate, regenerate=args.regenerate)
 
-    def create_serializer(self, app_path, serializer_name, simulate=False, **kwargs):
+    def create_serializer(self, app_path, serializer_name, simulate=False, regenerate=False, **kwargs):
         """Crea un nuevo Serializer"""
+        if not self.prepare(app_path, serializer_name, simulate, regenerate):
+            return
+
+        executePlan(buildPlan(self.plan(app_path, serializer_name)), simulate, regenerate)
+
+    def prepare(self, app_path, serializer_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que el Serializer no exista. Devuelve False si no se puede crear"""
         serializers_dir = os.path.join(app_path, 'serializers')
         serializers_path = os.path.join(serializers_dir, serializer_name.lower() + '_serializer.py')
 
@@ -25,32 +35,22 @@ class CreateSerializerCommand:
                 
             except OSError as e:
                 print(Fore.RED + f"Failed to create directory '{serializers_dir}': {e}" + Style.RESET_ALL)
-                return
+                return False
             
             #si ya existe el archivo mostrar error
-            if os.path.exists(serializers_path):
+            if not regenerate and os.path.exists(serializers_path):
                 print(Fore.RED + f"File '{serializers_path}' already exists. Cannot create separate file" + Style.RESET_ALL)
-                return
-
-        # Escribir imports en el archivo 
-        # si no existe el archivo template_imports
-        if not os.path.exists(serializers_path) or simulate:
-            readWriteTemplate(
-                templateName='serializer',
-                fileName='imports.py',
-                render_params={'serializer_name': serializer_name},
-                repository_path=serializers_path,
-                failIfError=True,
-                simulate=simulate
-            )
-
-        readWriteTemplate(
-            templateName='serializer',
-            fileName='class.py',
-            render_params={'serializer_name': serializer_name},
-            repository_path=serializers_path,
-            failIfError=True,
-            addition=True,
-            simulate=simulate
-        )
-      
\ No newline at end of file
+                return False
+
+        return True
+
+    def plan(self, app_path, serializer_name, **kwargs):
+        """Plan de render de un Serializer"""
+        serializers_path = os.path.join(app_path, 'serializers', serializer_name.lower() + '_serializer.py')
+
+        return [
+            # Escribir imports en el archivo si no existe
+            renderStep('serializer', 'imports.py', serializers_path, {'serializer_name': serializer_name}, only_if_new=True),
+
+            renderStep('serializer', 'class.py', serializers_path, {'serializer_name': serializer_name}, addition=True),
+        ]
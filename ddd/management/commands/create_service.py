@@ -1,21 +1,30 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan
 from colorama import Fore, Style
 
 class CreateServiceCommand:
-    def __init__(self, subparsers):
-        parser = subparsers.add_parser("create-service", help='Create a new service')
-        parser.add_argument("app_path", type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument("entity_name", type=str, help='The name of the entity')
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")        
-        parser.set_defaults(func=self.execute)         
-
     def execute(self, args):
-        self.create_service(args.app_path, args.entity_name, args.simulate)
+        if args.plan:
+            steps = self.plan(args.app_path, args.entity_name)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_service(args.app_path, args.entity_name, simulate, regenerate=args.regenerate)
 
-    def create_service(self, app_path, entity_name="Entity", simulate=False, **kwargs):
+    def create_service(self, app_path, entity_name="Entity", simulate=False, regenerate=False, **kwargs):
         """Crea un nuevo servicio"""
+        if not self.prepare(app_path, entity_name, simulate, regenerate):
+            return
+
+        executePlan(buildPlan(self.plan(app_path, entity_name)), simulate, regenerate)
+
+    def prepare(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que el servicio no exista. Devuelve False si no se puede crear"""
         services_dir = os.path.join(app_path, 'services')
-        exceptions_path = os.path.join(services_dir, entity_name.lower() + '_exceptions.py')  
         services_path = os.path.join(services_dir, entity_name.lower() + '_service.py')
 
         if not simulate:
@@ -26,42 +35,28 @@ class CreateServiceCommand:
                 
             except OSError as e:
                 print(Fore.RED + f"Failed to create directory '{services_dir}': {e}" + Style.RESET_ALL)
-                return
+                return False
             
             #si ya existe el archivo mostrar error
-            if os.path.exists(services_path):
+            if not regenerate and os.path.exists(services_path):
                 print(Fore.RED + f"The file '{services_path}' already exists. A separate file cannot be created" + Style.RESET_ALL)
-                return
+                return False
+
+        return True
+
+    def plan(self, app_path, entity_name="Entity", **kwargs):
+        """Plan de render de un servicio"""
+        services_dir = os.path.join(app_path, 'services')
+        exceptions_path = os.path.join(services_dir, entity_name.lower() + '_exceptions.py')  
+        services_path = os.path.join(services_dir, entity_name.lower() + '_service.py')
+
+        return [
+            # Escribir imports en el archivo si no existe
+            renderStep('services', 'imports.py', services_path, {'entity_name': entity_name}, only_if_new=True),
 
-        # Escribir imports en el archivo 
-        # si no existe el archivo template_imports
-        if not os.path.exists(services_path) or simulate:
-            readWriteTemplate(
-                templateName='services',
-                fileName='imports.py',
-                render_params={'entity_name': entity_name},
-                repository_path=services_path,
-                failIfError=True,
-                simulate=simulate
-            )
+            #renderizar class
+            renderStep('services', 'class.py', services_path, {'entity_name': entity_name}, addition=True),
 
-        #renderizar class
-        readWriteTemplate(
-            templateName='services',
-            fileName='class.py',
-            render_params={'entity_name': entity_name},
-            repository_path=services_path,
-            failIfError=True,
-            addition=True,
-            simulate=simulate
-        )
-       
-        #renderizar exceptions
-        readWriteTemplate(
-            templateName='services',
-            fileName='exceptions.py',
-            render_params={'entity_name': entity_name},
-            repository_path=exceptions_path,
-            failIfError=True,
-            simulate=simulate
-        )
\ No newline at end of file
+            #renderizar exceptions
+            renderStep('services', 'exceptions.py', exceptions_path, {'entity_name': entity_name}),
+        ]
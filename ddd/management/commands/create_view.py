@@ -1,137 +1,106 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan, SCOPE_APP
 from colorama import Fore, Style
 
 class CreateViewCommand:
-    def __init__(self, subparsers):      
-        parser = subparsers.add_parser('create-view', help='Create a view for web')
-        parser.add_argument('app_path', type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument('entity_name', type=str, help='The name of the entity')      
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")          
-        parser.set_defaults(func=self.execute)           
-
     def execute(self, args):
-        self.create_view(args.app_path, args.entity_name, args.simulate)
+        if args.plan:
+            steps = self.plan(args.app_path, args.entity_name)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_view(args.app_path, args.entity_name, simulate, regenerate=args.regenerate)
 
-    def create_view(self, app_path, entity_name, simulate=False, **kwargs):
+    def create_view(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
         """Crea una view para web"""
-        # decodificar app_path 
-        app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
+        if not self.prepare(app_path, entity_name, simulate, regenerate):
+            return
 
-        views_dir = app_path
-        views_templates_dir = os.path.join(views_dir, 'templates', relative_app_path)
+        executePlan(buildPlan(self.plan(app_path, entity_name)), simulate, regenerate)
 
-        urls_path = os.path.join(views_dir, entity_name.lower() + '_urls.py')
-        views_path = os.path.join(views_dir, entity_name.lower() + '_views.py')
-        forms_path = os.path.join(views_dir, entity_name.lower() + '_forms.py')
+    def prepare(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que la view no exista. Devuelve False si no se puede crear"""
+        paths = self._paths(app_path, entity_name)
 
         if not simulate:
             # Crear directorios si no existen
             try:
-                os.makedirs(views_dir, exist_ok=True)
-                create__init__files(views_dir)
+                os.makedirs(paths['views_dir'], exist_ok=True)
+                create__init__files(paths['views_dir'])
                 
                 # Crear directorios de templates si no existen
-                os.makedirs(views_templates_dir, exist_ok=True)
+                os.makedirs(paths['views_templates_dir'], exist_ok=True)
 
             except OSError as e:
-                print(Fore.RED + f"Failed to create directory '{views_dir}': {e}" + Style.RESET_ALL)
-                return    
-            
-            #si ya existe el archivo view mostrar error
-            if os.path.exists(views_path):
-                print(Fore.RED + f"The file '{views_path}' already exists" + Style.RESET_ALL)
-                return
-            
-            #si ya existe el archivo form mostrar error
-            if os.path.exists(forms_path):
-                print(Fore.RED + f"The file '{forms_path}' already exists" + Style.RESET_ALL)
-                return
-
-        web_list_register_path = os.path.join(views_templates_dir, entity_name.lower() + '_web_list' + '.html')
-        web_create_register_path = os.path.join(views_templates_dir, entity_name.lower() + '_web_create' + '.html')
-        web_edit_register_path = os.path.join(views_templates_dir, entity_name.lower() +'_web_edit' + '.html')
-        web_detail_register_path = os.path.join(views_templates_dir, entity_name.lower() + '_web_detail' + '.html')        
-        web_form_errors_path = os.path.join(views_templates_dir, '_web_form_errors' + '.html') 
-        web_global_errors_path = os.path.join(views_templates_dir, '_web_global_errors' + '.html') 
+                print(Fore.RED + f"Failed to create directory '{paths['views_dir']}': {e}" + Style.RESET_ALL)
+                return False
 
-        if not simulate:
-            #si ya existe el archivo web_create_register mostrar error
-            if os.path.exists(web_create_register_path):
-                print(Fore.RED + f"The file '{web_create_register_path}' already exists" + Style.RESET_ALL)
-                return  
-
-            #si ya existe el archivo web_edit_register mostrar error
-            if os.path.exists(web_edit_register_path):
-                print(Fore.RED + f"The file '{web_edit_register_path}' already exists" + Style.RESET_ALL)
-                return
-
-            #si ya existe el archivo web_list_register mostrar error
-            if os.path.exists(web_list_register_path):
-                print(Fore.RED + f"The file '{web_list_register_path}' already exists" + Style.RESET_ALL)
-                return
-
-            #si ya existe el archivo web_detail_register mostrar error
-            if os.path.exists(web_detail_register_path):
-                print(Fore.RED + f"The file '{web_detail_register_path}' already exists" + Style.RESET_ALL)
-                return          
-
-            # #si ya existe el archivo web_form_errors mostrar error
-            # if os.path.exists(web_form_errors_path):
-            #     print(Fore.RED + f"The file '{web_form_errors_path}' already exists" + Style.RESET_ALL)
-            #     return
-
-            # #si ya existe el archivo web_global_errors mostrar error
-            # if os.path.exists(web_global_errors_path):
-            #     print(Fore.RED + f"The file '{web_global_errors_path}' already exists" + Style.RESET_ALL)
-            #     return                            
-
-        #renderizar views
-        readWriteTemplate(
-            templateName='view',
-            fileName='web_views.py',
-            render_params={
+            #si ya existe el archivo view, form o alguno de los templates mostrar error
+            for name in ('views', 'forms', 'web_create_register', 'web_edit_register', 'web_list_register', 'web_detail_register'):
+                if not regenerate and os.path.exists(paths[name]):
+                    print(Fore.RED + f"The file '{paths[name]}' already exists" + Style.RESET_ALL)
+                    return False
+
+        return True
+
+    def plan(self, app_path, entity_name, **kwargs):
+        """
+        Plan de render de una view para web.
+
+        Los templates de errores (_web_form_errors.html y _web_global_errors.html) son compartidos por la app.
+        """
+        # decodificar app_path 
+        app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
+        paths = self._paths(app_path, entity_name)
+        template_params = {'app_route': app_route, 'entity_name': entity_name, 'relative_app_path': relative_app_path}
+
+        return [
+            #renderizar views
+            renderStep('view', 'web_views.py', paths['views'], {
                 'app_path': app_path, 
                 'app_name': app_name, 
                 'last_app_name': last_app_name, 
                 'app_route': app_route, 
                 'relative_app_path': relative_app_path, 
                 'entity_name': entity_name
-            },
-            repository_path=views_path,
-            failIfError=True,
-            simulate=simulate
-        )
-
-        #renderizar forms
-        readWriteTemplate(
-            templateName='view',
-            fileName='web_forms.py',
-            render_params={'entity_name': entity_name},
-            repository_path=forms_path,
-            failIfError=True,
-            simulate=simulate
-        )
+            }),
 
-        #renderizar urls
-        readWriteTemplate(templateName='routers', fileName='web_urls.py',  render_params={'last_app_name':last_app_name, 'entity_name':entity_name}, repository_path=urls_path, failIfError=True, simulate=simulate)
-        # print(f"Urls of Entity '{entity_name}' created at {urls_path}")
+            #renderizar forms
+            renderStep('view', 'web_forms.py', paths['forms'], {'entity_name': entity_name}),
 
-        #renderizar templates
-        readWriteTemplate(templateName='templates', fileName='web_list_register.html',  render_params={'app_route':app_route, 'entity_name':entity_name, 'relative_app_path':relative_app_path}, repository_path=web_list_register_path, failIfError=True, simulate=simulate)
-        # print(f"Template web_list of Entity '{entity_name}' created at {web_list_register_path}")
+            #renderizar urls
+            renderStep('routers', 'web_urls.py', paths['urls'], {'last_app_name': last_app_name, 'entity_name': entity_name}),
 
-        readWriteTemplate(templateName='templates', fileName='web_create_register.html',  render_params={'app_route':app_route, 'entity_name':entity_name, 'relative_app_path':relative_app_path}, repository_path=web_create_register_path, failIfError=True, simulate=simulate)
-        # print(f"Template web_create of Entity '{entity_name}' created at {web_create_register_path}")
+            #renderizar templates
+            renderStep('templates', 'web_list_register.html', paths['web_list_register'], template_params),
+            renderStep('templates', 'web_create_register.html', paths['web_create_register'], template_params),
+            renderStep('templates', 'web_edit_register.html', paths['web_edit_register'], template_params),
+            renderStep('templates', 'web_detail_register.html', paths['web_detail_register'], template_params),
+            renderStep('templates', '_web_form_errors.html', paths['web_form_errors'], scope=SCOPE_APP, required=False),
+            renderStep('templates', '_web_global_errors.html', paths['web_global_errors'], scope=SCOPE_APP, required=False),
+        ]
 
-        readWriteTemplate(templateName='templates', fileName='web_edit_register.html',  render_params={'app_route':app_route, 'entity_name':entity_name, 'relative_app_path':relative_app_path}, repository_path=web_edit_register_path, failIfError=True, simulate=simulate)
-        # print(f"Template web_edit of Entity '{entity_name}' created at {web_edit_register_path}")
-
-        readWriteTemplate(templateName='templates', fileName='web_detail_register.html',  render_params={'app_route':app_route, 'entity_name':entity_name, 'relative_app_path':relative_app_path}, repository_path=web_detail_register_path, failIfError=True, simulate=simulate)
-        # print(f"Template web_detail of Entity '{entity_name}' created at {web_detail_register_path}")
-
-        readWriteTemplate(templateName='templates', fileName='_web_form_errors.html',  render_params={}, repository_path=web_form_errors_path, failIfError=False, simulate=simulate)
-        # print(f"Template web_form_errors of Entity '{entity_name}' created at {web_form_errors_path}")
+    def _paths(self, app_path, entity_name):
+        """Rutas de los archivos de la view"""
+        app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
 
-        readWriteTemplate(templateName='templates', fileName='_web_global_errors.html',  render_params={}, repository_path=web_global_errors_path, failIfError=False, simulate=simulate)
-        # print(f"Template web_global_errors of Entity '{entity_name}' created at {web_global_errors_path}")
+        views_dir = app_path
+        views_templates_dir = os.path.join(views_dir, 'templates', relative_app_path)
 
+        return {
+            'views_dir': views_dir,
+            'views_templates_dir': views_templates_dir,
+            'urls': os.path.join(views_dir, entity_name.lower() + '_urls.py'),
+            'views': os.path.join(views_dir, entity_name.lower() + '_views.py'),
+            'forms': os.path.join(views_dir, entity_name.lower() + '_forms.py'),
+            'web_list_register': os.path.join(views_templates_dir, entity_name.lower() + '_web_list' + '.html'),
+            'web_create_register': os.path.join(views_templates_dir, entity_name.lower() + '_web_create' + '.html'),
+            'web_edit_register': os.path.join(views_templates_dir, entity_name.lower() + '_web_edit' + '.html'),
+            'web_detail_register': os.path.join(views_templates_dir, entity_name.lower() + '_web_detail' + '.html'),
+            'web_form_errors': os.path.join(views_templates_dir, '_web_form_errors' + '.html'),
+            'web_global_errors': os.path.join(views_templates_dir, '_web_global_errors' + '.html'),
+        }
@@ -1,23 +1,37 @@
 from .utils import *
+from .planner import renderStep, buildPlan, executePlan, printPlan, SCOPE_APP
 from colorama import Fore, Style
 import os
 from .create_serializer import CreateSerializerCommand
 
 class CreateViewApiApiViewCommand:
-    def __init__(self, subparsers):
-        parser = subparsers.add_parser('create-view-api-apiview', help='Create a view for api based on ApiView')
-        parser.add_argument('app_path', type=str, help='The relative path of the app within the project (for example, "apps/app1")')
-        parser.add_argument('entity_name', type=str, help='The name of the entity')     
-        parser.add_argument("--simulate", action="store_true", help="Simulate the creation of this entity without writing files")        
-        parser.set_defaults(func=self.execute)
-
     def execute(self, args):
-        self.create_view_api_apiview(args.app_path, args.entity_name, args.simulate)
+        if args.plan:
+            steps = self.plan(args.app_path, args.entity_name)
+            printPlan(buildPlan(steps), requested=len(steps))
+            return
+
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+
+        with writeBatch(simulate=simulate, regenerate=args.regenerate, dry_run=dry_run):
+            self.create_view_api_apiview(args.app_path, args.entity_name, simulate, regenerate=args.regenerate)
 
-    def create_view_api_apiview(self, app_path, entity_name, simulate=False, **kwargs):
+    def create_view_api_apiview(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
         """Crea una view para api basada en ApiView"""
+        if not self.prepare(app_path, entity_name, simulate, regenerate):
+            return
+
+        # Crear serializer (si ya existe se avisa y se crea solo la view)
+        serializer_command = CreateSerializerCommand()
+        serializer = serializer_command.prepare(app_path, entity_name, simulate, regenerate)
+
+        executePlan(buildPlan(self.plan(app_path, entity_name, serializer=serializer)), simulate, regenerate)
+
+    def prepare(self, app_path, entity_name, simulate=False, regenerate=False, **kwargs):
+        """Crea los directorios y comprueba que la view no exista. Devuelve False si no se puede crear"""
         views_dir = app_path
-        urls_path = os.path.join(views_dir, entity_name.lower() + '_urls.py')
+        utils_dir = os.path.join(app_path, 'utils')
         views_path = os.path.join(views_dir, entity_name.lower() + '_views.py')
 
         if not simulate:
@@ -25,35 +39,44 @@ class CreateViewApiApiViewCommand:
             try:
                 os.makedirs(views_dir, exist_ok=True)
                 create__init__files(views_dir)
+
+                os.makedirs(utils_dir, exist_ok=True)
+                create__init__files(utils_dir)
                 
             except OSError as e:
                 print(Fore.RED + f"Failed to create directory '{views_dir}': {e}" + Style.RESET_ALL)
-                return    
+                return False
             
             #si ya existe el archivo mostrar error
-            if os.path.exists(views_path):
+            if not regenerate and os.path.exists(views_path):
                 print(Fore.RED + f"File '{views_path}' already exists" + Style.RESET_ALL)
-                return
-        
+                return False
+
+        return True
+
+    def plan(self, app_path, entity_name, serializer=True, **kwargs):
+        """Plan de render de la view, sus urls, la utilidad de exportación y (si serializer es True) su serializer"""
+        views_dir = app_path
+        utils_dir = os.path.join(app_path, 'utils')
+        urls_path = os.path.join(views_dir, entity_name.lower() + '_urls.py')
+        views_path = os.path.join(views_dir, entity_name.lower() + '_views.py')
+
         # decodficar app_path
         app_name, last_app_name, app_route, relative_app_path = decodeAppPath(app_path)
 
-        #renderizar urls
-        readWriteTemplate(templateName='routers', fileName='api_apiview_urls.py',  render_params={'entity_name':entity_name, 'app_name': app_name}, repository_path=urls_path, failIfError=True, simulate=simulate)
-
-        # Crear serializer - llamar directamente al método sin crear nueva instancia
-        serializer_command = CreateSerializerCommand.__new__(CreateSerializerCommand)
-        serializer_command.create_serializer(app_path=app_path, serializer_name=entity_name, simulate=simulate)
-
-        readWriteTemplate(
-            templateName='api',
-            fileName='apiview_views.py',
-            render_params={
-                'app_name': app_name,
-                'entity_name': entity_name
-            },
-            repository_path=views_path,
-            failIfError=True,
-            simulate=simulate
-        )
-     
\ No newline at end of file
+        # Serializer
+        serializer_command = CreateSerializerCommand()
+        serializer_steps = serializer_command.plan(app_path, entity_name) if serializer else []
+
+        return [
+            #renderizar urls
+            renderStep('routers', 'api_apiview_urls.py', urls_path, {'entity_name': entity_name, 'app_name': app_name}),
+
+            # Crear serializer
+            *serializer_steps,
+
+            # Crear utilidades de exportación (compartidas por las views de la app)
+            renderStep('utils', 'stream_export.py', os.path.join(utils_dir, 'stream_export.py'), scope=SCOPE_APP, required=False),
+
+            renderStep('api', 'apiview_views.py', views_path, {'app_name': app_name, 'entity_name': entity_name}),
+        ]
@@ -0,0 +1,125 @@
+"""
+Índice de archivos generados (.ddd/manifest.json).
+
+Por cada archivo generado guarda las entradas con las que se renderizó (plantillas, hash de
+cada plantilla y parámetros) y el hash del contenido escrito. Con esto --regenerate puede:
+
+- Omitir los archivos cuyas entradas no cambiaron y que siguen intactos en disco.
+- Reescribir los archivos intactos cuyas entradas cambiaron (nueva versión de plantilla o parámetros).
+- No tocar los archivos modificados por el usuario (y mostrar el diff si hay una versión nueva).
+
+Además guarda en .ddd/base/<ruta> la versión recién generada (sin ediciones del usuario) de
+cada archivo, que `ddd upgrade` usa como base del merge a tres bandas.
+
+Las rutas del índice son relativas al directorio desde el que se ejecuta el CLI (la raíz del proyecto).
+"""
+import hashlib
+import json
+import os
+from .utils import getTemplatePath, renderTemplate, writeFileAtomic
+
+INDEX_PATH = os.path.join('.ddd', 'manifest.json')
+
+BASE_DIR = os.path.join('.ddd', 'base')
+
+INDEX_VERSION = 1
+
+# Hash de cada plantilla (las plantillas no cambian durante una ejecución, salvo en `ddd watch`)
+_template_hashes = {}
+
+
+def loadIndex() -> dict:
+    """Carga el índice, o uno vacío si no existe o no es válido"""
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {'version': INDEX_VERSION, 'files': {}}
+
+    if not isinstance(index, dict) or index.get('version') != INDEX_VERSION:
+        return {'version': INDEX_VERSION, 'files': {}}
+
+    return index
+
+
+def saveIndex(index: dict):
+    """Guarda el índice (escritura atómica, claves ordenadas para que los diffs sean legibles)"""
+    writeFileAtomic(INDEX_PATH, json.dumps(index, indent=2, sort_keys=True) + '\n')
+
+
+def indexKey(path: str) -> str:
+    """Clave de un archivo en el índice: ruta relativa normalizada con separadores '/'"""
+    return os.path.normpath(os.path.relpath(path)).replace(os.sep, '/')
+
+
+def selectKeys(index: dict, paths=None) -> list:
+    """Claves del índice (ordenadas) que están bajo alguna de las rutas dadas (todas si no se indica ninguna)"""
+    prefixes = [indexKey(path) for path in paths or []]
+    return [
+        key for key in sorted(index['files'])
+        if not prefixes or any(key == prefix or key.startswith(prefix.rstrip('/') + '/') for prefix in prefixes)
+    ]
+
+
+def contentHash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def fileHash(path: str):
+    """Hash del contenido actual de un archivo, None si no existe"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return contentHash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def templateHash(templateName: str, fileName: str) -> str:
+    """Hash del código fuente de una plantilla"""
+    template = f"{templateName}/{fileName}"
+    if template not in _template_hashes:
+        _template_hashes[template] = hashlib.sha256(getTemplatePath(templateName, fileName).read_bytes()).hexdigest()
+    return _template_hashes[template]
+
+
+def forgetTemplateHashes():
+    """Descarta los hashes calculados (las plantillas cambiaron en disco)"""
+    _template_hashes.clear()
+
+
+def jobInputs(jobs: list) -> list:
+    """Entradas de render de un archivo (una por trabajo, en orden)"""
+    return [
+        {
+            'template': f"{job['templateName']}/{job['fileName']}",
+            'template_hash': templateHash(job['templateName'], job['fileName']),
+            'params': job['render_params']
+        }
+        for job in jobs
+    ]
+
+
+def refreshInputs(inputs: list) -> list:
+    """Las mismas entradas con el hash de la versión actual de cada plantilla"""
+    return [dict(item, template_hash=templateHash(*item['template'].split('/', 1))) for item in inputs]
+
+
+def renderInputs(inputs: list) -> str:
+    """Renderiza un archivo a partir de sus entradas (misma composición que pipeline.runPipeline)"""
+    return ''.join(
+        '\n' + renderTemplate(*item['template'].split('/', 1), render_params=item['params']) + '\n'
+        for item in inputs
+    )
+
+
+def loadBase(key: str):
+    """Versión generada (sin ediciones del usuario) de un archivo, None si no se guardó"""
+    try:
+        with open(os.path.join(BASE_DIR, key), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def saveBase(key: str, content: str):
+    writeFileAtomic(os.path.join(BASE_DIR, key), content)
@@ -0,0 +1,97 @@
+"""
+Merge a tres bandas (diff3) por líneas, sin dependencias externas.
+
+Se usa en `ddd upgrade` para llevar los cambios de una plantilla (base -> nueva versión)
+a un archivo generado que el usuario ya modificó (base -> actual).
+"""
+from difflib import SequenceMatcher
+
+CONFLICT_START = '<<<<<<< current'
+CONFLICT_BASE = '||||||| base'
+CONFLICT_SEPARATOR = '======='
+CONFLICT_END = '>>>>>>> template'
+
+
+def merge3(base: str, current: str, upgraded: str):
+    """
+    Combina los cambios de current y upgraded respecto a base.
+
+    Los bloques que solo cambiaron en uno de los lados se toman de ese lado; los que
+    cambiaron de forma distinta en ambos se escriben con marcadores de conflicto estilo git (diff3).
+
+    returns:
+        Tupla (contenido combinado, número de conflictos).
+    """
+    base_lines = base.splitlines(keepends=True)
+    current_lines = current.splitlines(keepends=True)
+    upgraded_lines = upgraded.splitlines(keepends=True)
+
+    merged = []
+    conflicts = 0
+    i_base = i_current = i_upgraded = 0
+
+    for base_start, base_end, current_start, current_end, upgraded_start, upgraded_end in _sync_regions(base_lines, current_lines, upgraded_lines):
+        # Bloque sin sincronizar entre la región anterior y esta
+        base_chunk = base_lines[i_base:base_start]
+        current_chunk = current_lines[i_current:current_start]
+        upgraded_chunk = upgraded_lines[i_upgraded:upgraded_start]
+
+        if current_chunk == upgraded_chunk or upgraded_chunk == base_chunk:
+            merged.extend(current_chunk)
+        elif current_chunk == base_chunk:
+            merged.extend(upgraded_chunk)
+        else:
+            conflicts += 1
+            merged.append(CONFLICT_START + '\n')
+            merged.extend(_terminated(current_chunk))
+            merged.append(CONFLICT_BASE + '\n')
+            merged.extend(_terminated(base_chunk))
+            merged.append(CONFLICT_SEPARATOR + '\n')
+            merged.extend(_terminated(upgraded_chunk))
+            merged.append(CONFLICT_END + '\n')
+
+        # Región sincronizada (igual en los tres)
+        merged.extend(base_lines[base_start:base_end])
+
+        i_base, i_current, i_upgraded = base_end, current_end, upgraded_end
+
+    return ''.join(merged), conflicts
+
+
+def _sync_regions(base: list, current: list, upgraded: list) -> list:
+    """
+    Regiones de base que coinciden a la vez con current y con upgraded
+    (intersección de los bloques coincidentes de ambos diffs), terminadas en una región vacía final.
+    """
+    current_matches = SequenceMatcher(None, base, current, autojunk=False).get_matching_blocks()
+    upgraded_matches = SequenceMatcher(None, base, upgraded, autojunk=False).get_matching_blocks()
+
+    regions = []
+    i = j = 0
+    while i < len(current_matches) and j < len(upgraded_matches):
+        c_base, c_start, c_len = current_matches[i]
+        u_base, u_start, u_len = upgraded_matches[j]
+
+        start = max(c_base, u_base)
+        end = min(c_base + c_len, u_base + u_len)
+        if start < end:
+            regions.append((
+                start, end,
+                c_start + (start - c_base), c_start + (end - c_base),
+                u_start + (start - u_base), u_start + (end - u_base)
+            ))
+
+        if c_base + c_len < u_base + u_len:
+            i += 1
+        else:
+            j += 1
+
+    regions.append((len(base), len(base), len(current), len(current), len(upgraded), len(upgraded)))
+    return regions
+
+
+def _terminated(lines: list) -> list:
+    """Asegura que el bloque termine en salto de línea antes de un marcador de conflicto"""
+    if lines and not lines[-1].endswith('\n'):
+        return lines[:-1] + [lines[-1] + '\n']
+    return lines
@@ -0,0 +1,187 @@
+import difflib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .utils import renderTemplate, writeFileAtomic
+from .generation_index import loadIndex, saveIndex, saveBase, indexKey, contentHash, fileHash, jobInputs
+
+# Por debajo de este número de renders no compensa arrancar un pool de procesos
+PARALLEL_RENDER_MIN_JOBS = 64
+
+
+def runPipeline(batch: dict, workers: int = None) -> list:
+    """
+    Renderiza y escribe un lote de archivos (ver utils.beginWriteBatch).
+
+    0. Plan: en modo regenerate (salvo en simulación) se compara cada archivo con el índice .ddd/manifest.json
+       para decidir si se reescribe, se omite o se respeta porque lo modificó el usuario.
+    1. Render: los trabajos se reparten en un pool de procesos (el render Jinja2 es CPU-bound).
+       Con pocos trabajos o workers=1 se renderiza en el propio proceso.
+    2. Escritura: cada archivo se escribe desde un pool de hilos en un archivo temporal
+       que luego se renombra sobre el destino (escritura atómica).
+    3. Índice: se guardan las entradas, el hash y la versión generada (base) de cada archivo escrito.
+
+    params:
+    - batch: Lote de utils.beginWriteBatch ({'files': ruta -> {'append', 'jobs'}, 'regenerate', 'dry_run'})
+    - workers: Número máximo de procesos/hilos (por defecto el número de CPUs)
+    returns:
+        Resultado por archivo ({'path', 'action', 'diff'}), ordenado por la clave de su primer trabajo.
+        action: 'write', 'unchanged', 'kept' (modificado por el usuario), 'skipped'
+        (modificado por el usuario y con una versión nueva, que se devuelve en 'diff') o 'partial'
+        (el archivo contiene también contenido generado por otras entradas que no están en el lote).
+        En simulación (dry_run) el resultado es el de _dry_run_result y no se escribe nada.
+    """
+    if not batch or not batch['files']:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    index = loadIndex()
+    files = sorted(batch['files'].items(), key=lambda item: item[1]['jobs'][0]['key'])
+
+    # Planificar
+    plans = []
+    for path, pending in files:
+        inputs = json.loads(json.dumps(jobInputs(pending['jobs'])))
+        entry = index['files'].get(indexKey(path))
+        plans.append({
+            'path': path,
+            'pending': pending,
+            'inputs': inputs,
+            'entry': entry,
+            'current_hash': fileHash(path),
+            'action': _plan_action(path, inputs, entry, batch['regenerate'] and not batch['dry_run'])
+        })
+
+    # Renderizar
+    jobs = sorted(
+        (job for plan in plans if plan['action'] in ('write', 'skipped') for job in plan['pending']['jobs']),
+        key=lambda job: job['key']
+    )
+    if workers > 1 and len(jobs) >= PARALLEL_RENDER_MIN_JOBS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = list(executor.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        rendered = [_render_job(job) for job in jobs]
+
+    contents = dict(zip((job['key'] for job in jobs), rendered))
+
+    # Componer cada archivo con sus trabajos (en orden)
+    for plan in plans:
+        if plan['action'] in ('write', 'skipped'):
+            plan['content'] = ''.join('\n' + contents[job['key']] + '\n' for job in plan['pending']['jobs'])
+
+    # En simulación no se escribe nada: se compara cada archivo con el que hay en disco
+    if batch['dry_run']:
+        return [_dry_run_result(plan, batch['dry_run']['diff']) for plan in plans]
+
+    # En modo regenerate el archivo se reescribe completo; si no, se respetan las adiciones
+    append = not batch['regenerate']
+    writes = [plan for plan in plans if plan['action'] == 'write']
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda plan: writeFileAtomic(plan['path'], plan['content'], append and plan['pending']['append']), writes))
+
+    # Actualizar el índice. Si se añadió contenido a un archivo existente, la entrada solo sigue
+    # siendo reproducible si el contenido previo también estaba generado e intacto.
+    # La versión generada de cada archivo indexado se guarda como base para `ddd upgrade`.
+    for plan in writes:
+        key = indexKey(plan['path'])
+        if not (append and plan['pending']['append'] and plan['current_hash'] is not None):
+            index['files'][key] = {'inputs': plan['inputs'], 'output_hash': contentHash(plan['content'])}
+            saveBase(key, plan['content'])
+        elif plan['entry'] is not None and plan['entry']['output_hash'] == plan['current_hash']:
+            with open(plan['path'], 'r', encoding='utf-8') as f:
+                content = f.read()
+            index['files'][key] = {'inputs': plan['entry']['inputs'] + plan['inputs'], 'output_hash': contentHash(content)}
+            saveBase(key, content)
+        else:
+            index['files'].pop(key, None)
+
+    if writes:
+        saveIndex(index)
+
+    return [
+        {'path': plan['path'], 'action': plan['action'], 'diff': _diff(plan) if plan['action'] == 'skipped' else None}
+        for plan in plans
+    ]
+
+
+def _plan_action(path: str, inputs: list, entry: dict, regenerate: bool) -> str:
+    """Decide qué hacer con un archivo del lote según el índice (ver runPipeline)"""
+    if not regenerate:
+        return 'write'
+
+    current_hash = fileHash(path)
+    if current_hash is None:
+        return 'write'
+
+    inputs_changed = entry is None or entry['inputs'] != inputs
+    if entry is not None and current_hash == entry['output_hash']:
+        # Reescribir el archivo con solo una parte de sus entradas borraría el resto
+        if _input_ids(entry['inputs']) - _input_ids(inputs):
+            return 'partial'
+        return 'write' if inputs_changed else 'unchanged'
+
+    # El archivo no lo generó el CLI o lo modificó el usuario
+    return 'skipped' if inputs_changed else 'kept'
+
+
+def _dry_run_result(plan: dict, diff=False) -> dict:
+    """
+    Compara un archivo renderizado (completo, como lo dejaría --regenerate) con el que hay en disco.
+
+    returns:
+        {'path', 'action' ('create', 'modify' o 'unchanged'), 'bytes', 'hash', 'diff'}
+    """
+    current = None
+    if os.path.exists(plan['path']):
+        with open(plan['path'], 'r', encoding='utf-8') as f:
+            current = f.read()
+
+    content = plan['content']
+    if current is None:
+        action = 'create'
+    elif current == content:
+        action = 'unchanged'
+    else:
+        action = 'modify'
+
+    result = {
+        'path': plan['path'],
+        'action': action,
+        'bytes': len(content.encode('utf-8')),
+        'hash': contentHash(content),
+        'diff': None
+    }
+
+    if diff and action != 'unchanged':
+        result['diff'] = ''.join(difflib.unified_diff(
+            (current or '').splitlines(keepends=True),
+            content.splitlines(keepends=True),
+            fromfile='/dev/null' if current is None else f"{plan['path']} (current)",
+            tofile=f"{plan['path']} (rendered)"
+        ))
+
+    return result
+
+
+def _input_ids(inputs: list) -> set:
+    """Identidad de cada entrada (plantilla y parámetros, sin el hash de la plantilla)"""
+    return {json.dumps([item['template'], item['params']], sort_keys=True) for item in inputs}
+
+
+def _diff(plan: dict) -> str:
+    """Diff unificado entre el archivo en disco y la versión regenerada"""
+    with open(plan['path'], 'r', encoding='utf-8') as f:
+        current = f.read()
+
+    return ''.join(difflib.unified_diff(
+        current.splitlines(keepends=True),
+        plan['content'].splitlines(keepends=True),
+        fromfile=f"{plan['path']} (current)",
+        tofile=f"{plan['path']} (regenerated)"
+    ))
+
+
+def _render_job(job: dict) -> str:
+    """Renderiza un trabajo del lote (se ejecuta en los procesos del pool)"""
+    return renderTemplate(templateName=job['templateName'], fileName=job['fileName'], render_params=job['render_params'])
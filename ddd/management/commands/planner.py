@@ -0,0 +1,118 @@
+"""
+Planes de render declarativos.
+
+Cada comando create-* describe lo que genera con un plan: una lista de pasos
+(plantilla -> archivo de salida, con sus parámetros y su alcance). El planificador
+elimina los pasos repetidos de las salidas compartidas por app, ordena las escrituras
+y las ejecuta con readWriteTemplate, de modo que un lote de N entidades renderiza
+los archivos compartidos (ej: utils/filter_dict.py) una sola vez por app.
+"""
+import json
+import os
+from .utils import readWriteTemplate
+
+# Alcance de una salida: una por entidad o una compartida por toda la app
+SCOPE_ENTITY = 'entity'
+SCOPE_APP = 'app'
+
+
+def renderStep(templateName: str, fileName: str, output: str, params: dict = None, scope=SCOPE_ENTITY,
+               required=True, addition=False, only_if_new=False) -> dict:
+    """
+    Paso de un plan de render.
+
+    params:
+    - templateName, fileName: Plantilla a renderizar
+    - output: Archivo de salida
+    - params: Parámetros del render
+    - scope: SCOPE_ENTITY o SCOPE_APP (salida compartida, se genera una sola vez por lote)
+    - required: Si es False, un error (ej: el archivo ya existe) no detiene el comando
+    - addition: Añade el contenido al final del archivo
+    - only_if_new: Solo se renderiza si el archivo no existe (ej: los imports de un archivo al que se añaden clases)
+    """
+    return {
+        'template': templateName,
+        'file': fileName,
+        'output': os.path.normpath(output),
+        'params': params or {},
+        'scope': scope,
+        'required': required,
+        'addition': addition,
+        'only_if_new': only_if_new
+    }
+
+
+def buildPlan(steps: list) -> list:
+    """
+    Elimina los pasos repetidos de las salidas compartidas y ordena las escrituras.
+
+    Cada salida compartida (SCOPE_APP) se genera con su primer paso. Los pasos de una misma
+    salida quedan juntos, en el orden en que aparece la salida por primera vez, y las adiciones
+    siempre después del paso que crea el archivo.
+    """
+    planned = []
+    seen = set()
+    for step in steps:
+        key = (step['output'], step['template'], step['file'])
+        if step['scope'] == SCOPE_APP:
+            if key in seen:
+                continue
+            seen.add(key)
+        planned.append(step)
+
+    first_output = {}
+    for position, step in enumerate(planned):
+        first_output.setdefault(step['output'], position)
+
+    return sorted(planned, key=lambda step: (first_output[step['output']], step['addition']))
+
+
+def executePlan(steps: list, simulate=False, regenerate=False):
+    """
+    Ejecuta los pasos de un plan (ya construido con buildPlan).
+
+    Raises:
+    - Exception: Si falla un paso requerido
+    """
+    for step in steps:
+        if step['only_if_new'] and os.path.exists(step['output']) and not (simulate or regenerate):
+            continue
+
+        readWriteTemplate(
+            templateName=step['template'],
+            fileName=step['file'],
+            render_params=step['params'],
+            repository_path=step['output'],
+            addition=step['addition'],
+            failIfError=step['required'],
+            simulate=simulate
+        )
+
+
+def printPlan(steps: list, requested: int = None):
+    """
+    Muestra el plan sin renderizar: cada salida con las plantillas (y parámetros) de las que depende.
+
+    params:
+    - requested: Número de pasos antes de buildPlan, para mostrar cuántos se deduplicaron
+    """
+    outputs = {}
+    for step in steps:
+        outputs.setdefault(step['output'], []).append(step)
+
+    summary = f"Render plan: {len(outputs)} outputs, {len(steps)} renders"
+    if requested is not None and requested > len(steps):
+        summary += f" ({requested - len(steps)} shared renders deduplicated)"
+    print(summary)
+
+    for output, output_steps in outputs.items():
+        scope = ' [shared per app]' if output_steps[0]['scope'] == SCOPE_APP else ''
+        print(f"{output}{scope}")
+        for step in output_steps:
+            flags = [name for name, enabled in (
+                ('append', step['addition']),
+                ('only if new', step['only_if_new']),
+                ('optional', not step['required'])
+            ) if enabled]
+            flags = f" ({', '.join(flags)})" if flags else ''
+            print(f"  <- {step['template']}/{step['file']} {json.dumps(step['params'], sort_keys=True)}{flags}")
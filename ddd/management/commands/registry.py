@@ -0,0 +1,164 @@
+"""
+Registro de subcomandos del CLI.
+
+Declara el nombre, la ayuda y los argumentos de cada subcomando sin importar su módulo
+de implementación (que arrastra jinja2 y colorama). El CLI construye argparse a partir
+de este registro y solo importa el módulo del subcomando que se va a ejecutar.
+
+Este módulo no debe importar nada fuera de la librería estándar.
+"""
+
+APP_PATH_HELP = 'The relative path of the app within the project (for example, "apps/app1")'
+SIMULATE_HELP = "Simulate the creation of this entity without writing files"
+REGENERATE_HELP = "Regenerate existing files whose templates or parameters changed, skipping unchanged and user-modified files (see .ddd/manifest.json)"
+
+
+def _app_path():
+    return (('app_path',), {'type': str, 'help': APP_PATH_HELP})
+
+def _name(dest, help):
+    return ((dest,), {'type': str, 'help': help})
+
+def _pydantic(target):
+    return (('--pydantic',), {'action': 'store_true', 'help': f"Create a Pydantic structure for this {target}"})
+
+def _simulate(help=SIMULATE_HELP):
+    return (('--simulate',), {'action': 'store_true', 'help': help})
+
+def _diff():
+    return (('--diff',), {'action': 'store_true', 'help': "Simulate and print a unified diff of every rendered file against the file on disk (implies --simulate)"})
+
+def _format():
+    return (('--format',), {'choices': ['text', 'json'], 'default': 'text', 'help': "Simulation output format; json prints a summary with path, action, bytes and hash of every file (implies --simulate)"})
+
+def _plan():
+    return (('--plan',), {'action': 'store_true', 'help': "Print the render plan (templates -> outputs) without rendering or writing files"})
+
+def _regenerate():
+    return (('--regenerate',), {'action': 'store_true', 'help': REGENERATE_HELP})
+
+
+# Subcomandos en el orden en que se muestran en la ayuda
+COMMANDS = [
+    {
+        'name': 'create-entity',
+        'help': 'Create a new entity (DataClass or Pydantic)',
+        'module': 'create_entity',
+        'class': 'CreateEntityCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _pydantic('entity'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-service',
+        'help': 'Create a new service',
+        'module': 'create_service',
+        'class': 'CreateServiceCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-repository',
+        'help': 'Create a new repository  (DataClass or Pydantic)',
+        'module': 'create_repository',
+        'class': 'CreateRepositoryCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _pydantic('repository'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-dto',
+        'help': 'Create a new DTO (DataClass or Pydantic)',
+        'module': 'create_dto',
+        'class': 'CreateDTOCommand',
+        'arguments': [_app_path(), _name('dto_name', 'The name of the DTO'), _pydantic('dto'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-serializer',
+        'help': 'Create a new Serializer',
+        'module': 'create_serializer',
+        'class': 'CreateSerializerCommand',
+        'arguments': [_app_path(), _name('serializer_name', 'The name of the Serializer'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-view-api-apiview',
+        'help': 'Create a view for api based on ApiView',
+        'module': 'create_view_api_apiview',
+        'class': 'CreateViewApiApiViewCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-view-api-viewset',
+        'help': 'Create a view for api based on ViewSet',
+        'module': 'create_view_api_viewset',
+        'class': 'CreateViewApiViewSetCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'create-view',
+        'help': 'Create a view for web',
+        'module': 'create_view',
+        'class': 'CreateViewCommand',
+        'arguments': [_app_path(), _name('entity_name', 'The name of the entity'), _simulate(), _diff(), _format(), _regenerate(), _plan()],
+    },
+    {
+        'name': 'scaffold',
+        'help': 'Generate a whole bounded context (apps, entities and layers) from a YAML or JSON manifest',
+        'module': 'scaffold',
+        'class': 'ScaffoldCommand',
+        'arguments': [
+            _name('manifest', 'Path to the manifest file (.yaml, .yml or .json)'),
+            _simulate("Simulate the creation of this context without writing files"),
+            _diff(),
+            _format(),
+            _regenerate(),
+            _plan(),
+            (('--jobs',), {'type': int, 'default': None, 'help': "Maximum number of render processes / writer threads (default: number of CPUs)"}),
+        ],
+    },
+    {
+        'name': 'upgrade',
+        'help': 'Merge the current templates into previously generated files (three-way merge, keeping user edits)',
+        'module': 'upgrade',
+        'class': 'UpgradeCommand',
+        'arguments': [
+            (('paths',), {'type': str, 'nargs': '*', 'help': "Only upgrade generated files under these paths (default: every file in .ddd/manifest.json)"}),
+            _simulate("Show the upgraded files as diffs without writing them"),
+        ],
+    },
+    {
+        'name': 'watch',
+        'help': 'Watch the templates (and a scaffold manifest) and re-render the generated files that depend on them',
+        'module': 'watch',
+        'class': 'WatchCommand',
+        'arguments': [
+            (('paths',), {'type': str, 'nargs': '*', 'help': "Only re-render generated files under these paths (default: every file in .ddd/manifest.json)"}),
+            (('--manifest',), {'type': str, 'default': None, 'help': "Scaffold manifest to watch; on change it is scaffolded again"}),
+            (('--write',), {'action': 'store_true', 'help': "Write the re-rendered files instead of printing diffs (files modified by hand are never overwritten)"}),
+            (('--interval',), {'type': float, 'default': 0.5, 'help': "Polling interval in seconds when inotify_simple is not installed"}),
+        ],
+    },
+    {
+        'name': 'bench',
+        'help': 'Benchmark the generator: template renders, create-* commands and utils',
+        'module': 'bench',
+        'class': 'BenchCommand',
+        'arguments': [
+            (('--output',), {'type': str, 'default': None, 'help': "Write the results to this JSON file"}),
+            (('--repeat',), {'type': int, 'default': 20, 'help': "Number of timed renders per template (commands run repeat/4 times, utils repeat*50 times)"}),
+            (('--only',), {'nargs': '+', 'choices': ['templates', 'commands', 'utils'], 'default': None, 'help': "Only run these sections"}),
+        ],
+    },
+]
+
+
+def add_subparsers(subparsers):
+    """Registra todos los subcomandos en argparse sin importar sus módulos"""
+    for command in COMMANDS:
+        parser = subparsers.add_parser(command['name'], help=command['help'])
+        for flags, options in command['arguments']:
+            parser.add_argument(*flags, **options)
+        parser.set_defaults(command=command)
+
+
+def load_command(command: dict):
+    """Importa el módulo de un subcomando y devuelve una instancia de su clase"""
+    from importlib import import_module
+
+    module = import_module(f"{__package__}.{command['module']}")
+    return getattr(module, command['class'])()
@@ -0,0 +1,226 @@
+import json
+import time
+from .utils import *
+from .planner import buildPlan, executePlan, printPlan
+from colorama import Fore, Style
+from .create_entity import CreateEntityCommand
+from .create_repository import CreateRepositoryCommand
+from .create_service import CreateServiceCommand
+from .create_dto import CreateDTOCommand
+from .create_serializer import CreateSerializerCommand
+from .create_view_api_apiview import CreateViewApiApiViewCommand
+from .create_view_api_viewset import CreateViewApiViewSetCommand
+from .create_view import CreateViewCommand
+
+# Capas que se pueden generar, en el orden en que se generan
+LAYERS = ('entity', 'repository', 'service', 'dto', 'serializer', 'apiview', 'viewset', 'view')
+
+# Capas por defecto (apiview, viewset y view escriben <entidad>_views.py y <entidad>_urls.py,
+# por eso solo una de ellas puede usar la misma ruta)
+DEFAULT_LAYERS = ('entity', 'repository', 'service', 'dto', 'viewset')
+
+# Capas que ya generan el serializer de la entidad
+LAYERS_WITH_SERIALIZER = ('apiview', 'viewset')
+
+
+# Comando que genera cada capa
+LAYER_COMMANDS = {
+    'entity': CreateEntityCommand,
+    'repository': CreateRepositoryCommand,
+    'service': CreateServiceCommand,
+    'dto': CreateDTOCommand,
+    'serializer': CreateSerializerCommand,
+    'apiview': CreateViewApiApiViewCommand,
+    'viewset': CreateViewApiViewSetCommand,
+    'view': CreateViewCommand,
+}
+
+
+class ScaffoldCommand:
+    def execute(self, args):
+        dry_run = dryRunOptions(args)
+        simulate = args.simulate or dry_run is not None
+        self.scaffold(args.manifest, simulate, jobs=args.jobs, regenerate=args.regenerate, plan=args.plan, dry_run=dry_run)
+
+    def scaffold(self, manifest_path, simulate=False, jobs=None, regenerate=False, plan=False, dry_run=None, **kwargs):
+        """
+        Genera todas las capas de todas las entidades declaradas en el manifiesto en un solo proceso.
+
+        Se reúnen los planes de render de todas las capas y el planificador deduplica las salidas
+        compartidas por app (ej: los utils del repositorio se renderizan una vez por app).
+        Las plantillas se compilan una sola vez (entorno Jinja2 compartido); al final los archivos
+        se renderizan en paralelo y se escriben todos juntos (ver pipeline.runPipeline).
+        Con regenerate=True se puede volver a ejecutar sobre un contexto ya generado.
+        Con plan=True solo se muestra el plan, sin renderizar ni crear directorios.
+        Con dry_run (ver utils.dryRunOptions) la simulación muestra diffs o un resumen JSON.
+        """
+        try:
+            manifest = load_manifest(manifest_path)
+            apps = normalize_manifest(manifest)
+        except (OSError, ValueError) as e:
+            print(Fore.RED + f"Invalid manifest '{manifest_path}': {e}" + Style.RESET_ALL)
+            return
+
+        start = time.perf_counter()
+        errors = 0
+
+        steps = []
+        for app in apps:
+            for entity in app['entities']:
+                for layer in entity['layers']:
+                    try:
+                        steps.extend(self.plan_layer(layer, app, entity['name'], simulate, regenerate, prepare=not plan))
+                    except Exception as e:
+                        errors += 1
+                        print(Fore.RED + f"Failed to generate {layer} of '{entity['name']}' in '{app['path']}': {e}" + Style.RESET_ALL)
+
+        planned = buildPlan(steps)
+        if plan:
+            printPlan(planned, requested=len(steps))
+            return
+
+        if not simulate or dry_run:
+            beginWriteBatch(regenerate=regenerate, dry_run=dry_run)
+
+        try:
+            for step in planned:
+                try:
+                    executePlan([step], simulate, regenerate)
+                except Exception as e:
+                    errors += 1
+                    print(Fore.RED + f"Failed to generate '{step['output']}': {e}" + Style.RESET_ALL)
+        finally:
+            written = flushWriteBatch(workers=jobs) if not simulate or dry_run else 0
+
+        # El resumen JSON debe ser la única salida
+        if dry_run and dry_run['format'] == 'json':
+            return
+
+        elapsed = time.perf_counter() - start
+        color = Fore.RED if errors else Fore.GREEN
+        print(color + f"Scaffold finished: {written} files written, {errors} errors in {elapsed:.2f}s" + Style.RESET_ALL)
+
+    def plan_layer(self, layer, app, entity_name, simulate=False, regenerate=False, prepare=True):
+        """
+        Plan de render de una capa de una entidad, obtenido del comando create-* correspondiente.
+
+        Con prepare=True antes se crean los directorios y se comprueba que la capa no exista
+        (si ya existe, el comando lo avisa y la capa se omite).
+        """
+        command_class = LAYER_COMMANDS[layer]
+        command = command_class()
+
+        if layer in LAYERS_WITH_SERIALIZER:
+            app_path = app['api_path']
+        elif layer == 'view':
+            app_path = app['views_path']
+        else:
+            app_path = app['path']
+
+        options = {}
+        if prepare:
+            if not command.prepare(app_path, entity_name, simulate, regenerate):
+                return []
+            if layer in LAYERS_WITH_SERIALIZER:
+                serializer_command = CreateSerializerCommand()
+                options['serializer'] = serializer_command.prepare(app_path, entity_name, simulate, regenerate)
+
+        return command.plan(app_path, entity_name, pydantic=app['pydantic'], **options)
+
+
+def load_manifest(manifest_path: str) -> dict:
+    """
+    Carga un manifiesto YAML o JSON.
+
+    YAML requiere PyYAML (pip install ddd-cli[yaml]); JSON no tiene dependencias.
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if manifest_path.endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is required to read YAML manifests (pip install pyyaml), or use a JSON manifest")
+        return yaml.safe_load(content) or {}
+
+    return json.loads(content)
+
+
+def normalize_manifest(manifest: dict) -> list:
+    """
+    Valida el manifiesto y completa los valores por defecto.
+
+    Formato:
+        pydantic: false                  # opcional, por defecto para todas las apps
+        layers: [entity, repository]     # opcional, por defecto para todas las apps
+        apps:
+          - path: apps/companies
+            pydantic: false              # opcional
+            api_path: apps/companies     # opcional, ruta para apiview/viewset (por defecto path)
+            views_path: apps/companies   # opcional, ruta para view (por defecto path)
+            layers: [entity, repository, service, dto, viewset, view]
+            entities:
+              - company                  # usa las capas de la app
+              - name: branch
+                layers: [entity, repository, service]
+
+    returns:
+        Lista de apps con sus entidades y las capas (ordenadas) a generar por entidad.
+    raises:
+        ValueError: Si el manifiesto no es válido (ej: una entidad declarada dos veces en la misma app).
+    """
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('apps'), list):
+        raise ValueError("the manifest must define a list of 'apps'")
+
+    default_pydantic = bool(manifest.get('pydantic', False))
+    default_layers = manifest.get('layers', DEFAULT_LAYERS)
+
+    apps = []
+    seen = set()  # (app, entidad): los archivos de una entidad se nombran en minúsculas
+    for app in manifest['apps']:
+        if not isinstance(app, dict) or not app.get('path'):
+            raise ValueError("every app must define a 'path'")
+
+        app_path = app['path'].rstrip('/')
+        app_layers = app.get('layers', default_layers)
+
+        entities = []
+        for entity in app.get('entities', []):
+            if isinstance(entity, str):
+                entity = {'name': entity}
+            if not isinstance(entity, dict) or not entity.get('name'):
+                raise ValueError(f"every entity of app '{app_path}' must define a 'name'")
+
+            key = (app_path, entity['name'].lower())
+            if key in seen:
+                raise ValueError(f"entity '{entity['name']}' is declared more than once in app '{app_path}'")
+            seen.add(key)
+
+            entities.append({
+                'name': entity['name'],
+                'layers': _order_layers(entity.get('layers', app_layers), f"{app_path}:{entity['name']}")
+            })
+
+        apps.append({
+            'path': app_path,
+            'pydantic': bool(app.get('pydantic', default_pydantic)),
+            'api_path': app.get('api_path', app_path).rstrip('/'),
+            'views_path': app.get('views_path', app_path).rstrip('/'),
+            'entities': entities
+        })
+
+    return apps
+
+
+def _order_layers(layers, owner: str) -> list:
+    """Valida las capas y las ordena según LAYERS (el serializer se omite si ya lo genera una vista api)"""
+    unknown = [layer for layer in layers if layer not in LAYERS]
+    if unknown:
+        raise ValueError(f"unknown layers {unknown} in '{owner}' (valid: {', '.join(LAYERS)})")
+
+    ordered = [layer for layer in LAYERS if layer in layers]
+    if any(layer in ordered for layer in LAYERS_WITH_SERIALIZER) and 'serializer' in ordered:
+        ordered.remove('serializer')
+
+    return ordered
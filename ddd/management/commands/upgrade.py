@@ -0,0 +1,99 @@
+import difflib
+from .utils import *
+from .generation_index import (
+    loadIndex, saveIndex, selectKeys, loadBase, saveBase, contentHash, fileHash, refreshInputs, renderInputs
+)
+from .merge import merge3
+from colorama import Fore, Style
+
+class UpgradeCommand:
+    def execute(self, args):
+        self.upgrade(args.paths, args.simulate)
+
+    def upgrade(self, paths=None, simulate=False, **kwargs):
+        """
+        Lleva la versión actual de las plantillas a los archivos ya generados.
+
+        Cada archivo del índice (.ddd/manifest.json) se vuelve a renderizar con sus mismas entradas
+        y se combina a tres bandas con la versión generada original (.ddd/base) y el archivo actual:
+        las ediciones del usuario se conservan y los cambios que chocan se marcan como conflicto.
+        """
+        index = loadIndex()
+        keys = selectKeys(index, paths)
+
+        upgraded = conflicted = 0
+        for key in keys:
+            entry = index['files'][key]
+            inputs = refreshInputs(entry['inputs'])
+            if inputs == entry['inputs']:
+                continue
+
+            try:
+                result = self.upgrade_file(key, entry, inputs, simulate)
+            except Exception as e:
+                print(Fore.RED + f"Failed to upgrade '{key}': {e}" + Style.RESET_ALL)
+                continue
+
+            if result is None:
+                continue
+
+            new_base, conflicts = result
+            upgraded += 1
+            if conflicts:
+                conflicted += 1
+
+            if not simulate:
+                # La nueva versión generada pasa a ser la base del próximo upgrade
+                index['files'][key] = {'inputs': inputs, 'output_hash': contentHash(new_base)}
+                saveBase(key, new_base)
+
+        if not simulate and upgraded:
+            saveIndex(index)
+
+        color = Fore.RED if conflicted else Fore.GREEN
+        print(color + f"Upgrade finished: {upgraded} files upgraded, {conflicted} with conflicts" + Style.RESET_ALL)
+
+    def upgrade_file(self, key, entry, inputs, simulate=False):
+        """
+        Actualiza un archivo generado.
+
+        returns:
+            None si no se pudo actualizar, o una tupla (nueva versión generada, número de conflictos).
+        """
+        current_hash = fileHash(key)
+        if current_hash is None:
+            print(Fore.YELLOW + f"---Missing: {key}" + Style.RESET_ALL)
+            return None
+
+        with open(key, 'r', encoding='utf-8') as f:
+            current = f.read()
+
+        base = loadBase(key)
+        if base is None:
+            if current_hash != entry['output_hash']:
+                print(Fore.YELLOW + f"---Skipped (modified by user and no base version to merge from): {key}" + Style.RESET_ALL)
+                return None
+            # Archivo intacto generado antes de guardar bases: él mismo es la base
+            base = current
+
+        new_base = renderInputs(inputs)
+        merged, conflicts = merge3(base, current, new_base)
+
+        if simulate:
+            print(''.join(difflib.unified_diff(
+                current.splitlines(keepends=True),
+                merged.splitlines(keepends=True),
+                fromfile=f"{key} (current)",
+                tofile=f"{key} (upgraded)"
+            )))
+        elif merged != current:
+            writeFileAtomic(key, merged)
+
+        if conflicts:
+            print(Fore.RED + f"---Conflicts ({conflicts}): {key}" + Style.RESET_ALL)
+        elif current_hash == entry['output_hash']:
+            print(f"---Upgraded: {key}")
+        else:
+            print(f"---Merged: {key}")
+
+        return new_base, conflicts
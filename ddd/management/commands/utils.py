@@ -1,6 +1,29 @@
 import os
+import itertools
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from jinja2 import Environment, Template, FileSystemLoader
+from ..version import version
+
+# Directorio raíz de las plantillas del paquete
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Variable de entorno con un directorio de plantillas propias que sustituyen a las del paquete
+# (misma estructura: <directorio>/services/class.py sustituye a services/class.py)
+TEMPLATES_OVERRIDE_ENV = "DDD_CLI_TEMPLATES"
+
+# Variable de entorno para cambiar el directorio de la caché de bytecode
+CACHE_DIR_ENV = "DDD_CLI_CACHE_DIR"
+
+# Entorno Jinja2 compartido (se crea bajo demanda en getTemplateEnvironment)
+_template_environment = None
+
+# Lote de escrituras diferidas (ver beginWriteBatch), None si no hay lote activo
+_write_batch = None
+
+# Máscara de permisos del proceso (se lee una sola vez, os.umask no es seguro entre hilos)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 def create__init__file(path):
     """Crea un archivo __init__.py en el directorio especificado"""
@@ -28,38 +51,90 @@ def decapitalize_first(texto: str) -> str:
     """Convierte la primera letra de un texto a minúscula"""
     return texto[:1].lower() + texto[1:]
 
+def getTemplateDirs() -> list:
+    """Directorios de plantillas en orden de búsqueda (las plantillas propias primero)"""
+    override_dir = os.environ.get(TEMPLATES_OVERRIDE_ENV)
+    return [Path(override_dir), TEMPLATES_DIR] if override_dir else [TEMPLATES_DIR]
+
+
+def getTemplatePath(templateName: str, fileName: str) -> Path:
+    """Ruta de la plantilla que se va a usar (la del paquete si no hay una propia)"""
+    for templates_dir in getTemplateDirs():
+        path = templates_dir / templateName / fileName
+        if path.is_file():
+            return path
+    return TEMPLATES_DIR / templateName / fileName
+
+
+def getTemplateEnvironment():
+    """
+    Devuelve el entorno Jinja2 compartido por todo el proceso.
+
+    Se construye una sola vez con los delimitadores personalizados y los filtros del paquete.
+    Las plantillas se cargan con un FileSystemLoader (en memoria se recompilan solo si cambia
+    su mtime) y el bytecode compilado se guarda en disco, de modo que una ejecución en frío
+    no vuelve a compilar plantillas que no han cambiado.
+    """
+    global _template_environment
+
+    if _template_environment is None:
+        # jinja2 se importa aquí para no penalizar el arranque del CLI (--help, autocompletado)
+        from jinja2 import Environment, FileSystemLoader
+
+        # Configurar un entorno Jinja2 con delimitadores personalizados
+        env = Environment(
+            loader=FileSystemLoader([str(templates_dir) for templates_dir in getTemplateDirs()]),
+            bytecode_cache=_createBytecodeCache(),
+            block_start_string='[%',   # Delimitador de inicio de bloque
+            block_end_string='%]',     # Delimitador de fin de bloque
+            variable_start_string='[[', # Delimitador de inicio de variable
+            variable_end_string=']]',   # Delimitador de fin de variable
+            cache_size=-1               # No descartar nunca plantillas ya compiladas
+        )
+
+        # Registrar filtro: capitalize_first
+        env.filters["capitalize_first"] = capitalize_first
+
+        # Registrar filtro: decapitalize_first
+        env.filters["decapitalize_first"] = decapitalize_first
+
+        _template_environment = env
+
+    return _template_environment
+
+
+def _createBytecodeCache():
+    """
+    Crea la caché de bytecode en disco (por defecto en ~/.cache/ddd_cli/<version>).
+
+    Jinja2 invalida cada entrada por el checksum del fuente de la plantilla, y el directorio
+    incluye la versión del paquete, así que una actualización nunca reutiliza bytecode antiguo.
+    Si el directorio no se puede crear (ej: HOME de solo lectura) se trabaja sin caché en disco.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = Path(os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "ddd_cli") / version
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    return FileSystemBytecodeCache(str(cache_dir), pattern='%s.cache')
+
+
 def renderTemplate(templateName: str, fileName: str, render_params: dict) -> str:
     """
     Renderiza una plantilla con los delimitadores específicos y los parámetros proporcionados.
     """
-    # Construir la ruta absoluta de la plantilla
-    templates_dir = Path(__file__).resolve().parent.parent / "templates" / templateName
-    template_path = templates_dir / fileName
-
-    # Verificar si el template existe
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template file {template_path} not found")
-
-    # Cargar el contenido del template
-    with open(template_path, 'r') as template_file:
-        template_content = template_file.read()
-
-    # Configurar un entorno Jinja2 con delimitadores personalizados
-    env = Environment(
-        block_start_string='[%',   # Delimitador de inicio de bloque
-        block_end_string='%]',     # Delimitador de fin de bloque
-        variable_start_string='[[', # Delimitador de inicio de variable
-        variable_end_string=']]'    # Delimitador de fin de variable
-    )
-    
-    # Registrar filtro: capitalize_first
-    env.filters["capitalize_first"] = capitalize_first
-     
-    # Registrar filtro: decapitalize_first
-    env.filters["decapitalize_first"] = decapitalize_first    
-
-    # Renderizar la plantilla usando el entorno personalizado
-    template = env.from_string(template_content)
+    from jinja2 import TemplateNotFound
+
+    try:
+        template = getTemplateEnvironment().get_template(f"{templateName}/{fileName}")
+    except TemplateNotFound as e:
+        raise FileNotFoundError(f"Template file {TEMPLATES_DIR / templateName / fileName} not found") from e
+
+    # Renderizar la plantilla usando el entorno compartido
     return template.render(**render_params)
 
 
@@ -81,6 +156,15 @@ def readWriteTemplate(templateName: str, fileName:str, render_params: dict, repo
     """
     msgPath = f"{templateName}/{fileName} -> {repository_path}"
 
+    if simulate and _write_batch is not None and _write_batch['dry_run']:
+        # Simulación con --diff / --format json: se encola en silencio y se resume en flushWriteBatch
+        try:
+            queueBatchWrite(templateName, fileName, render_params, repository_path, addition)
+        except Exception as e:
+            if failIfError:
+                raise Exception(e.args)
+        return
+
     if simulate: 
         print('')
         if not addition:
@@ -90,11 +174,17 @@ def readWriteTemplate(templateName: str, fileName:str, render_params: dict, repo
         print(f"---Writing file: {msgPath}...")
 
     try:
+        mode = 'a' if addition else 'w'
+
+        if not simulate and _write_batch is not None:
+            # Encolar el render; se renderiza y escribe al cerrar el lote (flushWriteBatch)
+            queueBatchWrite(templateName, fileName, render_params, repository_path, addition)
+            print(f"---Queued.")
+            return
+
         # Renderizar la plantilla
         rendered_content = renderTemplate(templateName = templateName, fileName=fileName, render_params=render_params)
 
-        mode = 'a' if addition else 'w'
-
         if not simulate:
             # Si el archivo existe y no es una adición, fallar
             if os.path.exists(repository_path) and not addition:
@@ -114,6 +204,192 @@ def readWriteTemplate(templateName: str, fileName:str, render_params: dict, repo
             raise Exception(e.args)
 
 
+def beginWriteBatch(regenerate=False, dry_run=None):
+    """
+    Inicia un lote de escrituras diferidas.
+
+    Mientras el lote esté activo, readWriteTemplate solo encola el trabajo; 
+    las plantillas se renderizan y los archivos se escriben todos juntos en flushWriteBatch.
+
+    params:
+    - regenerate: Si es True, los archivos existentes no son un error: se regeneran solo
+      si cambiaron sus entradas (ver pipeline.runPipeline y el índice .ddd/manifest.json)
+    - dry_run: Opciones de simulación (ver dryRunOptions): no se escribe nada y cada archivo
+      renderizado se compara con el que hay en disco
+    """
+    global _write_batch
+    _write_batch = {
+        'files': {},                    # ruta -> {'append': bool, 'jobs': [trabajos de render]}
+        'keys': itertools.count(),      # claves de orden de los trabajos
+        'regenerate': regenerate,
+        'dry_run': dry_run
+    }
+
+
+def queueBatchWrite(templateName: str, fileName: str, render_params: dict, repository_path: str, addition=False):
+    """
+    Encola el render de una plantilla hacia un archivo en el lote activo.
+
+    Un archivo ya encolado se trata igual que uno existente en disco:
+    solo se le puede añadir contenido (addition=True).
+    En modo regenerate (y en simulación) los archivos existentes en disco no son un error.
+    Cada trabajo recibe una clave de orden (orden de llegada) para que la salida sea estable.
+
+    Raises:
+    - FileNotFoundError: Si la plantilla no existe
+    - Exception: Si el archivo ya existe (en disco o en el lote) y no es una adición
+    """
+    path = os.path.normpath(repository_path)
+    files = _write_batch['files']
+
+    if not getTemplatePath(templateName, fileName).is_file():
+        raise FileNotFoundError(f"Template file {TEMPLATES_DIR / templateName / fileName} not found")
+
+    if not addition and (path in files or (os.path.exists(path) and not (_write_batch['regenerate'] or _write_batch['dry_run']))):
+        raise Exception(f"File {repository_path} already exists")
+
+    if path not in files:
+        files[path] = {'append': addition, 'jobs': []}
+
+    files[path]['jobs'].append({
+        'key': next(_write_batch['keys']),
+        'templateName': templateName,
+        'fileName': fileName,
+        'render_params': render_params
+    })
+
+
+def flushWriteBatch(workers: int = None) -> int:
+    """
+    Renderiza y escribe todos los archivos encolados y cierra el lote.
+
+    El render se reparte en un pool de procesos y la escritura (atómica) en un pool de hilos;
+    ver pipeline.runPipeline. En simulación solo se muestra el resumen (ver printDryRun).
+
+    params:
+    - workers: Número máximo de procesos/hilos (por defecto el número de CPUs)
+    returns:
+        Número de archivos escritos.
+    """
+    global _write_batch
+    batch, _write_batch = _write_batch, None
+
+    if not batch:
+        return 0
+
+    from .pipeline import runPipeline
+    results = runPipeline(batch, workers=workers)
+
+    if batch['dry_run']:
+        printDryRun(results, batch['dry_run'])
+        return 0
+
+    for result in results:
+        if result['action'] == 'write':
+            print(f"---Written: {result['path']}")
+        elif result['action'] == 'unchanged':
+            print(f"---Unchanged: {result['path']}")
+        elif result['action'] == 'kept':
+            print(f"---Kept (modified by user): {result['path']}")
+        elif result['action'] == 'skipped':
+            print(f"---Skipped (modified by user, new version below): {result['path']}")
+            print(result['diff'])
+        elif result['action'] == 'partial':
+            print(f"---Skipped (also holds content generated by other commands, regenerate them together): {result['path']}")
+
+    return sum(1 for result in results if result['action'] == 'write')
+
+
+def dryRunOptions(args):
+    """
+    Opciones de simulación de los argumentos --diff y --format de un comando.
+
+    returns:
+        None para la simulación clásica (se imprime el contenido completo de cada archivo),
+        o {'diff': bool, 'format': 'text' | 'json'}.
+    """
+    if not args.diff and args.format != 'json':
+        return None
+    return {'diff': args.diff, 'format': args.format}
+
+
+def printDryRun(results: list, dry_run: dict):
+    """
+    Muestra el resultado de una simulación: el diff de cada archivo contra el disco (--diff)
+    y/o un resumen JSON con la ruta, la acción (create, modify, unchanged), los bytes y el hash.
+    """
+    if dry_run['format'] == 'json':
+        import json
+        files = [
+            {key: result[key] for key in ('path', 'action', 'bytes', 'hash', 'diff') if key != 'diff' or dry_run['diff']}
+            for result in results
+        ]
+        summary = {action: sum(1 for result in results if result['action'] == action) for action in ('create', 'modify', 'unchanged')}
+        print(json.dumps({'files': files, 'summary': summary}))
+        return
+
+    for result in results:
+        if result['action'] == 'unchanged':
+            print(f"---Unchanged: {result['path']}")
+        else:
+            print(result['diff'], end='')
+
+    summary = ', '.join(f"{sum(1 for result in results if result['action'] == action)} {label}" for action, label in (
+        ('create', 'to create'), ('modify', 'to modify'), ('unchanged', 'unchanged')
+    ))
+    print(f"---Simulation: {summary}")
+
+
+@contextmanager
+def writeBatch(simulate=False, regenerate=False, workers: int = None, dry_run=None):
+    """
+    Ejecuta un bloque dentro de un lote de escrituras diferidas
+    (no hace nada si simulate es True, salvo que haya opciones de dry_run).
+
+    ej:
+        with writeBatch(simulate=args.simulate, regenerate=args.regenerate):
+            self.create_entity(...)
+    """
+    if simulate and not dry_run:
+        yield
+        return
+
+    beginWriteBatch(regenerate=regenerate, dry_run=dry_run)
+    try:
+        yield
+    finally:
+        flushWriteBatch(workers=workers)
+
+
+def writeFileAtomic(path: str, content: str, append=False):
+    """
+    Escribe un archivo de forma atómica: archivo temporal en el mismo directorio + os.replace.
+
+    Si append es True, el contenido se añade al final del contenido actual del archivo.
+    Se conservan los permisos del archivo existente (o los por defecto según la umask).
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    if os.path.exists(path):
+        mode = os.stat(path).st_mode & 0o777
+        if append:
+            with open(path, 'r') as f:
+                content = f.read() + content
+    else:
+        mode = 0o666 & ~_UMASK
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.ddd-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 def decodeAppPath(app_path: str) -> tuple:
     """
     Convierte una ruta de aplicación (ej: apps/manager/app1) a:
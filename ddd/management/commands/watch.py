@@ -0,0 +1,226 @@
+import difflib
+import time
+from .utils import *
+from .generation_index import (
+    loadIndex, saveIndex, selectKeys, saveBase, contentHash, refreshInputs, renderInputs, forgetTemplateHashes
+)
+from colorama import Fore, Style
+
+# Intervalo de sondeo por defecto (segundos) cuando inotify no está disponible
+POLL_INTERVAL = 0.5
+
+# Espera para agrupar los eventos de un mismo guardado (milisegundos)
+DEBOUNCE_MS = 50
+
+class WatchCommand:
+    def execute(self, args):
+        self.watch(args.paths, manifest_path=args.manifest, write=args.write, interval=args.interval)
+
+    def watch(self, paths=None, manifest_path=None, write=False, interval=POLL_INTERVAL, **kwargs):
+        """
+        Vigila las plantillas (y opcionalmente un manifiesto de scaffold) y vuelve a renderizar
+        solo los archivos generados que dependen de lo que cambió (según .ddd/manifest.json).
+
+        El entorno Jinja2 se mantiene en memoria: solo se recompilan las plantillas modificadas.
+        Por defecto muestra el diff contra el archivo en disco; con write=True escribe los archivos
+        que el usuario no ha modificado.
+        """
+        template_dirs = [str(templates_dir) for templates_dir in getTemplateDirs() if templates_dir.is_dir()]
+        watched = template_dirs + ([manifest_path] if manifest_path else [])
+
+        # Compilar todas las plantillas antes del primer cambio
+        env = getTemplateEnvironment()
+        for name in env.list_templates(filter_func=lambda name: '__pycache__' not in name):
+            env.get_template(name)
+
+        try:
+            for changed in watchChanges(watched, interval):
+                start = time.perf_counter()
+
+                templates = {name for name in (templateName(path, template_dirs) for path in changed) if name}
+                if templates:
+                    self.reload_templates(templates)
+                    rendered = self.render_affected(templates, paths, write)
+                    print(Fore.CYAN + f"[watch] {', '.join(sorted(templates))}: {rendered} outputs re-rendered in {(time.perf_counter() - start) * 1000:.1f} ms" + Style.RESET_ALL)
+
+                if manifest_path and os.path.abspath(manifest_path) in changed:
+                    from .scaffold import ScaffoldCommand
+                    dry_run = None if write else {'diff': True, 'format': 'text'}
+                    ScaffoldCommand().scaffold(manifest_path, simulate=not write, regenerate=write, dry_run=dry_run)
+        except KeyboardInterrupt:
+            pass
+
+    def reload_templates(self, templates):
+        """
+        Prepara el entorno para volver a renderizar las plantillas cambiadas.
+
+        Jinja2 recompila por sí solo una plantilla cuyo archivo cambió, pero no detecta que aparezca
+        (o desaparezca) una plantilla propia que sustituye a la del paquete: en ese caso se vacía su caché.
+        """
+        forgetTemplateHashes()
+        env = getTemplateEnvironment()
+
+        for name in templates:
+            try:
+                template = env.get_template(name)
+            except Exception:
+                continue
+            if template.filename != str(getTemplatePath(*name.split('/', 1))):
+                env.cache.clear()
+                break
+
+    def render_affected(self, templates, paths=None, write=False) -> int:
+        """Vuelve a renderizar los archivos del índice que usan alguna de las plantillas"""
+        index = loadIndex()
+        rendered = 0
+        changed_index = False
+
+        for key in selectKeys(index, paths):
+            entry = index['files'][key]
+            if not any(item['template'] in templates for item in entry['inputs']):
+                continue
+
+            inputs = refreshInputs(entry['inputs'])
+            try:
+                content = renderInputs(inputs)
+            except Exception as e:
+                # Lo normal mientras se edita una plantilla: se avisa y se sigue vigilando
+                print(Fore.RED + f"Failed to render '{key}': {e}" + Style.RESET_ALL)
+                continue
+
+            rendered += 1
+            current = None
+            if os.path.exists(key):
+                with open(key, 'r', encoding='utf-8') as f:
+                    current = f.read()
+
+            if current == content:
+                print(f"---Unchanged: {key}")
+            elif not write:
+                print(_diff(key, current, content))
+            elif current is None or contentHash(current) == entry['output_hash']:
+                writeFileAtomic(key, content)
+                index['files'][key] = {'inputs': inputs, 'output_hash': contentHash(content)}
+                saveBase(key, content)
+                changed_index = True
+                print(f"---Written: {key}")
+            else:
+                print(Fore.YELLOW + f"---Skipped (modified by user, run ddd upgrade to merge): {key}" + Style.RESET_ALL)
+                print(_diff(key, current, content))
+
+        if changed_index:
+            saveIndex(index)
+
+        return rendered
+
+
+def watchChanges(paths: list, interval: float = POLL_INTERVAL):
+    """
+    Genera conjuntos de rutas absolutas de archivos cambiados bajo los directorios/archivos dados.
+
+    Usa inotify si está instalado inotify_simple (pip install inotify_simple, solo Linux)
+    y si no, compara los mtime de los archivos cada `interval` segundos.
+    """
+    try:
+        import inotify_simple
+    except ImportError:
+        print(f"Watching {len(paths)} paths (polling every {interval}s)...")
+        yield from _pollChanges(paths, interval)
+    else:
+        print(f"Watching {len(paths)} paths (inotify)...")
+        yield from _inotifyChanges(inotify_simple, paths)
+
+
+def _pollChanges(paths: list, interval: float):
+    snapshot = _snapshot(paths)
+    while True:
+        time.sleep(interval)
+        current = _snapshot(paths)
+        changed = {path for path in snapshot.keys() | current.keys() if snapshot.get(path) != current.get(path)}
+        snapshot = current
+        if changed:
+            yield changed
+
+
+def _snapshot(paths: list) -> dict:
+    """mtime y tamaño de cada archivo bajo las rutas dadas"""
+    stats = {}
+    for path in paths:
+        files = [path] if not os.path.isdir(path) else (
+            os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+        )
+        for file_path in files:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            stats[os.path.abspath(file_path)] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def _inotifyChanges(inotify_simple, paths: list):
+    flags = inotify_simple.flags
+    mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MOVED_FROM
+    inotify = inotify_simple.INotify()
+
+    directories = {}    # descriptor -> directorio vigilado
+    recursive = set()   # descriptores de directorios vigilados completos
+    only_names = {}     # descriptor -> nombres de archivo vigilados (archivos sueltos, ej: el manifiesto)
+
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            for root, _, _ in os.walk(path):
+                descriptor = inotify.add_watch(root, mask)
+                directories[descriptor] = root
+                recursive.add(descriptor)
+        else:
+            # Se vigila el directorio: los editores suelen reemplazar el archivo al guardar
+            parent = os.path.dirname(path)
+            descriptor = inotify.add_watch(parent, mask)
+            directories[descriptor] = parent
+            only_names.setdefault(descriptor, set()).add(os.path.basename(path))
+
+    while True:
+        events = inotify.read()
+        events += inotify.read(timeout=DEBOUNCE_MS)
+
+        changed = set()
+        for event in events:
+            root = directories.get(event.wd)
+            if root is None or not event.name:
+                continue
+
+            path = os.path.join(root, event.name)
+            if event.mask & flags.ISDIR:
+                if event.wd in recursive and event.mask & (flags.CREATE | flags.MOVED_TO):
+                    descriptor = inotify.add_watch(path, mask)
+                    directories[descriptor] = path
+                    recursive.add(descriptor)
+                continue
+
+            if event.wd not in recursive and event.name not in only_names.get(event.wd, ()):
+                continue
+            changed.add(path)
+
+        if changed:
+            yield changed
+
+
+def templateName(path: str, template_dirs: list):
+    """Nombre de plantilla (ej: services/class.py) de un archivo bajo un directorio de plantillas, None si no lo está"""
+    for templates_dir in template_dirs:
+        relative = os.path.relpath(path, os.path.abspath(templates_dir))
+        if not relative.startswith('..') and os.sep in relative:
+            return relative.replace(os.sep, '/')
+    return None
+
+
+def _diff(key: str, current, content: str) -> str:
+    """Diff unificado entre el archivo en disco (o vacío si no existe) y la nueva versión"""
+    return ''.join(difflib.unified_diff(
+        (current or '').splitlines(keepends=True),
+        content.splitlines(keepends=True),
+        fromfile=f"{key} (current)",
+        tofile=f"{key} (rendered)"
+    ))
@@ -1,9 +1,13 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.decorators import action
-from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
+from drf_spectacular.utils import extend_schema, extend_schema_serializer, inline_serializer, OpenApiResponse, OpenApiParameter
 from rest_framework.permissions import IsAuthenticated
+from django.http import StreamingHttpResponse
+
+# utilidades de exportación por streaming
+from .utils.stream_export import EXPORT_CONTENT_TYPES, serializer_fields, start_rows, stream_csv, stream_ndjson
 
 # importar serializers
 from .serializers.[[ entity_name.lower() ]]_serializer import [[ entity_name|capitalize_first ]]DTOSerializer
@@ -65,9 +69,26 @@ class [[ entity_name|capitalize_first ]]APIView(APIView):
     @extend_schema(
         operation_id="get_[[ entity_name|decapitalize_first ]]",
         summary="Retrieve a list or a specific [[ entity_name|decapitalize_first ]]",
-        description="Retrieve a list of all [[ entity_name|decapitalize_first ]] or a specific one by ID",
+        description="Retrieve a cursor-paginated list of [[ entity_name|decapitalize_first ]] or a specific one by ID",
+        parameters=[
+            OpenApiParameter(name="cursor", type=str, required=False, description="Cursor returned as next_cursor by the previous page"),
+            OpenApiParameter(name="limit", type=int, required=False, description="Page size (default 50)"),
+            OpenApiParameter(name="order_by", type=str, required=False, description="Ordering field, prefixed with '-' for descending order (default -id)"),
+            OpenApiParameter(name="count_mode", type=str, required=False, enum=["exact", "estimated", "cached", "windowed"], description="Include the total number of records in 'count': exact, estimated (planner statistics), cached (short-lived cached count) or windowed (computed with the first page and carried in the cursor)")
+        ],
         responses={
-            200: [[ entity_name|capitalize_first ]]DTOSerializer(many=True),
+            # Un objeto con la página, no un array (many=False evita que la acción list lo envuelva en uno)
+            200: OpenApiResponse(
+                response=extend_schema_serializer(many=False)(inline_serializer(
+                    name="[[ entity_name|capitalize_first ]]Page",
+                    fields={
+                        "results": [[ entity_name|capitalize_first ]]DTOSerializer(many=True),
+                        "next_cursor": serializers.CharField(allow_null=True),
+                        "count": serializers.IntegerField(required=False),
+                    },
+                )),
+                description="Page of results in 'results', the cursor of the next page in 'next_cursor' (null on the last page) and, with count_mode, the total in 'count'",
+            ),
             404: OpenApiResponse(description="Not Found"),
             400: OpenApiResponse(description="Bad Request")
         },
@@ -78,7 +99,8 @@ class [[ entity_name|capitalize_first ]]APIView(APIView):
         Maneja solicitudes GET para recuperar uno o todos los registros.
 
         - Si se proporciona `id`, recupera un registro específico.
-        - Si no se proporciona `id`, recupera todos los registros.
+        - Si no se proporciona `id`, recupera una página de registros (paginación por cursor,
+          el cursor de la siguiente página se devuelve en `next_cursor`; con `count_mode`, el total en `count`).
         """
 
         [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
@@ -109,15 +131,25 @@ class [[ entity_name|capitalize_first ]]APIView(APIView):
                 return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         else:
-            # Recuperar todos los registros
+            # Recuperar una página de registros
             try:
-                [[ entity_name|decapitalize_first ]]List = [[ entity_name|decapitalize_first ]]Service.list()
-
-                # Serializar la lista de registros
-                response_serializer_list = [[ entity_name|capitalize_first ]]DTOSerializer([[ entity_name|decapitalize_first ]]List, many=True)
+                page = [[ entity_name|decapitalize_first ]]Service.list_page(
+                    cursor=request.query_params.get("cursor"),
+                    limit=request.query_params.get("limit", 50),
+                    order_by=request.query_params.get("order_by", "-id"),
+                    readonly=True,
+                    projection="list",
+                    count_mode=request.query_params.get("count_mode")
+                )
+
+                # Serializar la página de registros
+                response_serializer_list = [[ entity_name|capitalize_first ]]DTOSerializer(page["results"], many=True)
+                data = {"results": response_serializer_list.data, "next_cursor": page["next_cursor"]}
+                if "count" in page:
+                    data["count"] = page["count"]
 
                 # Retornar la respuesta con un estado HTTP 200 OK
-                return Response(response_serializer_list.data, status=status.HTTP_200_OK)                          
+                return Response(data, status=status.HTTP_200_OK)                          
 
             except ([[ entity_name|capitalize_first ]]ValueError) as e:
                 # Manejar errores de validación si los datos no son válidos
@@ -232,6 +264,9 @@ class [[ entity_name|capitalize_first ]]APIView(APIView):
         except [[ entity_name|capitalize_first ]]NotFoundError as e:
             # Manejar errores si no se encuentra el registro con el ID dado
             return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except [[ entity_name|capitalize_first ]]AlreadyExistsError as e:
+            # Manejar errores si otro registro ya tiene el mismo valor en un campo único
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ([[ entity_name|capitalize_first ]]ValueError, [[ entity_name|capitalize_first ]]ValidationError) as e:
             # Manejar errores de validación si los datos no son válidos
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -283,3 +318,65 @@ class [[ entity_name|capitalize_first ]]APIView(APIView):
         except Exception as e:
             # Manejar cualquier otro error inesperado
             return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class [[ entity_name|capitalize_first ]]ExportAPIView(APIView):
+    """
+    API para exportar todos los registros de [[ entity_name|decapitalize_first ]] (CSV o NDJSON) por streaming.
+    """
+
+    # Definición de permisos y autenticación
+    # permission_classes = [IsAuthenticated]
+    # authentication_classes = [TokenAuthentication]
+
+
+    @extend_schema(
+        operation_id="export_[[ entity_name|decapitalize_first ]]",
+        summary="Export all [[ entity_name|decapitalize_first ]] as CSV or NDJSON",
+        description="Stream every [[ entity_name|decapitalize_first ]] row by row (constant memory, the first bytes are sent immediately)",
+        parameters=[
+            OpenApiParameter(name="export_format", type=str, required=False, enum=["csv", "ndjson"], description="Export format (default csv)")
+        ],
+        responses={
+            200: OpenApiResponse(description="CSV or NDJSON file"),
+            400: OpenApiResponse(description="Bad Request")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    def get(self, request):
+        """
+        Exporta todos los registros de [[ entity_name|decapitalize_first ]] como CSV o NDJSON (?export_format=csv|ndjson).
+
+        - Recorre la tabla con el iterador por bloques del servicio (`iter_list`): la memoria no depende del tamaño de la tabla.
+        - Ruta de solo lectura (`readonly=True`): las filas se convierten desde values_list sin instanciar el modelo.
+        - Exporta los mismos campos que el listado: lee la proyección "list" y escribe los campos que devuelve el DTOSerializer.
+        - Codifica cada fila directamente (sin pasarla por el DTOSerializer) y la envía en cuanto está lista (StreamingHttpResponse).
+        """
+
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_CONTENT_TYPES:
+            return Response({"error": f"export_format must be one of {', '.join(EXPORT_CONTENT_TYPES)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
+
+        try:
+            # Leer la primera fila antes de responder: los errores aún se pueden devolver con su código HTTP
+            rows = start_rows([[ entity_name|decapitalize_first ]]Service.iter_list(readonly=True, projection="list"))
+
+        except ([[ entity_name|capitalize_first ]]ValueError) as e:
+            # Manejar errores de validación si los datos no son válidos
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except (ConnectionDataBaseError, RepositoryError) as e:
+            # Manejar errores de conexión a la base de datos o repositorio
+            return Response({"error": "Database or repository error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            # Manejar cualquier otro error inesperado
+            return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # Codificar y enviar fila a fila
+        # Campos fijos: los que devuelve el DTOSerializer (sin los write_only ni columnas que la API no expone)
+        fields = serializer_fields([[ entity_name|capitalize_first ]]DTOSerializer)
+        content = stream_csv(rows, fields=fields) if export_format == "csv" else stream_ndjson(rows, fields=fields)
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[export_format])
+        response["Content-Disposition"] = f'attachment; filename="[[ entity_name.lower() ]]s.{export_format}"'
+        return response
@@ -1,9 +1,13 @@
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.decorators import action
-from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
+from drf_spectacular.utils import extend_schema, extend_schema_serializer, inline_serializer, OpenApiResponse, OpenApiParameter
 from rest_framework.permissions import IsAuthenticated
+from django.http import StreamingHttpResponse
+
+# utilidades de exportación por streaming
+from .utils.stream_export import EXPORT_CONTENT_TYPES, serializer_fields, start_rows, stream_csv, stream_ndjson
 
 # importar serializers
 from .serializers.[[ entity_name.lower() ]]_serializer import [[ entity_name|capitalize_first ]]DTOSerializer
@@ -43,6 +47,9 @@ Códigos de estado HTTP a utilizar en las respuestas:
 - 500 Internal Server Error: Se ha producido un error inesperado en el servidor al procesar la solicitud. Se devuelve un mensaje de error genérico.
 """
 
+# Número máximo de elementos por petición en las operaciones masivas (bulk_create, bulk_update, bulk_delete)
+BULK_MAX_ITEMS = 1000
+
 class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
     """
     ViewSet para manejar operaciones CRUD relacionadas con [[ entity_name|decapitalize_first ]].
@@ -60,15 +67,32 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
     # authentication_classes = [TokenAuthentication]
 
     # Definición de métodos HTTP permitidos
-    # http_method_names = ['get', 'post', 'put', 'delete']
+    # http_method_names = ['get', 'post', 'put', 'patch', 'delete']
 
 
     @extend_schema(
         operation_id="[[ entity_name|decapitalize_first ]]_list",
         summary="Retrieve a list or a specific [[ entity_name|decapitalize_first ]]",
-        description="Retrieve a list of all [[ entity_name|decapitalize_first ]] or a specific one by ID",
+        description="Retrieve a cursor-paginated list of [[ entity_name|decapitalize_first ]]",
+        parameters=[
+            OpenApiParameter(name="cursor", type=str, required=False, description="Cursor returned as next_cursor by the previous page"),
+            OpenApiParameter(name="limit", type=int, required=False, description="Page size (default 50)"),
+            OpenApiParameter(name="order_by", type=str, required=False, description="Ordering field, prefixed with '-' for descending order (default -id)"),
+            OpenApiParameter(name="count_mode", type=str, required=False, enum=["exact", "estimated", "cached", "windowed"], description="Include the total number of records in 'count': exact, estimated (planner statistics), cached (short-lived cached count) or windowed (computed with the first page and carried in the cursor)")
+        ],
         responses={
-            200: [[ entity_name|capitalize_first ]]DTOSerializer(many=True),
+            # Un objeto con la página, no un array (many=False evita que la acción list lo envuelva en uno)
+            200: OpenApiResponse(
+                response=extend_schema_serializer(many=False)(inline_serializer(
+                    name="[[ entity_name|capitalize_first ]]Page",
+                    fields={
+                        "results": [[ entity_name|capitalize_first ]]DTOSerializer(many=True),
+                        "next_cursor": serializers.CharField(allow_null=True),
+                        "count": serializers.IntegerField(required=False),
+                    },
+                )),
+                description="Page of results in 'results', the cursor of the next page in 'next_cursor' (null on the last page) and, with count_mode, the total in 'count'",
+            ),
             404: OpenApiResponse(description="Not Found"),
             400: OpenApiResponse(description="Bad Request")
         },
@@ -79,20 +103,34 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
         Endpoint para obtener una lista de todos los [[ entity_name|decapitalize_first ]].
         
         - Se valida y adapta la solicitud.
-        - Se utiliza el servicio `list_[[ entity_name|decapitalize_first ]]` para manejar la lógica.
+        - Se utiliza el servicio `list_page` para recuperar solo una página (paginación por cursor).
+        - Ruta de solo lectura (`readonly=True`): la página se convierte desde values_list sin instanciar el modelo.
+        - Solo se leen los campos de la proyección "list" de la entidad (Meta.projections), si la declara.
+        - El cursor de la siguiente página se devuelve en `next_cursor`.
+        - Con `count_mode` se añade el total en `count` (ver count_all del repositorio).
         """
 
         [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
 
         try:
-            # Llamar al servicio para recuperar todos los registros
-            [[ entity_name|decapitalize_first ]]List = [[ entity_name|decapitalize_first ]]Service.list()
-
-            # Serializar la lista de registros
-            response_serializer_list = [[ entity_name|capitalize_first ]]DTOSerializer([[ entity_name|decapitalize_first ]]List, many=True)       
+            # Llamar al servicio para recuperar una página de registros
+            page = [[ entity_name|decapitalize_first ]]Service.list_page(
+                cursor=request.query_params.get("cursor"),
+                limit=request.query_params.get("limit", 50),
+                order_by=request.query_params.get("order_by", "-id"),
+                readonly=True,
+                projection="list",
+                count_mode=request.query_params.get("count_mode")
+            )
+
+            # Serializar la página de registros
+            response_serializer_list = [[ entity_name|capitalize_first ]]DTOSerializer(page["results"], many=True)       
+            data = {"results": response_serializer_list.data, "next_cursor": page["next_cursor"]}
+            if "count" in page:
+                data["count"] = page["count"]
 
             # Retornar los datos serializados con un estado HTTP 200 OK
-            return Response(response_serializer_list.data, status=status.HTTP_200_OK)
+            return Response(data, status=status.HTTP_200_OK)
 
         except ([[ entity_name|capitalize_first ]]ValueError) as e:
             # Manejar errores de validación si los datos no son válidos
@@ -105,6 +143,59 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
             return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+    @extend_schema(
+        operation_id="[[ entity_name|decapitalize_first ]]_export",
+        summary="Export all [[ entity_name|decapitalize_first ]] as CSV or NDJSON",
+        description="Stream every [[ entity_name|decapitalize_first ]] row by row (constant memory, the first bytes are sent immediately)",
+        parameters=[
+            OpenApiParameter(name="export_format", type=str, required=False, enum=["csv", "ndjson"], description="Export format (default csv)")
+        ],
+        responses={
+            200: OpenApiResponse(description="CSV or NDJSON file"),
+            400: OpenApiResponse(description="Bad Request")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """
+        Exporta todos los registros de [[ entity_name|decapitalize_first ]] como CSV o NDJSON (?export_format=csv|ndjson).
+
+        - Recorre la tabla con el iterador por bloques del servicio (`iter_list`): la memoria no depende del tamaño de la tabla.
+        - Ruta de solo lectura (`readonly=True`): las filas se convierten desde values_list sin instanciar el modelo.
+        - Exporta los mismos campos que el listado: lee la proyección "list" y escribe los campos que devuelve el DTOSerializer.
+        - Codifica cada fila directamente (sin pasarla por el DTOSerializer) y la envía en cuanto está lista (StreamingHttpResponse).
+        """
+
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_CONTENT_TYPES:
+            return Response({"error": f"export_format must be one of {', '.join(EXPORT_CONTENT_TYPES)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
+
+        try:
+            # Leer la primera fila antes de responder: los errores aún se pueden devolver con su código HTTP
+            rows = start_rows([[ entity_name|decapitalize_first ]]Service.iter_list(readonly=True, projection="list"))
+
+        except ([[ entity_name|capitalize_first ]]ValueError) as e:
+            # Manejar errores de validación si los datos no son válidos
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except (ConnectionDataBaseError, RepositoryError) as e:
+            # Manejar errores de conexión a la base de datos o repositorio
+            return Response({"error": "Database or repository error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            # Manejar cualquier otro error inesperado
+            return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # Codificar y enviar fila a fila
+        # Campos fijos: los que devuelve el DTOSerializer (sin los write_only ni columnas que la API no expone)
+        fields = serializer_fields([[ entity_name|capitalize_first ]]DTOSerializer)
+        content = stream_csv(rows, fields=fields) if export_format == "csv" else stream_ndjson(rows, fields=fields)
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[export_format])
+        response["Content-Disposition"] = f'attachment; filename="[[ entity_name.lower() ]]s.{export_format}"'
+        return response
+
+
     @extend_schema(
         operation_id="[[ entity_name|decapitalize_first ]]_retrieve",
         summary="Retrieve a specific [[ entity_name|decapitalize_first ]] by ID",
@@ -219,16 +310,17 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
         },
         tags=["[[ entity_name|decapitalize_first ]]s"]
     )
-    def update(self, request, pk: int = None):
+    def update(self, request, pk: int = None, partial: bool = False):
         """
         Endpoint para actualizar un [[ entity_name|decapitalize_first ]] existente.
         
-        - Valida y adapta los datos entrantes.
+        - Valida y adapta los datos entrantes (con `partial=True`, solo los campos enviados).
         - Llama al servicio `update_[[ entity_name|decapitalize_first ]]` para manejar la actualización.
+        - Solo se escriben en la base de datos las columnas cuyo valor cambia.
         """
 
         # Datos enviados en el cuerpo de la solicitud
-        serializer = [[ entity_name|capitalize_first ]]DTOSerializer(data=request.data) 
+        serializer = [[ entity_name|capitalize_first ]]DTOSerializer(data=request.data, partial=partial) 
         if not serializer.is_valid():
             # Si la validación falla, retornar un error 400 BAD REQUEST
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -243,7 +335,7 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
 
         try:
             # Llamar al servicio para actualizar el registro
-            [[ entity_name|decapitalize_first ]] = [[ entity_name|decapitalize_first ]]Service.update(entity_id=id, data=serializer.validated_data, related_id=related_id, relations=relations)
+            [[ entity_name|decapitalize_first ]] = [[ entity_name|decapitalize_first ]]Service.update(entity_id=pk, data=serializer.validated_data, related_id=related_id, relations=relations)
 
             # Serializar el registro actualizado
             response_serializer = [[ entity_name|capitalize_first ]]DTOSerializer([[ entity_name|decapitalize_first ]])          
@@ -254,6 +346,9 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
         except [[ entity_name|capitalize_first ]]NotFoundError as e:
             # Manejar errores si no se encuentra el registro con el ID dado
             return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except [[ entity_name|capitalize_first ]]AlreadyExistsError as e:
+            # Manejar errores si otro registro ya tiene el mismo valor en un campo único
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ([[ entity_name|capitalize_first ]]ValueError, [[ entity_name|capitalize_first ]]ValidationError) as e:
             # Manejar errores de validación si los datos no son válidos
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -265,6 +360,28 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
             return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+    @extend_schema(
+        operation_id="[[ entity_name|decapitalize_first ]]_partial_update",
+        summary="Partially update an existing [[ entity_name|decapitalize_first ]]",
+        description="Update only the provided fields of an existing [[ entity_name|decapitalize_first ]]; only the columns whose value changes are written",
+        request=[[ entity_name|capitalize_first ]]DTOSerializer,
+        responses={
+            200: [[ entity_name|capitalize_first ]]DTOSerializer,
+            400: OpenApiResponse(description="Bad Request"),
+            404: OpenApiResponse(description="Not Found")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    def partial_update(self, request, pk: int = None):
+        """
+        Endpoint para actualizar solo algunos campos de un [[ entity_name|decapitalize_first ]] existente (PATCH).
+
+        - Valida únicamente los campos enviados y delega en `update`.
+        """
+
+        return self.update(request, pk=pk, partial=True)
+
+
     @extend_schema(
         operation_id="[[ entity_name|decapitalize_first ]]_delete",
         summary="Delete an existing [[ entity_name|decapitalize_first ]]",
@@ -306,3 +423,278 @@ class [[ entity_name|capitalize_first ]]ViewSet(ViewSet):
             # Manejar cualquier otro error inesperado
             return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+    @extend_schema(
+        operation_id="[[ entity_name|decapitalize_first ]]_bulk_create",
+        summary="Create many [[ entity_name|decapitalize_first ]] in one request",
+        description=f"Create a list of at most {BULK_MAX_ITEMS} [[ entity_name|decapitalize_first ]]. Every item gets its own result (index, status and data or error): the response is 201 if all items were created, 207 if only some of them and 400 if none",
+        request=[[ entity_name|capitalize_first ]]DTOSerializer(many=True),
+        responses={
+            201: OpenApiResponse(description="All items created"),
+            207: OpenApiResponse(description="Some items failed (see the result of each item)"),
+            400: OpenApiResponse(description="Bad Request")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """
+        Endpoint para crear varios [[ entity_name|decapitalize_first ]] en una sola petición (POST /bulk/).
+
+        - Valida la lista con `DTOSerializer(many=True)`: los elementos no válidos se informan y el resto se crea.
+        - Llama al servicio `create_many` (una transacción y consultas por lotes).
+        """
+
+        if not self._is_bulk_payload(request.data):
+            return Response({"error": f"The body must be a list of 1 to {BULK_MAX_ITEMS} items"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Validar todos los elementos (los que no son válidos no se envían al servicio)
+        items, failed = self._validate_items(request.data)
+
+        [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
+
+        try:
+            # Llamar al servicio para crear los registros en bloque
+            created = self._run_bulk(
+                lambda data_list: [[ entity_name|decapitalize_first ]]Service.create_many(items=data_list, relations=[data.get("relations") for data in data_list]),
+                items,
+                failed
+            )
+
+            # Resultado de cada elemento
+            results = failed + [
+                {"index": index, "status": status.HTTP_201_CREATED, "data": [[ entity_name|capitalize_first ]]DTOSerializer([[ entity_name|decapitalize_first ]]).data}
+                for index, [[ entity_name|decapitalize_first ]] in created
+            ]
+            return self._bulk_response(results, status.HTTP_201_CREATED)
+
+        except (ConnectionDataBaseError, RepositoryError) as e:
+            # Manejar errores de conexión a la base de datos o repositorio
+            return Response({"error": "Database or repository error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            # Manejar cualquier otro error inesperado
+            return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+    @extend_schema(
+        operation_id="[[ entity_name|decapitalize_first ]]_bulk_update",
+        summary="Update many [[ entity_name|decapitalize_first ]] in one request",
+        description=f"Partially update a list of at most {BULK_MAX_ITEMS} [[ entity_name|decapitalize_first ]] (every item must include its id). Every item gets its own result: the response is 200 if all items were updated, 207 if only some of them and 400 if none",
+        request=[[ entity_name|capitalize_first ]]DTOSerializer(many=True, partial=True),
+        responses={
+            200: OpenApiResponse(description="All items updated"),
+            207: OpenApiResponse(description="Some items failed (see the result of each item)"),
+            400: OpenApiResponse(description="Bad Request")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        """
+        Endpoint para actualizar varios [[ entity_name|decapitalize_first ]] en una sola petición (PATCH /bulk/).
+
+        - Valida la lista con `DTOSerializer(many=True, partial=True)`; cada elemento debe traer su `id`.
+        - Llama al servicio `update_many` (una consulta para leer todos los registros y escrituras por lotes).
+        """
+
+        if not self._is_bulk_payload(request.data):
+            return Response({"error": f"The body must be a list of 1 to {BULK_MAX_ITEMS} items"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Validar todos los elementos (los que no son válidos no se envían al servicio)
+        items, failed = self._validate_items(request.data, partial=True)
+
+        [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
+
+        try:
+            # Llamar al servicio para actualizar los registros en bloque
+            updated = self._run_bulk(
+                lambda data_list: [[ entity_name|decapitalize_first ]]Service.update_many(items=data_list, relations=[data.get("relations") for data in data_list]),
+                items,
+                failed
+            )
+
+            # Resultado de cada elemento
+            results = failed + [
+                {"index": index, "status": status.HTTP_200_OK, "data": [[ entity_name|capitalize_first ]]DTOSerializer([[ entity_name|decapitalize_first ]]).data}
+                for index, [[ entity_name|decapitalize_first ]] in updated
+            ]
+            return self._bulk_response(results, status.HTTP_200_OK)
+
+        except (ConnectionDataBaseError, RepositoryError) as e:
+            # Manejar errores de conexión a la base de datos o repositorio
+            return Response({"error": "Database or repository error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            # Manejar cualquier otro error inesperado
+            return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+    @extend_schema(
+        operation_id="[[ entity_name|decapitalize_first ]]_bulk_delete",
+        summary="Delete many [[ entity_name|decapitalize_first ]] in one request",
+        description=f"Delete a list of at most {BULK_MAX_ITEMS} [[ entity_name|decapitalize_first ]] ids. Every id gets its own result (204 deleted, 404 not found): the response is 200 if all were deleted, 207 if only some of them and 400 if none",
+        request={"application/json": {"type": "array", "items": {"type": "integer"}}},
+        responses={
+            200: OpenApiResponse(description="All items deleted"),
+            207: OpenApiResponse(description="Some items failed (see the result of each item)"),
+            400: OpenApiResponse(description="Bad Request")
+        },
+        tags=["[[ entity_name|decapitalize_first ]]s"]
+    )
+    @bulk_create.mapping.delete
+    def bulk_delete(self, request):
+        """
+        Endpoint para eliminar varios [[ entity_name|decapitalize_first ]] en una sola petición (DELETE /bulk/ con una lista de IDs).
+
+        - Llama al servicio `delete_many` (una transacción y un DELETE por lote de IDs).
+        """
+
+        if not self._is_bulk_payload(request.data):
+            return Response({"error": f"The body must be a list of 1 to {BULK_MAX_ITEMS} ids"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Validar los IDs (los que no son enteros no se envían al servicio)
+        ids = [(index, id) for index, id in enumerate(request.data) if isinstance(id, int) and not isinstance(id, bool)]
+        failed = [
+            {"index": index, "status": status.HTTP_400_BAD_REQUEST, "error": "The id must be an integer"}
+            for index, id in enumerate(request.data) if not isinstance(id, int) or isinstance(id, bool)
+        ]
+
+        [[ entity_name|decapitalize_first ]]Service = [[ entity_name|capitalize_first ]]Service() # Instanciar el servicio
+
+        try:
+            # Llamar al servicio para eliminar los registros en bloque
+            deleted = set([[ entity_name|decapitalize_first ]]Service.delete_many(ids=[id for _, id in ids])) if ids else set()
+
+            # Resultado de cada elemento
+            results = failed + [
+                {"index": index, "status": status.HTTP_204_NO_CONTENT, "id": id} if id in deleted else
+                {"index": index, "status": status.HTTP_404_NOT_FOUND, "id": id, "error": "Not found"}
+                for index, id in ids
+            ]
+            return self._bulk_response(results, status.HTTP_200_OK)
+
+        except ([[ entity_name|capitalize_first ]]ValueError, [[ entity_name|capitalize_first ]]ValidationError) as e:
+            # Manejar errores de validación si algún registro no se puede eliminar
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except (ConnectionDataBaseError, RepositoryError) as e:
+            # Manejar errores de conexión a la base de datos o repositorio
+            return Response({"error": "Database or repository error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except Exception as e:
+            # Manejar cualquier otro error inesperado
+            return Response({"error": "Unexpected error: " + str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+    def _is_bulk_payload(self, data) -> bool:
+        """El cuerpo de una operación masiva debe ser una lista no vacía de como máximo BULK_MAX_ITEMS elementos"""
+        return isinstance(data, list) and 0 < len(data) <= BULK_MAX_ITEMS
+
+
+    def _validate_items(self, data: list, partial: bool = False):
+        """
+        Valida una lista de elementos con `DTOSerializer(many=True)`.
+
+        returns:
+            (items, failed): lista de (índice, datos validados) de los elementos válidos
+            y lista de resultados (índice, estado 400 y errores) de los que no lo son.
+        """
+
+        serializer = [[ entity_name|capitalize_first ]]DTOSerializer(data=data, many=True, partial=partial)
+        if serializer.is_valid():
+            validated = serializer.validated_data
+            errors = [{}] * len(data)
+        else:
+            # Errores por elemento: lista alineada con los datos o, desde DRF 3.16, diccionario {índice: errores}
+            errors = serializer.errors
+            if isinstance(errors, dict):
+                errors = [errors.get(index, errors.get(str(index), {})) for index in range(len(data))]
+
+            # Solo hace falta volver a validar los elementos válidos para recuperar sus datos
+            validated = [serializer.child.run_validation(item) if not item_errors else None for item, item_errors in zip(data, errors)]
+
+        items = []
+        failed = []
+        for index, (item, item_data, item_errors) in enumerate(zip(data, validated, errors)):
+            if item_errors:
+                failed.append({"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": item_errors})
+            elif partial and not isinstance(item.get("id"), int):
+                # En las actualizaciones el id (de solo lectura en el serializer) se toma del elemento
+                failed.append({"index": index, "status": status.HTTP_400_BAD_REQUEST, "errors": {"id": ["This field is required."]}})
+            else:
+                items.append((index, dict(item_data, id=item["id"]) if partial else dict(item_data)))
+
+        return items, failed
+
+
+    def _run_bulk(self, operation, items: list, failed: list) -> list:
+        """
+        Ejecuta una operación masiva del servicio (todo o nada) sobre los elementos válidos.
+
+        Si el servicio rechaza algunos elementos (validación del dominio o del modelo, registros
+        inexistentes o que chocan con otros en un campo único), se informan como fallidos y la
+        operación se repite con el resto. Cada repetición quita al menos un elemento, así que son muy pocas.
+
+        params:
+            operation: Función que recibe la lista de datos y devuelve la lista de resultados del servicio.
+            items: Lista de (índice, datos) de los elementos válidos.
+            failed: Lista de resultados fallidos (se añaden los elementos rechazados).
+        returns:
+            Lista de (índice, resultado del servicio) de los elementos guardados.
+        """
+
+        while items:
+            try:
+                saved = operation([data for _, data in items])
+                return [(index, result) for (index, _), result in zip(items, saved)]
+
+            except ([[ entity_name|capitalize_first ]]ValidationError, [[ entity_name|capitalize_first ]]NotFoundError) as e:
+                rejected = self._rejected_items(e, items)
+                if not rejected:
+                    error = e
+                    break
+                failed.extend(rejected.values())
+                items = [item for position, item in enumerate(items) if position not in rejected]
+
+            except ([[ entity_name|capitalize_first ]]AlreadyExistsError, [[ entity_name|capitalize_first ]]ValueError) as e:
+                error = e
+                break
+        else:
+            return []
+
+        # La transacción se deshizo: la operación falló para todos los elementos restantes
+        failed.extend({"index": index, "status": status.HTTP_400_BAD_REQUEST, "error": str(error)} for index, _ in items)
+        return []
+
+
+    def _rejected_items(self, error, items: list) -> dict:
+        """Elementos rechazados por el servicio: posición en items -> resultado fallido"""
+
+        if isinstance(error, [[ entity_name|capitalize_first ]]NotFoundError):
+            missing = {str(id) for id in error.id} if isinstance(error.id, list) else {str(error.id)}
+            return {
+                position: {"index": index, "status": status.HTTP_404_NOT_FOUND, "error": "Not found"}
+                for position, (index, data) in enumerate(items) if str(data.get("id")) in missing
+            }
+
+        if isinstance(error.errors, list):
+            return {
+                item_error["index"]: {"index": items[item_error["index"]][0], "status": status.HTTP_400_BAD_REQUEST, "error": item_error["error"]}
+                for item_error in error.errors
+                if isinstance(item_error, dict) and isinstance(item_error.get("index"), int) and 0 <= item_error["index"] < len(items)
+            }
+
+        return {}
+
+
+    def _bulk_response(self, results: list, success_status: int) -> Response:
+        """Respuesta de una operación masiva: success_status si todo salió bien, 207 si solo una parte y 400 si nada"""
+
+        results.sort(key=lambda result: result["index"])
+        failures = sum(1 for result in results if result["status"] >= 400)
+
+        if not failures:
+            response_status = success_status
+        elif failures < len(results):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response({"results": results}, status=response_status)
@@ -35,6 +35,10 @@ class [[ entity_name|capitalize_first ]]Entity(BaseEntity):
         # Prohibidos en update() normal, pero SÍ modificables mediante un método dedicado
         # (ej: regenerate_api_key(), change_password()) con su propia validación.
 
+        projections = {"list": {"id", "uuid", "name", "email"}}
+        # Campos que se leen de la base de datos en cada listado (el resto queda con su valor por defecto).
+        # Los endpoints de listado usan "list": debe cubrir los campos que devuelve su DTOSerializer.
+
     # Identificadores
     id: Optional[int] = None  # ID relacionado con la base de datos
     uuid: Optional[UUID] = None
@@ -72,6 +72,10 @@ class BaseEntity(ABC):
         # Prohibidos en update() normal, pero SÍ modificables mediante un método dedicado
         # (ej: regenerate_api_key(), change_password()) con su propia validación.
 
+        projections: dict = {}
+        # Proyecciones de lectura por nombre: {"list": {"id", "name"}}. El repositorio solo lee de la
+        # base de datos esos campos (el resto queda con su valor por defecto). Sin proyección: todos.
+
         @classmethod
         def readonly_and_protected_fields(cls):
             # Unión de campos bloqueados en update(): inmutables (readonly) + fijados en creación (protected).
@@ -123,8 +127,11 @@ class BaseEntity(ABC):
         )
 
         # Actualizar cada campo proporcionado en 'data'
+        changed = set()
         for key, value in data.items():
             if (hasattr(self, key) or addMode == True) and (key not in exclude_fields):
+                if not hasattr(self, key) or getattr(self, key) != value:
+                    changed.add(key)
                 try:
                     setattr(self, key, value)             
                 except TypeError as e:
@@ -132,6 +139,22 @@ class BaseEntity(ABC):
 
         self._run_validation()     
 
+        # Registrar los campos que cambiaron (el repositorio solo escribe esas columnas)
+        self._dirty_fields = (getattr(self, "_dirty_fields", None) or set()) | changed
+
+    def changed_fields(self) -> Optional[set]:
+        """
+        Campos modificados con update() desde que se construyó la entidad.
+
+        :return: Nombres de los campos, o None si no se ha llamado a update() (cambios desconocidos).
+        """
+        dirty_fields = getattr(self, "_dirty_fields", None)
+        return set(dirty_fields) if dirty_fields is not None else None
+
+    def mark_clean(self) -> None:
+        """Olvida los cambios registrados (después de guardarlos)."""
+        self._dirty_fields = None
+
     # -------------------------
     # SERIALIZACIÓN
     # -------------------------
@@ -155,9 +178,10 @@ class BaseEntity(ABC):
         if not include_special_update_fields:
             exclude_fields.update(self.Meta.special_update_fields)
 
+        # Los atributos internos (ej: _dirty_fields) no forman parte de la entidad
         return {
             k: v for k, v in vars(self).items() 
-            if v is not None and k not in exclude_fields
+            if v is not None and k not in exclude_fields and not k.startswith("_")
         }    
 
     def to_orm_dict_for_create(self) -> dict:
@@ -166,6 +190,13 @@ class BaseEntity(ABC):
     def to_orm_dict_for_update(self) -> dict:
         return self.to_dict(include_readonly_fields=False, include_protected_fields=False, include_special_update_fields=False)
 
+    def to_orm_dict_for_changes(self) -> Optional[dict]:
+        """Valores de los campos modificados con update(), incluidos los que pasaron a None (None si no se ha llamado a update())."""
+        changed_fields = self.changed_fields()
+        if changed_fields is None:
+            return None
+        return {field: getattr(self, field) for field in changed_fields}
+
     # -------------------------
     # FROM_DICT
     # -------------------------   
@@ -1,7 +1,7 @@
 # schemas in pydantic format
 
 from abc import ABC, abstractmethod
-from pydantic import BaseModel, ConfigDict, Field, validator, model_validator, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, validator, model_validator, field_validator
 from typing import Self, Dict, Any, Optional, ClassVar
 from datetime import datetime
 from uuid import UUID
@@ -57,6 +57,10 @@ class BaseEntity(BaseModel, ABC):
         # Prohibidos en update() normal, pero SÍ modificables mediante un método dedicado
         # (ej: regenerate_api_key(), change_password()) con su propia validación.
 
+        projections: dict = {}
+        # Proyecciones de lectura por nombre: {"list": {"id", "name"}}. El repositorio solo lee de la
+        # base de datos esos campos (el resto queda con su valor por defecto). Sin proyección: todos.
+
         @classmethod
         def readonly_and_protected_fields(cls):
             # Unión de campos bloqueados en update(): inmutables (readonly) + fijados en creación (protected).
@@ -70,6 +74,9 @@ class BaseEntity(BaseModel, ABC):
         }
     )            
 
+    # Campos modificados con update() (None: no se ha llamado). No forma parte de model_dump()/to_dict()
+    _dirty_fields: Optional[set] = PrivateAttr(default=None)
+
     # -------------------------
     # VALIDACIÓN BASE
     # -------------------------    
@@ -132,15 +139,35 @@ class BaseEntity(BaseModel, ABC):
         # Crear copia actualizada (Pydantic valida automáticamente)
         updated = self.model_copy(update=valid_data)
 
-        # Reemplazar atributos actuales con todos los valores, incluidos None
-        for field, value in updated.model_dump(exclude_none=exclude_none).items():
+        # Reemplazar solo los atributos que cambian, incluidos los que pasan a None
+        current = self.model_dump(include=set(valid_data))
+        changed = set()
+        for field, value in updated.model_dump(exclude_none=exclude_none, include=set(valid_data)).items():
+            if field in current and current[field] == value:
+                continue
             try:
                 setattr(self, field, value)
             except TypeError as e:
                 raise self.domain_value_error_class(field=field, detail=f"Error in data structure: {str(e)}") from e
+            changed.add(field)
 
         self._run_validation()
 
+        # Registrar los campos que cambiaron (el repositorio solo escribe esas columnas)
+        self._dirty_fields = (self._dirty_fields or set()) | changed
+
+    def changed_fields(self) -> Optional[set]:
+        """
+        Campos modificados con update() desde que se construyó la entidad.
+
+        :return: Nombres de los campos, o None si no se ha llamado a update() (cambios desconocidos).
+        """
+        return set(self._dirty_fields) if self._dirty_fields is not None else None
+
+    def mark_clean(self) -> None:
+        """Olvida los cambios registrados (después de guardarlos)."""
+        self._dirty_fields = None
+
     # -------------------------
     # SERIALIZACIÓN
     # -------------------------
@@ -173,6 +200,13 @@ class BaseEntity(BaseModel, ABC):
     def to_orm_dict_for_update(self) -> dict:
         return self.to_dict(include_readonly_fields=False, include_protected_fields=False, include_special_update_fields=False)
 
+    def to_orm_dict_for_changes(self) -> Optional[dict]:
+        """Valores de los campos modificados con update(), incluidos los que pasaron a None (None si no se ha llamado a update())."""
+        changed_fields = self.changed_fields()
+        if changed_fields is None:
+            return None
+        return self.model_dump(include=changed_fields)
+
     # -------------------------
     # FROM_DICT
     # -------------------------        
@@ -1,7 +1,10 @@
-from typing import List, Optional
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import DatabaseError, IntegrityError, transaction
-from django.db.models import Q
+import json
+import re
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db import DatabaseError, IntegrityError, connections, transaction
+from django.db.models import Count, F, Q, UniqueConstraint, Window, prefetch_related_objects
 from django.forms import ValidationError as DjangoValidationError
 
 # importa las entidades utilizadas aqui
@@ -11,6 +14,8 @@ from ..utils.filter_dict import clean_dict_of_keys
 from ..utils.is_integer import is_integer
 from ..utils.is_uuid import is_uuid
 from ..utils.extract_validation_error import extract_validation_error
+from ..utils.cursor import encode_cursor, decode_cursor, filters_hash
+from ..utils.entity_cache import EntityCache
 from ..domain.[[ entity_name.lower() ]]_entity import [[ entity_name|capitalize_first ]]Entity
 
 
@@ -29,6 +34,30 @@ from .exceptions import (
     RepositoryError
 )
 
+# Paginación por cursor (keyset): tamaño de página por defecto y máximo
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Filas que se leen de la base de datos en cada bloque al recorrer la tabla con iter_all
+ITER_CHUNK_SIZE = 2000
+
+# Registros por consulta en las operaciones masivas (bulk_create, bulk_update, delete_many)
+BULK_BATCH_SIZE = 1000
+
+# Campos por los que se puede ordenar un listado paginado (deben estar indexados junto con el id)
+ORDERING_FIELDS = ("id", "created_at", "nombre")
+
+# Caché de lectura por id/uuid de get_by_id y de los conteos "cached" (ver utils/entity_cache.py): desactivada por defecto
+CACHE_ENABLED = False
+CACHE_TIMEOUT = 300  # TTL en segundos
+CACHE_VERSION = 1  # Incrementar al cambiar los campos de la entidad (invalida lo guardado)
+CACHE_ALIAS = "default"  # Alias de settings.CACHES
+
+# Modos de count_all (ver su docstring) y segundos que se guarda el conteo en el modo "cached".
+# El total "windowed" se calcula con la página: get_page(with_total=True)
+COUNT_MODES = ("exact", "estimated", "cached")
+COUNT_CACHE_TIMEOUT = 60
+
 
 class [[ entity_name|capitalize_first ]]Repository:
     """
@@ -38,15 +67,29 @@ class [[ entity_name|capitalize_first ]]Repository:
     - Validación de existencia de registros.
     - Control de unicidad.
     - Métodos básicos.
+    - Caché de lectura opcional de get_by_id (CACHE_ENABLED), invalidada al guardar o eliminar.
+    - Conteos exactos, estimados o en caché (COUNT_MODES), o calculados con la página (get_page(with_total=True)).
     """
 
+    cache = EntityCache([[ entity_name|capitalize_first ]]._meta.label_lower, timeout=CACHE_TIMEOUT, version=CACHE_VERSION, alias=CACHE_ALIAS, enabled=CACHE_ENABLED)
+
     @staticmethod
-    def get_all(filters: Optional[dict] = None) -> List[ [[ entity_name|capitalize_first ]]Entity ]:
+    def get_all(filters: Optional[dict] = None, readonly: bool = False, projection: Optional[str] = None) -> List[ [[ entity_name|capitalize_first ]]Entity ]:
         """
         Obtiene todos los registros de la entidad.
 
+        Con readonly=True las entidades se construyen directamente desde las tuplas de
+        values_list, sin instanciar el modelo (ver Mapper.rows_to_entities): más rápido para
+        listados de solo lectura, pero los campos de la entidad que no son columnas del modelo
+        (propiedades, anotaciones...) quedan con su valor por defecto.
+
+        Las columnas que se leen salen de los campos de la entidad que existen en el modelo
+        (Mapper.load_fields), o de la proyección si se indica una.
+
         params:
             filters (dict, optional): Filtros a aplicar en la consulta.
+            readonly (bool): Usar la lectura directa de columnas (sin instancias del modelo).
+            projection (str, optional): Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
         returns: 
             List[ [[ entity_name|capitalize_first ]]Entity ]: Lista de entidades recuperadas.
         raises:
@@ -56,20 +99,25 @@ class [[ entity_name|capitalize_first ]]Repository:
         """
 
         try:
-            instance_list = [[ entity_name|capitalize_first ]].objects.all()    
+            # Campos de la entidad que se leen (None: todos)
+            field_names = Mapper.projection_fields([[ entity_name|capitalize_first ]]Entity, projection)
 
             # Aplicar filtros si se proporcionan
-            if filters is not None:
-                if not isinstance(filters, dict):
-                    raise [[ entity_name|capitalize_first ]]ValueError(field="filters", detail="filters must be dict or None")
-                if "nombre" in filters and filters["nombre"].strip():
-                    instance_list = instance_list.filter(nombre__icontains=filters["nombre"])      
-                    
-            # Tener en cuenta los campos reales que se necesitan en el listado
-            instance_list = instance_list.only("id", "nombre", "created_at")
+            instance_list = [[ entity_name|capitalize_first ]]Repository._apply_filters([[ entity_name|capitalize_first ]].objects.all(), filters)
+
+            # Solo lectura: tuplas de columnas → entidades, sin instanciar el modelo
+            if readonly:
+                rows = list(instance_list.values_list(*Mapper.values_columns([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names)))
+                return Mapper.rows_to_entities([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, rows, field_names)
+
+            # Cargar solo las columnas que lee el Mapper (campos de la entidad o de la proyección): sin cargas diferidas por fila
+            instance_list = instance_list.only(*Mapper.load_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names))
+
+            # Cargar las relaciones Many-to-Many / reverse FK con una consulta por relación (evita N+1)
+            instance_list = instance_list.prefetch_related(*Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names))
 
             # Convertir a entidades usando el Mapper genérico
-            return [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity) for instance in instance_list]        
+            return [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity, field_names) for instance in instance_list]        
 
         except DatabaseError as e:
             raise ConnectionDataBaseError("Data base access error") from e
@@ -77,10 +125,234 @@ class [[ entity_name|capitalize_first ]]Repository:
             raise RepositoryError(f"Error fetching registers: {str(e)}") from e
 
 
+    @staticmethod
+    def iter_all(filters: Optional[dict] = None, chunk_size: int = ITER_CHUNK_SIZE, readonly: bool = False, projection: Optional[str] = None) -> Iterator[ [[ entity_name|capitalize_first ]]Entity ]:
+        """
+        Recorre todos los registros de la entidad sin cargarlos a la vez en memoria.
+
+        Usa QuerySet.iterator(chunk_size): en PostgreSQL con un cursor del lado del servidor
+        y en el resto de bases de datos leyendo por bloques de chunk_size filas. Cada entidad
+        se construye al consumirla, así que la memoria no depende del tamaño de la tabla
+        (ideal para exportaciones y procesos por lotes).
+
+        Con readonly=True cada bloque se lee con values_list y se convierte sin instanciar
+        el modelo (ver get_all).
+
+        params:
+            filters (dict, optional): Filtros a aplicar en la consulta.
+            chunk_size (int): Filas que se leen en cada bloque.
+            readonly (bool): Usar la lectura directa de columnas (sin instancias del modelo).
+            projection (str, optional): Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
+        yields:
+            [[ entity_name|capitalize_first ]]Entity: Cada entidad recuperada.
+        raises (al recorrer el iterador):
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            ConnectionDataBaseError: Si hay un error al conectar a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not is_integer(chunk_size) or int(chunk_size) <= 0:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="chunk_size", detail="chunk_size must be a positive integer.")
+        chunk_size = int(chunk_size)
+
+        # Campos de la entidad que se leen (None: todos)
+        field_names = Mapper.projection_fields([[ entity_name|capitalize_first ]]Entity, projection)
+
+        # Aplicar filtros si se proporcionan
+        instance_list = [[ entity_name|capitalize_first ]]Repository._apply_filters([[ entity_name|capitalize_first ]].objects.all(), filters)
+
+        try:
+            # Solo lectura: cada bloque de tuplas se convierte de una vez (una consulta por relación y bloque)
+            if readonly:
+                rows = instance_list.values_list(*Mapper.values_columns([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names)).iterator(chunk_size=chunk_size)
+                for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+                    yield from Mapper.rows_to_entities([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, chunk, field_names)
+                return
+
+            # Cargar solo las columnas que lee el Mapper (campos de la entidad o de la proyección): sin cargas diferidas por fila
+            instance_list = instance_list.only(*Mapper.load_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names))
+
+            # Las relaciones se cargan con una consulta por relación y bloque (iterator las aplica a cada bloque)
+            instance_list = instance_list.prefetch_related(*Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names))
+
+            for instance in instance_list.iterator(chunk_size=chunk_size):
+                yield Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity, field_names)
+
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error iterating registers: {str(e)}") from e
+
+
+    @staticmethod
+    def get_page(cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, order_by: str = "-id", filters: Optional[dict] = None, readonly: bool = False, projection: Optional[str] = None, with_total: bool = False) -> Tuple:
+        """
+        Obtiene una página de registros usando paginación por cursor (keyset).
+
+        En lugar de OFFSET (que recorre todas las filas anteriores), cada página continúa
+        después de la última fila de la anterior con un predicado sobre (campo de orden, id):
+        con un índice sobre esos campos el coste es proporcional a la página, no a la tabla.
+            ej: indexes = [models.Index(fields=["created_at", "id"])]
+
+        Con readonly=True la página se lee con values_list y se convierte sin instanciar
+        el modelo (ver get_all).
+
+        El cursor solo es válido con el mismo orden y los mismos filtros con que se creó.
+        Si el campo de orden admite NULL, esas filas van al final en los dos sentidos.
+
+        Con with_total=True también devuelve el total de registros (count_mode "windowed" del servicio):
+        en la primera página se calcula en la misma consulta con COUNT(*) OVER () y viaja en el
+        cursor, así las páginas siguientes no vuelven a contar.
+
+        params:
+            cursor (str, optional): Token devuelto por la página anterior (None para la primera).
+            limit (int): Número de registros por página (máximo MAX_PAGE_SIZE).
+            order_by (str): Campo de orden de ORDERING_FIELDS, con "-" para orden descendente.
+            filters (dict, optional): Filtros a aplicar en la consulta.
+            readonly (bool): Usar la lectura directa de columnas (sin instancias del modelo).
+            projection (str, optional): Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
+            with_total (bool): Devolver también el total de registros que cumplen los filtros.
+        returns:
+            Tuple[List[ [[ entity_name|capitalize_first ]]Entity ], Optional[str]]: Entidades de la página y cursor de la siguiente (None si es la última).
+            Con with_total, Tuple[List[ [[ entity_name|capitalize_first ]]Entity ], Optional[str], int]: además, el total.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si el cursor, el límite o el orden no son válidos.
+            ConnectionDataBaseError: Si hay un error al conectar a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        # Validar el límite y el orden
+        if not is_integer(limit) or not 0 < int(limit) <= MAX_PAGE_SIZE:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="limit", detail=f"limit must be an integer between 1 and {MAX_PAGE_SIZE}.")
+        limit = int(limit)
+
+        field = order_by.lstrip("-")
+        descending = order_by.startswith("-")
+        if field not in ORDERING_FIELDS:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="order_by", detail=f"order_by must be one of {', '.join(ORDERING_FIELDS)} (with '-' for descending order).")
+
+        # Decodificar el cursor (debe haberse creado con el mismo orden)
+        position = None
+        if cursor:
+            try:
+                position = decode_cursor(cursor)
+            except ValueError as e:
+                raise [[ entity_name|capitalize_first ]]ValueError(field="cursor", detail=str(e)) from e
+            if position.get("order_by") != order_by:
+                raise [[ entity_name|capitalize_first ]]ValueError(field="cursor", detail="The cursor was created with another order_by.")
+            if position.get("filters") != filters_hash(filters):
+                raise [[ entity_name|capitalize_first ]]ValueError(field="cursor", detail="The cursor was created with other filters.")
+
+        try:
+            # Campos de la entidad que se leen (None: todos)
+            field_names = Mapper.projection_fields([[ entity_name|capitalize_first ]]Entity, projection)
+
+            # Aplicar filtros si se proporcionan
+            instance_list = [[ entity_name|capitalize_first ]]Repository._apply_filters([[ entity_name|capitalize_first ]].objects.all(), filters)
+
+            # Total: en la primera página con COUNT(*) OVER () en la misma consulta; después, el que trae el cursor
+            total = None
+            window = with_total and position is None
+            if with_total and position is not None:
+                total = position["total"] if "total" in position else instance_list.count()
+
+            # Las filas con el campo de orden a NULL van al final (la comparación con NULL no es verdadera)
+            nullable = [[ entity_name|capitalize_first ]]._meta.get_field(field).null
+
+            # Continuar después de la última fila de la página anterior: (campo, id) > (valor, último id)
+            if position is not None:
+                lookup = "lt" if descending else "gt"
+                if field == "id":
+                    instance_list = instance_list.filter(**{f"id__{lookup}": position["id"]})
+                elif position["value"] is None:
+                    # La página anterior acabó en las filas con NULL: solo quedan las de id siguiente
+                    instance_list = instance_list.filter(**{f"{field}__isnull": True, f"id__{lookup}": position["id"]})
+                else:
+                    after = Q(**{f"{field}__{lookup}": position["value"]}) | Q(**{field: position["value"], f"id__{lookup}": position["id"]})
+                    if nullable:
+                        after |= Q(**{f"{field}__isnull": True})
+                    instance_list = instance_list.filter(after)
+
+            # El id desempata las filas con el mismo valor en el campo de orden
+            prefix = "-" if descending else ""
+            if field == "id":
+                ordering = [f"{prefix}id"]
+            elif nullable:
+                ordering = [F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True), f"{prefix}id"]
+            else:
+                ordering = [f"{prefix}{field}", f"{prefix}id"]
+            instance_list = instance_list.order_by(*ordering)
+            if window:
+                instance_list = instance_list.annotate(window_total=Window(Count("pk")))
+
+            # Se pide una fila de más para saber si hay página siguiente
+            if readonly:
+                # Solo lectura: tuplas de columnas, más el campo de orden para el cursor (y el total), sin instanciar el modelo
+                columns = Mapper.values_columns([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names)
+                extra = (field, "window_total") if window else (field,)
+                rows = list(instance_list.values_list(*columns, *extra)[:limit + 1])
+                if window:
+                    total = rows[0][-1] if rows else 0
+                has_next = len(rows) > limit
+                rows = rows[:limit]
+                entities = Mapper.rows_to_entities([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, rows, field_names)
+                last = (rows[-1][len(columns)], rows[-1][0]) if rows else None
+            else:
+                # Columnas que lee el Mapper más el campo de orden para el cursor
+                instances = list(instance_list.only(*Mapper.load_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names), field)[:limit + 1])
+                if window:
+                    total = instances[0].window_total if instances else 0
+                has_next = len(instances) > limit
+                instances = instances[:limit]
+
+                # Cargar las relaciones de la página con una consulta por relación (evita N+1)
+                prefetch_related_objects(instances, *Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity, field_names))
+
+                # Convertir a entidades usando el Mapper genérico
+                entities = [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity, field_names) for instance in instances]
+                last = (getattr(instances[-1], field), instances[-1].id) if instances else None
+
+            next_cursor = None
+            if has_next:
+                position = {"order_by": order_by, "filters": filters_hash(filters), "value": last[0], "id": last[1]}
+                if with_total:
+                    position["total"] = total
+                next_cursor = encode_cursor(position)
+
+            return (entities, next_cursor, total) if with_total else (entities, next_cursor)
+
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error fetching page: {str(e)}") from e
+
+
+    @staticmethod
+    def _apply_filters(instance_list, filters: Optional[dict] = None):
+        """
+        Aplica los filtros de los listados a un QuerySet.
+
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si filters no es un diccionario.
+        """
+
+        if filters is not None:
+            if not isinstance(filters, dict):
+                raise [[ entity_name|capitalize_first ]]ValueError(field="filters", detail="filters must be dict or None")
+            if "nombre" in filters and filters["nombre"].strip():
+                instance_list = instance_list.filter(nombre__icontains=filters["nombre"])
+
+        return instance_list
+
+
     @staticmethod
     def get_by_id(id = None, uuid = None) -> Optional[ [[ entity_name|capitalize_first ]]Entity ]:
         """
         Obtiene un registro por su ID o UUID.
+
+        Si la caché está activada (CACHE_ENABLED) se lee primero de ella y, si no está,
+        la entidad leída de la base de datos se guarda para las siguientes lecturas.
+        Dentro de una transacción se lee siempre de la base de datos (ver EntityCache).
         
         params:
             id: ID del registro a recuperar.
@@ -105,12 +377,14 @@ class [[ entity_name|capitalize_first ]]Repository:
             raise [[ entity_name|capitalize_first ]]ValueError(field="id/uuid", detail="Either id or uuid must be provided.")
 
         try:
-            if id is not None:
-                instance = [[ entity_name|capitalize_first ]].objects.get(id=id)
-            else:
-                instance = [[ entity_name|capitalize_first ]].objects.get(uuid=uuid)
+            def load():
+                if id is not None:
+                    instance = [[ entity_name|capitalize_first ]].objects.get(id=id)
+                else:
+                    instance = [[ entity_name|capitalize_first ]].objects.get(uuid=uuid)
+                return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
 
-            return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
+            return [[ entity_name|capitalize_first ]]Repository.cache.get_or_load(load, id=id, uuid=uuid)
 
         except [[ entity_name|capitalize_first ]].DoesNotExist as e:
             raise NotFoundError(id=id) from e
@@ -152,29 +426,45 @@ class [[ entity_name|capitalize_first ]]Repository:
 
 
     @staticmethod
-    def count_all(filters: Optional[dict] = None) -> int:
+    def count_all(filters: Optional[dict] = None, mode: str = "exact") -> int:
         """
         Cuenta registros que cumplen con ciertas condiciones.
 
+        Modos (COUNT_MODES):
+        - "exact": COUNT(*), recorre todas las filas que cumplen los filtros.
+        - "estimated": estadísticas del planificador de PostgreSQL (reltuples de pg_class sin filtros,
+          filas estimadas por EXPLAIN con filtros). En otras bases de datos, COUNT(*).
+        - "cached": COUNT(*) guardado COUNT_CACHE_TIMEOUT segundos en la caché (CACHE_ALIAS) por filtros,
+          si la caché está activada (CACHE_ENABLED; si no, COUNT(*)). Las escrituras del repositorio lo invalidan.
+
+        El total "windowed" no es un modo de count_all: se calcula junto con la página, get_page(with_total=True).
+
         params: 
             filters: Condiciones de filtro como clave-valor.
+            mode: Modo de conteo.
         returns:
-            Número de registros que cumplen las condiciones.
+            Número de registros que cumplen las condiciones (aproximado en "estimated" y "cached").
         raises: 
             [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.       
             RepositoryError: Si ocurre un error inesperado (interno del sistema). 
         """     
 
-        try:
-            instance_list = [[ entity_name|capitalize_first ]].objects.all()    
+        if mode == "windowed":
+            raise [[ entity_name|capitalize_first ]]ValueError(field="count_mode", detail="the windowed count is computed with the page: use get_page(with_total=True).")
+        if mode not in COUNT_MODES:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="count_mode", detail=f"count mode must be one of {', '.join(COUNT_MODES)} (windowed: get_page(with_total=True)).")
 
+        try:
             # Aplicar filtros si se proporcionan
-            if filters is not None:
-                if not isinstance(filters, dict):
-                    raise [[ entity_name|capitalize_first ]]ValueError(field="filters", detail="filters must be dict or None")               
-                if "nombre" in filters and filters["nombre"].strip():
-                    instance_list = instance_list.filter(nombre__icontains=filters["nombre"])            
+            instance_list = [[ entity_name|capitalize_first ]]Repository._apply_filters([[ entity_name|capitalize_first ]].objects.all(), filters)
+
+            if mode == "estimated":
+                estimate = [[ entity_name|capitalize_first ]]Repository._estimated_count(instance_list)
+                if estimate is not None:
+                    return estimate
+            elif mode == "cached":
+                return [[ entity_name|capitalize_first ]]Repository._cached_count(instance_list, filters)
 
             return instance_list.count()            
 
@@ -184,11 +474,51 @@ class [[ entity_name|capitalize_first ]]Repository:
             raise RepositoryError(f"Error counting registers: {str(e)}") from e
 
 
+    @staticmethod
+    def _estimated_count(instance_list) -> Optional[int]:
+        """
+        Número de filas estimado por el planificador de PostgreSQL, sin recorrer la tabla.
+
+        returns:
+            La estimación, o None en otras bases de datos o si la tabla aún no tiene estadísticas (ANALYZE).
+        """
+
+        connection = connections[instance_list.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        with connection.cursor() as cursor:
+            if not instance_list.query.has_filters():
+                # reltuples vale -1 (PostgreSQL 14+) o 0 si la tabla no se ha analizado nunca
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [ [[ entity_name|capitalize_first ]]._meta.db_table ])
+                row = cursor.fetchone()
+                return int(row[0]) if row and row[0] > 0 else None
+
+            sql, params = instance_list.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+    @staticmethod
+    def _cached_count(instance_list, filters: Optional[dict] = None) -> int:
+        """COUNT(*) guardado en la caché COUNT_CACHE_TIMEOUT segundos, con una clave por combinación de filtros (ver EntityCache.count)"""
+
+        return [[ entity_name|capitalize_first ]]Repository.cache.count(filters_hash(filters), instance_list.count, timeout=COUNT_CACHE_TIMEOUT)
+
+
     @staticmethod
     def create(entity: [[ entity_name|capitalize_first ]]Entity, relations: Optional[List[int]], adicionalData=None) -> [[ entity_name|capitalize_first ]]Entity:
         """
         Crea un nuevo registro.
 
+        La unicidad y las claves foráneas no se comprueban con consultas previas (full_clean):
+        las comprueba la base de datos en el mismo INSERT y sus errores se traducen a
+        AlreadyExistsError / ValidationError (ver _integrity_error).
+
         params: 
             entity: Entidad con los datos necesarios para crear el registro.
             relations: Lista de IDs de entidades relacionadas (opcional).
@@ -198,7 +528,7 @@ class [[ entity_name|capitalize_first ]]Repository:
         raises:
             [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
             ValidationError: Si los datos no son válidos.
-            AlreadyExistsError: Si ya existe un registro con el mismo nombre.
+            AlreadyExistsError: Si ya existe un registro con el mismo valor en un campo único.
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.   
             RepositoryError: Si ocurre un error inesperado (interno del sistema).     
         """
@@ -224,8 +554,8 @@ class [[ entity_name|capitalize_first ]]Repository:
                     # Por ejemplo, guardar una foto, un password, o cualquier otro campo especial
                     pass
 
-                # Validar y guardar
-                instance.full_clean()  # Validaciones del modelo
+                # Validar (sin consultas) y guardar: un solo INSERT
+                [[ entity_name|capitalize_first ]]Repository._full_clean(instance)
                 instance.save()
 
                 # Si se proporcionan IDs de entidades relacionadas, agregarlos
@@ -233,16 +563,16 @@ class [[ entity_name|capitalize_first ]]Repository:
                     # Asignar directamente los IDs
                     instance.relations.set(relations)                
 
+                # Los conteos en caché dejan de valer al confirmar la transacción
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate_counts()
+
+        except ValidationError:
+            raise
         except (TypeError, ValueError) as e:
             raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
-        except DjangoValidationError as e:
-            error_detail = extract_validation_error(e)
-            raise ValidationError(f"Validation error: {error_detail}") from e
         except IntegrityError as e:
-            if 'duplicate' in str(e).lower() or 'unique constraint' in str(e).lower():
-                raise AlreadyExistsError(field='name', detail=instance.name)  # Ajusta según el campo único
-            # Otro error de integridad → regla de negocio?
-            raise ValidationError({"integrity": "Duplicated or inconsistent data"})            
+            # Unicidad, clave foránea inexistente...: lo decide la base de datos
+            raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e, instance) from e
         except DatabaseError as e:
             raise ConnectionDataBaseError("Data base access error") from e
         except Exception as e:
@@ -251,11 +581,142 @@ class [[ entity_name|capitalize_first ]]Repository:
         return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
 
 
+    @staticmethod
+    def upsert(entity: [[ entity_name|capitalize_first ]]Entity, conflict_fields: List[str], update_fields: Optional[List[str]] = None, relations: Optional[List[int]] = None) -> [[ entity_name|capitalize_first ]]Entity:
+        """
+        Crea un registro o, si ya existe uno con los mismos valores en `conflict_fields`, lo actualiza.
+
+        Se guarda con una sola sentencia INSERT ... ON CONFLICT DO UPDATE (bulk_create con
+        update_conflicts=True), sin comprobar antes si existe: no hay carrera entre comprobar y guardar.
+        Después se lee el registro guardado para devolver también los campos que no se actualizaron.
+
+        params:
+            entity: Entidad con los datos del registro.
+            conflict_fields: Campos con restricción única (unique=True, unique_together o UniqueConstraint) que identifican el registro.
+            update_fields: Campos que se actualizan si ya existe (por defecto, los que admite update(): sin los de solo lectura ni los protegidos).
+            relations: Lista de IDs de entidades relacionadas (opcional, reemplaza las actuales).
+        returns:
+            La entidad guardada.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido (o no queda ningún campo que actualizar fuera de conflict_fields).
+            ValidationError: Si los datos no son válidos.
+            AlreadyExistsError: Si el registro choca con otro en un campo único distinto de conflict_fields.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not entity or not hasattr(entity, "to_dict"):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="[[ entity_name|capitalize_first ]]", detail="Entity null or without methond 'to_dict'")
+        conflict_fields = [[ entity_name|capitalize_first ]]Repository._validate_conflict_fields(conflict_fields)
+
+        try:
+            instance = [[ entity_name|capitalize_first ]]()
+            Mapper.update_model_from_entity_dict(instance, entity.to_orm_dict_for_create())
+            [[ entity_name|capitalize_first ]]Repository._full_clean(instance)
+
+            # Si ya existe, solo se actualizan los campos que se podrían modificar con update()
+            if update_fields is None:
+                update_fields = entity.to_orm_dict_for_update().keys()
+            fields = [[ entity_name|capitalize_first ]]Repository._bulk_update_fields(update_fields, [instance])
+            fields = [field for field in fields if field not in conflict_fields]
+            if not fields:
+                raise [[ entity_name|capitalize_first ]]ValueError(field="update_fields", detail="There are no fields to update besides conflict_fields; use create_or_get to keep the existing register.")
+
+            with transaction.atomic():
+                [[ entity_name|capitalize_first ]].objects.bulk_create([instance], update_conflicts=True, unique_fields=conflict_fields, update_fields=fields)
+
+                # PostgreSQL, SQLite y MariaDB devuelven el id (RETURNING); en MySQL se busca por los campos de conflicto
+                if instance.pk is None:
+                    instance.pk = [[ entity_name|capitalize_first ]].objects.filter(**[[ entity_name|capitalize_first ]]Repository._conflict_lookup(instance, conflict_fields)).values_list("pk", flat=True).get()
+
+                if relations is not None:
+                    instance.relations.set(relations)
+
+                # Si el registro ya existía, quitar de la caché la versión anterior al confirmar la transacción
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(instance.pk)
+
+            instance = [[ entity_name|capitalize_first ]].objects.only(*Mapper.load_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity)).get(pk=instance.pk)
+
+        except (ValidationError, [[ entity_name|capitalize_first ]]ValueError):
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e, instance) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error saving register: {str(e)}") from e
+
+        return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
+
+
+    @staticmethod
+    def create_or_get(entity: [[ entity_name|capitalize_first ]]Entity, conflict_fields: List[str], relations: Optional[List[int]] = None) -> Tuple[ [[ entity_name|capitalize_first ]]Entity, bool ]:
+        """
+        Crea un registro o, si ya existe uno con los mismos valores en `conflict_fields`, devuelve el existente sin modificarlo.
+
+        Primero se intenta el INSERT (una sola sentencia en el caso habitual, sin SELECT previo);
+        solo si la base de datos lo rechaza por un campo único se lee el registro existente.
+
+        params:
+            entity: Entidad con los datos del registro.
+            conflict_fields: Campos con restricción única que identifican el registro.
+            relations: Lista de IDs de entidades relacionadas (opcional, solo al crear).
+        returns:
+            Tuple[ [[ entity_name|capitalize_first ]]Entity, bool ]: La entidad y si se ha creado.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            ValidationError: Si los datos no son válidos.
+            AlreadyExistsError: Si el registro choca con otro en un campo único distinto de conflict_fields.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not entity or not hasattr(entity, "to_dict"):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="[[ entity_name|capitalize_first ]]", detail="Entity null or without methond 'to_dict'")
+        conflict_fields = [[ entity_name|capitalize_first ]]Repository._validate_conflict_fields(conflict_fields)
+
+        try:
+            instance = [[ entity_name|capitalize_first ]]()
+            Mapper.update_model_from_entity_dict(instance, entity.to_orm_dict_for_create())
+            [[ entity_name|capitalize_first ]]Repository._full_clean(instance)
+
+            try:
+                # Punto de guardado propio: si el INSERT falla, la transacción exterior sigue siendo válida
+                with transaction.atomic():
+                    instance.save()
+                    if relations is not None:
+                        instance.relations.set(relations)
+                    [[ entity_name|capitalize_first ]]Repository.cache.invalidate_counts()
+                created = True
+            except IntegrityError as e:
+                existing = [[ entity_name|capitalize_first ]].objects.filter(**[[ entity_name|capitalize_first ]]Repository._conflict_lookup(instance, conflict_fields)).first()
+                if existing is None:
+                    # El conflicto no era por conflict_fields (u otro error de integridad)
+                    raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e, instance) from e
+                instance, created = existing, False
+
+        except (ValidationError, AlreadyExistsError):
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error creating register: {str(e)}") from e
+
+        return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity), created
+
+
     @staticmethod
     def update(entity: [[ entity_name|capitalize_first ]]Entity, relations: Optional[List[int]], adicionalData=None) -> [[ entity_name|capitalize_first ]]Entity:
         """
         Guarda los cambios en una entidad existente.
 
+        Si la entidad registra sus cambios (entity.update()), solo se validan y escriben las columnas
+        que cambiaron (save(update_fields=...)); si no cambió ninguna, no se escribe el registro.
+
         params: 
             entity: Entidad con los datos a actualizar (debe traer el id en los campos).
             relations: Lista de IDs de entidades relacionadas (opcional).
@@ -266,6 +727,7 @@ class [[ entity_name|capitalize_first ]]Repository:
             [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
             NotFoundError: Si no existe el registro con el ID dado.
             ValidationError: Si los datos no son válidos.
+            AlreadyExistsError: Si otro registro ya tiene el mismo valor en un campo único.
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.   
             RepositoryError: Si ocurre un error inesperado (interno del sistema).     
         """    
@@ -296,8 +758,9 @@ class [[ entity_name|capitalize_first ]]Repository:
                 # Asegurar que todas las operaciones se realicen en una transacción
                 # Esto garantiza que si algo falla, no se guarden cambios parciales     
                 
-                # Actualizar cada campo de la entidad en el modelo
-                Mapper.update_model_from_entity_dict(instance, entity.to_orm_dict_for_update())          
+                # Actualizar en el modelo los campos que cambiaron (todos si la entidad no registra cambios)
+                changes = entity.to_orm_dict_for_changes()
+                Mapper.update_model_from_entity_dict(instance, entity.to_orm_dict_for_update() if changes is None else changes)          
 
                 # Si adicionalData, agregar datos adicionales que no sean relaciones
                 if adicionalData:
@@ -305,13 +768,19 @@ class [[ entity_name|capitalize_first ]]Repository:
                     # Por ejemplo, guardar una foto, un password, o cualquier otro campo especial
                     pass
 
-                instance.full_clean()  # Validaciones del modelo Django
-                instance.save() 
+                # Validaciones del modelo Django y guardado
+                [[ entity_name|capitalize_first ]]Repository._save_changes(instance, changes)
 
                 # Si se proporcionan IDs de entidades relacionadas, actualizarlos
                 if relations is not None:
                     # Asignar directamente los IDs
                     instance.relations.set(relations)                
+
+                # Quitar de la caché la versión anterior al confirmar la transacción
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(instance.pk)
+
+            # Los cambios ya están guardados
+            entity.mark_clean()
             
             # Convertir el modelo actualizado de vuelta a una entidad
             return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
@@ -323,6 +792,100 @@ class [[ entity_name|capitalize_first ]]Repository:
         except DjangoValidationError as e:
             error_detail = extract_validation_error(e)
             raise ValidationError(f"Validation error: {error_detail}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e, instance) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e            
+        except Exception as e:
+            raise RepositoryError(f"Error updating register: {str(e)}") from e
+
+
+    @staticmethod
+    def update_by_id(id=None, uuid=None, changes: Optional[dict] = None, relations: Optional[List[int]] = None, adicionalData=None) -> [[ entity_name|capitalize_first ]]Entity:
+        """
+        Aplica cambios a un registro existente leyéndolo una sola vez.
+
+        Dentro de una transacción: lee el registro bloqueándolo (SELECT ... FOR UPDATE, nadie lo
+        modifica entre la lectura y la escritura), construye la entidad con sus columnas, aplica
+        las reglas de dominio (entity.update(changes)) y escribe solo las columnas que cambiaron.
+        Sustituye a get_by_id() + update(), que leen el mismo registro dos veces.
+
+        params: 
+            id: ID del registro a actualizar.
+            uuid: UUID del registro a actualizar (si no se da el id).
+            changes: Diccionario con los campos a modificar.
+            relations: Lista de IDs de entidades relacionadas (opcional).
+            adicionalData: Datos adicionales a incluir en la actualización.
+        returns:
+            La entidad guardada.
+        raises: 
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido (o los cambios no cumplen las reglas de dominio).
+            NotFoundError: Si no existe el registro con el ID dado.
+            ValidationError: Si los datos no son válidos.
+            AlreadyExistsError: Si otro registro ya tiene el mismo valor en un campo único.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.   
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).     
+        """
+
+        # Validar que tenga el id o uuid
+        if not id and not uuid:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id/uuid", detail="The id or uuid field is required")
+
+        # validar el id
+        if id and not is_integer(id):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id", detail="Id must be integer.")
+
+        # validar el uuid
+        if not id and not is_uuid(uuid):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="uuid", detail="UUID must be valid.")
+
+        if changes is None or not hasattr(changes, "items"):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="changes", detail="changes must be a dictionary")
+
+        instance = None
+        try:
+            with transaction.atomic():
+                # Una sola lectura, con el registro bloqueado hasta el final de la transacción
+                lookup = {"id": id} if id else {"uuid": uuid}
+                instance = [[ entity_name|capitalize_first ]].objects.select_for_update().get(**lookup)
+
+                # Entidad con las columnas ya leídas (sin consultar sus relaciones) y reglas de dominio
+                entity = Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity, Mapper.column_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity))
+                entity.update(changes)
+
+                # Actualizar en el modelo solo los campos que cambiaron
+                changed = entity.to_orm_dict_for_changes()
+                Mapper.update_model_from_entity_dict(instance, changed)
+
+                # Si adicionalData, agregar datos adicionales que no sean relaciones
+                if adicionalData:
+                    # Aquí puedes agregar lógica para manejar datos adicionales específicos
+                    # Por ejemplo, guardar una foto, un password, o cualquier otro campo especial
+                    pass
+
+                # Validaciones del modelo Django y guardado (sin UPDATE si no cambió ninguna columna)
+                [[ entity_name|capitalize_first ]]Repository._save_changes(instance, changed)
+
+                # Si se proporcionan IDs de entidades relacionadas, actualizarlos
+                if relations is not None:
+                    instance.relations.set(relations)
+
+                # Quitar de la caché la versión anterior al confirmar la transacción
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(instance.pk)
+
+            return Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity)
+
+        except [[ entity_name|capitalize_first ]].DoesNotExist as e:
+            raise NotFoundError(id=id or uuid) from e
+        except [[ entity_name|capitalize_first ]]ValueError:
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except DjangoValidationError as e:
+            error_detail = extract_validation_error(e)
+            raise ValidationError(f"Validation error: {error_detail}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e, instance) from e
         except DatabaseError as e:
             raise ConnectionDataBaseError("Data base access error") from e            
         except Exception as e:
@@ -332,7 +895,11 @@ class [[ entity_name|capitalize_first ]]Repository:
     @staticmethod
     def delete(id=None, uuid=None) -> bool:
         """
-        Elimina un registro por su ID o UUID.
+        Elimina un registro por su ID o UUID sin leerlo antes.
+
+        Si el modelo no tiene dependientes (relaciones con CASCADE / SET_NULL, Many-to-Many) ni señales
+        de borrado, QuerySet.delete() es un solo DELETE; si los tiene, Django usa el Collector (lee las
+        filas y borra o actualiza las dependientes). La existencia se decide por las filas eliminadas.
 
         params: 
             id: ID del registro a eliminar.
@@ -360,16 +927,18 @@ class [[ entity_name|capitalize_first ]]Repository:
             raise [[ entity_name|capitalize_first ]]ValueError(field="uuid", detail="El UUID debe ser válido.")
 
         try:
-            if id is not None:
-                instance = [[ entity_name|capitalize_first ]].objects.get(id=id)
-            else:
-                instance = [[ entity_name|capitalize_first ]].objects.get(uuid=uuid)
-    
-            instance.delete()
+            lookup = {"id": id} if id is not None else {"uuid": uuid}
+            _, deleted = [[ entity_name|capitalize_first ]].objects.filter(**lookup).delete()
+            if not deleted.get([[ entity_name|capitalize_first ]]._meta.label):
+                raise NotFoundError(id=id if id is not None else uuid)
+
+            [[ entity_name|capitalize_first ]]Repository._invalidate_cache(id, uuid)
             return True
 
-        except [[ entity_name|capitalize_first ]].DoesNotExist as e:
-            raise NotFoundError(id=id) from e
+        except NotFoundError:
+            raise
+        except IntegrityError as e:
+            raise ValidationError({"integrity": "The register can not be deleted"}) from e
         except DjangoValidationError as e:
             error_detail = extract_validation_error(e)
             raise ValidationError(f"Validation error occurred: {error_detail}") from e
@@ -379,6 +948,707 @@ class [[ entity_name|capitalize_first ]]Repository:
             raise RepositoryError(f"Error deleting register: {str(e)}") from e
 
 
+    @staticmethod
+    def update_fields_by_id(id=None, uuid=None, changes: Optional[dict] = None) -> bool:
+        """
+        Actualiza columnas de un registro con un solo UPDATE, sin leerlo ni construir la entidad.
+
+        No aplica las reglas de dominio de la entidad (entity.update / validate): es para cambios que no
+        las necesitan (contadores con F("campo") + 1, marcas de estado, fechas). Los valores se validan
+        con las validaciones de su campo del modelo y la unicidad y las claves foráneas las comprueba la
+        base de datos. Los campos auto_now (ej: updated_at) se actualizan también.
+
+        params:
+            id: ID del registro a actualizar.
+            uuid: UUID del registro a actualizar (si no se da el id).
+            changes: Campos del modelo y sus valores (o expresiones, ej: F("visitas") + 1).
+        returns:
+            True si se actualizó el registro.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            NotFoundError: Si no existe el registro.
+            ValidationError: Si los datos no son válidos.
+            AlreadyExistsError: Si ya existe un registro con el mismo valor en un campo único.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        # Validar que haya un id o uuid
+        if id is None and uuid is None:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id/uuid", detail="The id or uuid field is required")
+
+        # validar el id
+        if id is not None and not is_integer(id):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id", detail="Id must be integer.")
+
+        # validar el uuid
+        if id is None and not is_uuid(uuid):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="uuid", detail="UUID must be valid.")
+
+        if not changes or not hasattr(changes, "items"):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="changes", detail="changes must be a non empty dictionary")
+
+        try:
+            values = {}
+            for name, value in changes.items():
+                try:
+                    field = [[ entity_name|capitalize_first ]]._meta.get_field(name)
+                except FieldDoesNotExist:
+                    field = None
+
+                # Solo columnas propias, sin identificadores (id y uuid no se actualizan)
+                if field is None or not field.concrete or field.many_to_many or field.primary_key or field.name == "uuid":
+                    raise [[ entity_name|capitalize_first ]]ValueError(field=name, detail="Field does not exist or can not be updated.")
+
+                # Validaciones del campo sin consultas (las claves foráneas las comprueba la base de datos)
+                if not hasattr(value, "resolve_expression") and not field.is_relation:
+                    value = field.clean(value, None)
+                values[name] = value
+
+            # QuerySet.update() no llama a save(): los campos auto_now se asignan aquí
+            for field in [[ entity_name|capitalize_first ]]._meta.concrete_fields:
+                if getattr(field, "auto_now", False) and field.name not in values:
+                    values[field.name] = field.pre_save([[ entity_name|capitalize_first ]](), add=False)
+
+            lookup = {"id": id} if id is not None else {"uuid": uuid}
+            if not [[ entity_name|capitalize_first ]].objects.filter(**lookup).update(**values):
+                raise NotFoundError(id=id if id is not None else uuid)
+
+            [[ entity_name|capitalize_first ]]Repository._invalidate_cache(id, uuid)
+            return True
+
+        except ([[ entity_name|capitalize_first ]]ValueError, NotFoundError):
+            raise
+        except DjangoValidationError as e:
+            error_detail = extract_validation_error(e)
+            raise ValidationError(f"Validation error: {error_detail}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._integrity_error(e) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error updating register: {str(e)}") from e
+
+
+    @staticmethod
+    def get_by_ids(ids: List[int]) -> Dict[int, [[ entity_name|capitalize_first ]]Entity ]:
+        """
+        Obtiene varios registros por sus IDs con una sola consulta (in_bulk).
+
+        params:
+            ids: IDs de los registros a recuperar.
+        returns:
+            Diccionario id -> entidad con los registros encontrados (los IDs que no existen no aparecen).
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si algún ID no es válido.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not isinstance(ids, (list, tuple, set)) or not all(is_integer(id) for id in ids):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="ids", detail="ids must be a list of integers.")
+
+        try:
+            instance_list = [[ entity_name|capitalize_first ]].objects.prefetch_related(*Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity))
+            instances = instance_list.in_bulk([int(id) for id in ids])
+            return {pk: Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity) for pk, instance in instances.items()}
+
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error fetching registers: {str(e)}") from e
+
+
+    @staticmethod
+    def bulk_create(entities: List[ [[ entity_name|capitalize_first ]]Entity ], relations: Optional[List[Optional[List[int]]]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[ [[ entity_name|capitalize_first ]]Entity ]:
+        """
+        Crea varios registros en una sola transacción.
+
+        En lugar de full_clean() + save() + relations.set() por registro (3+ consultas por entidad),
+        usa bulk_create por lotes de batch_size y añade las relaciones Many-to-Many insertando
+        directamente en la tabla intermedia, también por lotes.
+
+        La unicidad y las claves foráneas las comprueba la base de datos (full_clean haría una
+        consulta por registro para cada una). Los IDs de los registros creados los devuelve la base de
+        datos (PostgreSQL, SQLite 3.35+, MariaDB 10.5+), necesarios para las relaciones.
+
+        params:
+            entities: Entidades con los datos de los registros a crear.
+            relations: Lista de IDs relacionados por entidad, en el mismo orden (None = sin relaciones).
+            batch_size: Registros por consulta.
+        returns:
+            Las entidades creadas.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            ValidationError: Si algún registro no es válido o choca con otro (errors: lista con el índice y el error de cada uno).
+            AlreadyExistsError: Si algún registro viola una restricción de unicidad y no se puede localizar cuál.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        [[ entity_name|capitalize_first ]]Repository._validate_bulk_input(entities, relations, batch_size)
+
+        try:
+            # Construir y validar las instancias (sin consultas a la base de datos)
+            instances = []
+            errors = []
+            for index, entity in enumerate(entities):
+                instance = [[ entity_name|capitalize_first ]]()
+                Mapper.update_model_from_entity_dict(instance, entity.to_orm_dict_for_create())
+                try:
+                    [[ entity_name|capitalize_first ]]Repository._full_clean(instance, index)
+                except ValidationError as e:
+                    errors.extend(e.errors)
+                instances.append(instance)
+
+            if errors:
+                raise ValidationError(errors)
+
+            with transaction.atomic():
+                # Un INSERT por lote en lugar de uno por registro
+                instances = [[ entity_name|capitalize_first ]].objects.bulk_create(instances, batch_size=batch_size)
+
+                # Relaciones Many-to-Many: inserciones por lotes en la tabla intermedia
+                if relations is not None:
+                    [[ entity_name|capitalize_first ]]Repository._bulk_set_relations(instances, relations, batch_size)
+
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate_counts()
+
+            # Leer las relaciones de todas las instancias con una consulta por relación
+            prefetch_related_objects(instances, *Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity))
+
+        except ValidationError:
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._bulk_integrity_error(e, instances, relations) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error creating registers: {str(e)}") from e
+
+        return [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity) for instance in instances]
+
+
+    @staticmethod
+    def bulk_update(entities: List[ [[ entity_name|capitalize_first ]]Entity ], fields: Optional[List[str]] = None, relations: Optional[List[Optional[List[int]]]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[ [[ entity_name|capitalize_first ]]Entity ]:
+        """
+        Guarda los cambios de varias entidades existentes en una sola transacción.
+
+        Carga todos los registros con una consulta (in_bulk), aplica los cambios y los guarda con
+        bulk_update por lotes. Las relaciones Many-to-Many de las entidades que las indican se
+        reemplazan (como relations.set()) con un DELETE y un INSERT por lotes en la tabla intermedia.
+
+        params:
+            entities: Entidades con los datos a actualizar (deben traer el id).
+            fields: Campos a actualizar (por defecto, los que cambiaron con entity.update(), o los campos del modelo presentes en las entidades).
+            relations: Lista de IDs relacionados por entidad, en el mismo orden (None = no se modifican).
+            batch_size: Registros por consulta.
+        returns:
+            Las entidades guardadas.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            NotFoundError: Si no existe alguno de los registros.
+            ValidationError: Si algún registro no es válido o choca con otro (errors: lista con el índice y el error de cada uno).
+            AlreadyExistsError: Si algún registro viola una restricción de unicidad y no se puede localizar cuál.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        [[ entity_name|capitalize_first ]]Repository._validate_bulk_input(entities, relations, batch_size)
+
+        if not all(entity.id and is_integer(entity.id) for entity in entities):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id", detail="Every entity must have an integer id.")
+
+        try:
+            with transaction.atomic():
+                # Cargar todos los registros con una sola consulta
+                existing = [[ entity_name|capitalize_first ]].objects.in_bulk([int(entity.id) for entity in entities])
+                missing = [entity.id for entity in entities if int(entity.id) not in existing]
+                if missing:
+                    raise NotFoundError(id=missing)
+
+                # Aplicar los cambios y validar (sin consultas a la base de datos)
+                instances = []
+                errors = []
+                changed_fields = set()
+                for index, entity in enumerate(entities):
+                    instance = existing[int(entity.id)]
+                    changes = entity.to_orm_dict_for_changes()
+                    entity_dict = entity.to_orm_dict_for_update() if changes is None else changes
+                    Mapper.update_model_from_entity_dict(instance, entity_dict)
+                    try:
+                        [[ entity_name|capitalize_first ]]Repository._full_clean(instance, index)
+                    except ValidationError as e:
+                        errors.extend(e.errors)
+                    changed_fields.update(entity_dict)
+                    instances.append(instance)
+
+                if errors:
+                    raise ValidationError(errors)
+
+                update_fields = [[ entity_name|capitalize_first ]]Repository._bulk_update_fields(fields or changed_fields, instances) if fields or changed_fields else []
+                if update_fields:
+                    [[ entity_name|capitalize_first ]].objects.bulk_update(instances, update_fields, batch_size=batch_size)
+
+                # Reemplazar las relaciones Many-to-Many indicadas
+                if relations is not None:
+                    [[ entity_name|capitalize_first ]]Repository._bulk_set_relations(instances, relations, batch_size, replace=True)
+
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(*(instance.pk for instance in instances))
+
+            # Leer las relaciones (ya actualizadas) de todas las instancias con una consulta por relación
+            prefetch_related_objects(instances, *Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity))
+
+            for entity in entities:
+                entity.mark_clean()
+
+        except (NotFoundError, ValidationError):
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._bulk_integrity_error(e, instances, relations) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error updating registers: {str(e)}") from e
+
+        return [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity) for instance in instances]
+
+
+    @staticmethod
+    def bulk_update_by_ids(items: List[dict], relations: Optional[List[Optional[List[int]]]] = None, batch_size: int = BULK_BATCH_SIZE) -> List[ [[ entity_name|capitalize_first ]]Entity ]:
+        """
+        Aplica cambios a varios registros existentes leyéndolos una sola vez.
+
+        Como update_by_id para varios registros: dentro de una transacción lee los registros
+        bloqueándolos (SELECT ... FOR UPDATE, una consulta por lote), construye las entidades con
+        sus columnas, aplica las reglas de dominio (entity.update(changes)) y guarda solo las
+        columnas que cambiaron con bulk_update por lotes. Sustituye a get_by_ids() + bulk_update(),
+        que leen los mismos registros dos veces.
+
+        params:
+            items: Lista de diccionarios con los cambios de cada registro (deben traer el "id").
+            relations: Lista de IDs relacionados por registro, en el mismo orden (None = no se modifican).
+            batch_size: Registros por consulta.
+        returns:
+            Las entidades guardadas, en el mismo orden.
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            NotFoundError: Si no existe alguno de los registros.
+            ValidationError: Si algún registro no es válido o choca con otro (errors: lista con el índice y el error de cada uno).
+            AlreadyExistsError: Si algún registro viola una restricción de unicidad y no se puede localizar cuál.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not isinstance(items, (list, tuple)) or not all(isinstance(data, dict) and is_integer(data.get("id")) for data in items):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="items", detail="items must be a list of dictionaries with an integer id.")
+        if relations is not None and (not isinstance(relations, (list, tuple)) or len(relations) != len(items)):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="relations", detail="relations must be a list with one item (or None) per entity")
+        if not is_integer(batch_size) or int(batch_size) <= 0:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="batch_size", detail="batch_size must be a positive integer.")
+
+        ids = list(dict.fromkeys(int(data["id"]) for data in items))
+        batch_size = int(batch_size)
+        instances = []
+
+        try:
+            with transaction.atomic():
+                # Una sola lectura por lote, con los registros bloqueados hasta el final de la transacción
+                existing = {}
+                for start in range(0, len(ids), batch_size):
+                    existing.update([[ entity_name|capitalize_first ]].objects.select_for_update().in_bulk(ids[start:start + batch_size]))
+                missing = [data["id"] for data in items if int(data["id"]) not in existing]
+                if missing:
+                    raise NotFoundError(id=missing)
+
+                # Entidades con las columnas ya leídas, reglas de dominio y validación (sin consultas)
+                column_fields = Mapper.column_fields([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity)
+                errors = []
+                changed_fields = set()
+                for index, data in enumerate(items):
+                    instance = existing[int(data["id"])]
+                    entity = Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity, column_fields)
+                    try:
+                        entity.update(data)
+                    except [[ entity_name|capitalize_first ]]ValueError as e:
+                        errors.append({"index": index, "error": str(e)})
+                        continue
+
+                    changes = entity.to_orm_dict_for_changes()
+                    Mapper.update_model_from_entity_dict(instance, changes)
+                    try:
+                        [[ entity_name|capitalize_first ]]Repository._full_clean(instance, index)
+                    except ValidationError as e:
+                        errors.extend(e.errors)
+                    changed_fields.update(changes)
+                    instances.append(instance)
+
+                if errors:
+                    raise ValidationError(errors)
+
+                update_fields = [[ entity_name|capitalize_first ]]Repository._bulk_update_fields(changed_fields, instances) if changed_fields else []
+                if update_fields:
+                    [[ entity_name|capitalize_first ]].objects.bulk_update(instances, update_fields, batch_size=batch_size)
+
+                # Reemplazar las relaciones Many-to-Many indicadas
+                if relations is not None:
+                    [[ entity_name|capitalize_first ]]Repository._bulk_set_relations(instances, relations, batch_size, replace=True)
+
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(*ids)
+
+            # Leer las relaciones (ya actualizadas) de todas las instancias con una consulta por relación
+            prefetch_related_objects(instances, *Mapper.related_prefetches([[ entity_name|capitalize_first ]], [[ entity_name|capitalize_first ]]Entity))
+
+        except (NotFoundError, ValidationError, [[ entity_name|capitalize_first ]]ValueError):
+            raise
+        except (TypeError, ValueError) as e:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail=f"Error in the data structure: {str(e)}") from e
+        except IntegrityError as e:
+            raise [[ entity_name|capitalize_first ]]Repository._bulk_integrity_error(e, instances, relations) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error updating registers: {str(e)}") from e
+
+        return [Mapper.model_to_entity(instance, [[ entity_name|capitalize_first ]]Entity) for instance in instances]
+
+
+    @staticmethod
+    def delete_many(ids: List[int], batch_size: int = BULK_BATCH_SIZE) -> List[int]:
+        """
+        Elimina varios registros por sus IDs en una sola transacción (un SELECT de los IDs
+        existentes y un DELETE por lote de IDs).
+
+        params:
+            ids: IDs de los registros a eliminar.
+            batch_size: IDs por consulta.
+        returns:
+            IDs de los registros eliminados (los IDs que no existen se ignoran).
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            ValidationError: Si algún registro no se puede eliminar (ej: está protegido por otra relación).
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        if not isinstance(ids, (list, tuple, set)) or not all(is_integer(id) for id in ids):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="ids", detail="ids must be a list of integers.")
+        if not is_integer(batch_size) or int(batch_size) <= 0:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="batch_size", detail="batch_size must be a positive integer.")
+
+        ids = sorted({int(id) for id in ids})
+        batch_size = int(batch_size)
+        deleted = []
+
+        try:
+            with transaction.atomic():
+                for start in range(0, len(ids), batch_size):
+                    found = list([[ entity_name|capitalize_first ]].objects.filter(id__in=ids[start:start + batch_size]).values_list("id", flat=True))
+                    [[ entity_name|capitalize_first ]].objects.filter(id__in=found).delete()
+                    deleted.extend(found)
+
+                [[ entity_name|capitalize_first ]]Repository.cache.invalidate(*deleted)
+
+        except IntegrityError as e:
+            raise ValidationError({"integrity": "Some registers can not be deleted"}) from e
+        except DatabaseError as e:
+            raise ConnectionDataBaseError("Data base access error") from e
+        except Exception as e:
+            raise RepositoryError(f"Error deleting registers: {str(e)}") from e
+
+        return deleted
+
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """
+        Estadísticas de la caché de lectura en este proceso.
+
+        returns:
+            dict: {"enabled", "hits", "misses", "hit_rate"}
+        """
+        return [[ entity_name|capitalize_first ]]Repository.cache.stats()
+
+
+    @staticmethod
+    def _validate_bulk_input(entities, relations, batch_size):
+        """Valida los argumentos comunes de las operaciones masivas"""
+
+        if not isinstance(entities, (list, tuple)) or not all(entity and hasattr(entity, "to_dict") for entity in entities):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="entities", detail="entities must be a list of entities with method 'to_dict'")
+        if relations is not None and (not isinstance(relations, (list, tuple)) or len(relations) != len(entities)):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="relations", detail="relations must be a list with one item (or None) per entity")
+        if not is_integer(batch_size) or int(batch_size) <= 0:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="batch_size", detail="batch_size must be a positive integer.")
+
+
+    @staticmethod
+    def _full_clean(instance, index: Optional[int] = None):
+        """
+        Validaciones del modelo sin consultas: la unicidad, las restricciones y la existencia de las
+        claves foráneas (consultas en full_clean) las comprueba la base de datos al guardar.
+        """
+
+        foreign_keys = [field.name for field in instance._meta.concrete_fields if field.is_relation]
+
+        try:
+            instance.full_clean(exclude=foreign_keys, validate_unique=False, validate_constraints=False)
+        except DjangoValidationError as e:
+            error_detail = extract_validation_error(e)
+            if index is not None:
+                # Operaciones masivas: error por elemento, con su posición en la lista
+                raise ValidationError([{"index": index, "error": f"Validation error: {error_detail}"}]) from e
+            raise ValidationError(f"Validation error: {error_detail}") from e
+
+
+    @staticmethod
+    def _invalidate_cache(id=None, uuid=None):
+        """Quita de la caché la entidad por su id o, si solo se conoce el uuid, por la referencia uuid -> id"""
+
+        if id is not None:
+            [[ entity_name|capitalize_first ]]Repository.cache.invalidate(int(id))
+        else:
+            [[ entity_name|capitalize_first ]]Repository.cache.invalidate_uuid(uuid)
+
+
+    @staticmethod
+    def _save_changes(instance, changes: Optional[dict]):
+        """
+        Valida y guarda una instancia existente.
+
+        Con `changes` (campos que cambiaron en la entidad) solo se validan y escriben esas columnas,
+        más las auto_now (ej: updated_at); si no cambió ninguna columna no se ejecuta el UPDATE.
+        Con changes=None se valida y guarda el registro completo.
+        La unicidad la comprueba la base de datos al guardar (IntegrityError -> AlreadyExistsError).
+        """
+
+        if changes is None:
+            instance.full_clean(validate_unique=False, validate_constraints=False)
+            instance.save()
+            return
+
+        concrete = {}
+        for field in instance._meta.concrete_fields:
+            concrete[field.name] = field
+            concrete[field.attname] = field
+
+        changed = {concrete[name].name for name in changes if name in concrete and not concrete[name].primary_key}
+        if not changed:
+            return
+
+        instance.full_clean(
+            exclude=[field.name for field in instance._meta.concrete_fields if field.name not in changed],
+            validate_unique=False,
+            validate_constraints=False,
+        )
+        instance.save(update_fields=[[ entity_name|capitalize_first ]]Repository._bulk_update_fields(changed, [instance]))
+
+
+    @staticmethod
+    def _unique_field_sets() -> List[Tuple[str, ...]]:
+        """Grupos de campos con restricción única en la base de datos (unique=True, unique_together, UniqueConstraint sin condición)"""
+
+        model_meta = [[ entity_name|capitalize_first ]]._meta
+        field_sets = [(field.name,) for field in model_meta.concrete_fields if field.unique]
+        field_sets += [tuple(fields) for fields in model_meta.unique_together]
+        field_sets += [
+            tuple(constraint.fields) for constraint in model_meta.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.fields and constraint.condition is None
+        ]
+        return field_sets
+
+
+    @staticmethod
+    def _validate_conflict_fields(conflict_fields) -> List[str]:
+        """Valida que conflict_fields sea un grupo de campos con restricción única"""
+
+        if isinstance(conflict_fields, str):
+            conflict_fields = [conflict_fields]
+        if not conflict_fields or set(conflict_fields) not in [set(fields) for fields in [[ entity_name|capitalize_first ]]Repository._unique_field_sets()]:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="conflict_fields", detail="conflict_fields must match a unique field or a unique constraint of the model.")
+        return list(conflict_fields)
+
+
+    @staticmethod
+    def _conflict_lookup(instance, conflict_fields: List[str]) -> dict:
+        """Filtro por los valores de conflict_fields de la instancia"""
+
+        return {field.attname: getattr(instance, field.attname) for field in (instance._meta.get_field(name) for name in conflict_fields)}
+
+
+    @staticmethod
+    def _integrity_error(error: IntegrityError, instance=None) -> Exception:
+        """
+        Traduce un IntegrityError a la excepción del repositorio sin consultar la base de datos.
+
+        Una violación de unicidad es AlreadyExistsError con el campo afectado, que se busca
+        por su columna en el mensaje del motor (PostgreSQL, SQLite y MySQL la incluyen).
+        Cualquier otra (clave foránea inexistente, NOT NULL...) es ValidationError.
+        """
+
+        message = str(error)
+        if "unique" not in message.lower() and "duplicate" not in message.lower():
+            return ValidationError({"integrity": "Duplicated or inconsistent data"})
+
+        model_meta = [[ entity_name|capitalize_first ]]._meta
+
+        def mentioned(name):
+            return re.search(rf"(?<!\w){re.escape(model_meta.get_field(name).column)}(?!\w)", message) is not None
+
+        # El grupo de campos más específico cuyas columnas aparecen todas en el mensaje
+        matches = [fields for fields in [[ entity_name|capitalize_first ]]Repository._unique_field_sets() if all(mentioned(name) for name in fields)]
+        if not matches:
+            return AlreadyExistsError(detail=message)
+
+        fields = max(matches, key=len)
+        detail = message
+        if instance is not None:
+            detail = ", ".join(str(getattr(instance, model_meta.get_field(name).attname)) for name in fields)
+        return AlreadyExistsError(field=", ".join(fields), detail=detail)
+
+
+    @staticmethod
+    def _bulk_integrity_error(error: IntegrityError, instances, relations=None) -> Exception:
+        """
+        Traduce el IntegrityError de una operación masiva, que no indica qué registro lo causó.
+
+        Busca los registros del lote que chocan en un campo único (con otro registro anterior del
+        lote o con una fila que no está en el lote) o que apuntan a un registro relacionado que no
+        existe, con una consulta por grupo de campos únicos, clave foránea y relación (por lotes).
+        Si los encuentra devuelve ValidationError con el índice y el error de cada uno; si no,
+        la traducción de _integrity_error.
+        """
+
+        model_meta = [[ entity_name|capitalize_first ]]._meta
+        batch_pks = [instance.pk for instance in instances if instance.pk is not None]
+        errors = {}
+
+        try:
+            # Unicidad: duplicados dentro del lote y filas existentes fuera del lote
+            for names in [[ entity_name|capitalize_first ]]Repository._unique_field_sets():
+                columns = [model_meta.get_field(name).attname for name in names]
+                first = {}
+                for index, instance in enumerate(instances):
+                    key = tuple(getattr(instance, column) for column in columns)
+                    if None in key:
+                        continue  # NULL no choca en una restricción única
+                    if key in first:
+                        errors.setdefault(index, f"Duplicated {', '.join(names)}: same value as item {first[key]}.")
+                    else:
+                        first[key] = index
+
+                # Un solo campo: columna IN (...); varios: (a = x AND b = y) OR ..., en lotes más pequeños
+                keys = list(first)
+                step = BULK_BATCH_SIZE if len(columns) == 1 else 100
+                for start in range(0, len(keys), step):
+                    chunk = keys[start:start + step]
+                    if len(columns) == 1:
+                        lookup = Q(**{f"{columns[0]}__in": [key[0] for key in chunk]})
+                    else:
+                        lookup = Q()
+                        for key in chunk:
+                            lookup |= Q(**dict(zip(columns, key)))
+                    for key in [[ entity_name|capitalize_first ]].objects.filter(lookup).exclude(pk__in=batch_pks).values_list(*columns):
+                        if tuple(key) in first:
+                            errors.setdefault(first[tuple(key)], f"A register with the same {', '.join(names)} already exists.")
+
+            # Claves foráneas y relaciones Many-to-Many que apuntan a registros inexistentes
+            references = [
+                (field.name, field.related_model, [getattr(instance, field.attname) for instance in instances])
+                for field in model_meta.concrete_fields if field.is_relation
+            ]
+            if relations is not None:
+                references.append(("relations", model_meta.get_field("relations").related_model, relations))
+
+            for name, related_model, values in references:
+                expected = [value if isinstance(value, (list, tuple, set)) else [value] for value in values]
+                ids = list({id for item_ids in expected if item_ids for id in item_ids if id is not None})
+                found = set()
+                for start in range(0, len(ids), BULK_BATCH_SIZE):
+                    found.update(str(pk) for pk in related_model._default_manager.filter(pk__in=ids[start:start + BULK_BATCH_SIZE]).values_list("pk", flat=True))
+                for index, item_ids in enumerate(expected):
+                    missing = [id for id in item_ids or [] if id is not None and str(id) not in found]
+                    if missing:
+                        errors.setdefault(index, f"{name}: related registers {missing} do not exist.")
+
+        except (DatabaseError, TypeError, ValueError):
+            errors = {}
+
+        if errors:
+            return ValidationError([{"index": index, "error": detail} for index, detail in sorted(errors.items())])
+        return [[ entity_name|capitalize_first ]]Repository._integrity_error(error)
+
+
+    @staticmethod
+    def _bulk_update_fields(field_names, instances) -> List[str]:
+        """
+        Campos concretos del modelo que se guardan con bulk_update.
+
+        Se ignoran los identificadores, las relaciones Many-to-Many y los campos que no son del modelo.
+        bulk_update no llama a save(): los campos auto_now (ej: updated_at) se actualizan aquí.
+        """
+
+        concrete = {}
+        for field in [[ entity_name|capitalize_first ]]._meta.concrete_fields:
+            concrete[field.name] = field
+            concrete[field.attname] = field
+
+        update_fields = {
+            concrete[name].name for name in field_names
+            if name in concrete and not concrete[name].primary_key and name != "uuid"
+        }
+
+        for field in [[ entity_name|capitalize_first ]]._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                for instance in instances:
+                    field.pre_save(instance, add=False)
+                update_fields.add(field.name)
+
+        return sorted(update_fields)
+
+
+    @staticmethod
+    def _bulk_set_relations(instances, relations, batch_size: int, replace: bool = False):
+        """
+        Asigna las relaciones Many-to-Many `relations` de varias instancias insertando por lotes
+        en la tabla intermedia (una consulta por lote en lugar de un relations.set() por instancia).
+
+        params:
+            instances: Instancias ya guardadas (con id).
+            relations: Lista de IDs relacionados por instancia, en el mismo orden (None = no se modifican).
+            replace: Si es True, primero se eliminan las relaciones actuales de esas instancias.
+        """
+
+        pairs = [
+            (instance, related_ids)
+            for instance, related_ids in zip(instances, relations)
+            if related_ids is not None
+        ]
+        if not pairs:
+            return
+        if any(instance.pk is None for instance, _ in pairs):
+            raise RepositoryError("The database did not return the ids of the created registers; relations can not be assigned in bulk")
+
+        relation_field = [[ entity_name|capitalize_first ]]._meta.get_field("relations")
+        through = relation_field.remote_field.through
+        source = relation_field.m2m_field_name() + "_id"
+        target = relation_field.m2m_reverse_field_name() + "_id"
+
+        if replace:
+            through.objects.filter(**{f"{source}__in": [instance.pk for instance, _ in pairs]}).delete()
+
+        rows = [
+            through(**{source: instance.pk, target: related_id})
+            for instance, related_ids in pairs
+            for related_id in dict.fromkeys(related_ids)
+        ]
+        through.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+
+
 '''
 En Django ORM los campos de relación se definen como ForeignKey, ManyToManyField o OneToOneField.
 Para la traduccion de relaciones entre entidades, se pueden utilizar los siguientes campos:
@@ -466,19 +1736,23 @@ Por eso, es valioso **enriquecerlo estratégicamente**, manteniendo la coherenci
     Así mantienes el diseño actual, pero con mejor rendimiento y expresividad.
 
 #### 3. 📦 **Paginación + optimización de consultas**
-    La plantilla ya usa `.only()` para optimizar carga. Puedes extenderlo con paginación:
+    La plantilla ya incluye `get_page()`: paginación por cursor (keyset) que solo carga las columnas de la entidad
+    (`Mapper.load_fields`) o de una proyección declarada en `Meta.projections` (ej: `projection="list"`).
+    Evita la paginación por OFFSET en tablas grandes: la base de datos recorre y descarta
+    todas las filas anteriores a la página, y el coste crece con el número de página.
 
-        @staticmethod
-        def get_paginated(page: int, size: int, filters=None):
-            offset = (page - 1) * size
-            limit = offset + size
-            instance_list = [[ entity_name|capitalize_first ]].objects.all()
-            if filters and "nombre" in filters:
-                instance_list = instance_list.filter(nombre__icontains=filters["nombre"])
-            instance_list = instance_list.only("id", "nombre", "created_at")[offset:limit]
-            return [Mapper.model_to_entity(inst, [[ entity_name|capitalize_first ]]Entity) for inst in instance_list]
+        entities, next_cursor = [[ entity_name|capitalize_first ]]Repository.get_page(limit=50, order_by="-created_at")
+        siguiente, _ = [[ entity_name|capitalize_first ]]Repository.get_page(cursor=next_cursor, limit=50, order_by="-created_at")
+
+    Para ordenar por un campo nuevo, agrégalo a `ORDERING_FIELDS` y crea un índice compuesto con el id:
+        class Meta:
+            indexes = [models.Index(fields=["nombre", "id"])]
+
+    Si el cliente necesita el total, evita un COUNT(*) exacto por página en tablas grandes (`count_all(mode=...)`):
+    "windowed" lo calcula con la primera página (`get_page(with_total=True)`) y lo lleva en el cursor,
+    "cached" lo guarda `COUNT_CACHE_TIMEOUT` segundos y "estimated" usa las estadísticas de PostgreSQL.
 
-    Ideal para APIs o listados grandes.
+        entities, next_cursor, total = [[ entity_name|capitalize_first ]]Repository.get_page(limit=50, with_total=True)
 
 #### 4. 🔄 **Separación de lectura y escritura (CQRS básico)**
     Aunque la plantilla combina lectura y escritura, puedes dividirla cuando el sistema escala:
@@ -513,7 +1787,9 @@ Por eso, es valioso **enriquecerlo estratégicamente**, manteniendo la coherenci
     Así mantienes el mapeo y la coherencia del dominio.
 
 #### 6. **Uso de `select_related` y `prefetch_related`**
-    La plantilla no los usa aún, pero son fáciles de integrar en `get_all()` o nuevos métodos:
+    Los listados de la plantilla ya cargan con `prefetch_related` las relaciones Many-to-Many / reverse FK
+    que declara la entidad (`Mapper.related_prefetches`) y el Mapper las lee del caché del prefetch.
+    Para cargar también las ForeignKey o relaciones adicionales en nuevos métodos:
 
         @staticmethod
         def get_all_with_relations():
@@ -555,7 +1831,7 @@ Por eso, es valioso **enriquecerlo estratégicamente**, manteniendo la coherenci
         def get_all(filters=None) -> List[[ entity_name|capitalize_first ]]Entity:
             """
             Obtiene todos los [[ entity_name|decapitalize_first ]] que coincidan con los filtros.
-            Usa `.only()` para optimizar rendimiento.
+            Solo carga las columnas de la entidad (`.only(*Mapper.load_fields(...))`).
             :param filters: Diccionario con filtros (ej. {"nombre": "juan"}).
             :return: Lista de entidades [[ entity_name|capitalize_first ]].
             """
@@ -10,9 +10,11 @@ from decimal import Decimal
 from enum import Enum
 from datetime import datetime, date
 from dataclasses import asdict, fields
-from typing import Type, TypeVar, Any
+from operator import attrgetter
+from typing import Type, TypeVar, Any, Optional
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
-from django.db.models import JSONField, ManyToManyField, ForeignKey
+from django.db.models import JSONField, ManyToManyField, ForeignKey, Prefetch
 
 from ..domain.[[ entity_name.lower() ]]_exceptions import [[ entity_name|capitalize_first ]]ValueError
 
@@ -45,75 +47,327 @@ def make_json_safe(value):
     else:
         return value            
 
+def _related_pks(model_instance, manager) -> list:
+    """
+    IDs de una relación Many-to-Many / reverse FK.
+
+    Si la relación se cargó con prefetch_related (ver Mapper.related_prefetches) se leen del
+    caché del prefetch, sin consultas; si no, se obtienen con una consulta values_list.
+    """
+    cache = getattr(model_instance, '_prefetched_objects_cache', {})
+    prefetched = cache.get(getattr(manager, 'prefetch_cache_name', None))
+    if prefetched is not None:
+        return [related.pk for related in prefetched]
+    return list(manager.values_list('pk', flat=True))
+
+
+# Planes de conversión modelo → entidad por (clase de modelo, clase de entidad), ver Mapper.field_plan
+_field_plans = {}
+
+# Planes de lectura desde values_list por (clase de modelo, clase de entidad), ver Mapper.values_plan
+_values_plans = {}
+
+
+def _convert_value(model_instance, value):
+    """Conversión según el tipo del valor, para atributos que no son campos del modelo (ej: propiedades o anotaciones)"""
+    if isinstance(value, models.Manager):
+        return _related_pks(model_instance, value)
+    if isinstance(value, (uuid.UUID, datetime, date, time, dict, list)):
+        return value
+    if hasattr(value, 'pk'):
+        return value.pk if value else None
+    return value
+
+
+def _file_value(model_instance, value):
+    """FileField / ImageField → {"file_name", "url"} o None"""
+    try:
+        if value and value.name and value.url:
+            return {"file_name": value.name, "url": value.url} # Esto lanza una excepción si el archivo no existe
+        return None
+    except ValueError:
+        return None
+
+
+def _relation_fields(model_class) -> dict:
+    """Relaciones Many-to-Many / reverse FK del modelo por nombre de acceso (las inversas por su accessor, ej: related_entities)"""
+    relations = {}
+    for field in model_class._meta.get_fields():
+        if field.many_to_many or field.one_to_many:
+            name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+            relations[name] = field
+    return relations
+
+
+def _prefetch_cache_name(field) -> str:
+    """Clave con la que prefetch_related guarda la relación en _prefetched_objects_cache"""
+    if not field.auto_created:
+        return field.name
+    if field.many_to_many:
+        return field.field.related_query_name()
+    return field.get_accessor_name()
+
+
+def _related_getter(name, cache_name):
+    """IDs de la relación leídos directamente del caché de prefetch_related, sin crear el manager en cada fila"""
+    def get(model_instance):
+        cache = getattr(model_instance, '_prefetched_objects_cache', None)
+        if cache and cache_name in cache:
+            return [related.pk for related in cache[cache_name]]
+        return _related_pks(model_instance, getattr(model_instance, name))
+    return get
+
+
+def _build_field_plan(model_class, entity_class, field_names=None) -> tuple:
+    """Decide una vez, con los metadatos del modelo, de dónde se lee y cómo se convierte cada campo de la entidad"""
+    relations = _relation_fields(model_class)
+
+    plan = []
+    for entity_field in fields(entity_class):
+        name = entity_field.name
+        if field_names is not None and name not in field_names:
+            continue
+
+        try:
+            field_object = model_class._meta.get_field(name)
+        except FieldDoesNotExist:
+            field_object = None
+
+        # ManyToMany o reverse FK (del caché de prefetch_related si se cargó)
+        if name in relations:
+            plan.append((name, _related_getter(name, _prefetch_cache_name(relations[name])), None, False))
+
+        # Propiedades, anotaciones, reverse OneToOne...: pueden no existir en la instancia
+        elif field_object is None or not field_object.concrete:
+            plan.append((name, attrgetter(name), _convert_value, True))
+
+        # FileField / ImageField
+        elif isinstance(field_object, models.FileField):
+            plan.append((name, attrgetter(name), _file_value, False))
+
+        # ForeignKey / OneToOne: se lee la columna (related_id) sin cargar el objeto relacionado
+        elif field_object.is_relation and field_object.target_field.primary_key:
+            plan.append((name, attrgetter(field_object.attname), None, False))
+        elif field_object.is_relation:
+            plan.append((name, attrgetter(name), _convert_value, False))
+
+        # UUID, fechas, JSON y demás tipos (CharField, IntegerField, BooleanField, etc.) se dejan tal cual
+        else:
+            plan.append((name, attrgetter(name), None, False))
+
+    return tuple(plan)
+
+
+def _file_from_name(storage):
+    """FileField / ImageField leído con values_list (solo el nombre del archivo) → {"file_name", "url"} o None"""
+    def convert(model_instance, value):
+        if not value:
+            return None
+        try:
+            return {"file_name": value, "url": storage.url(value)}
+        except ValueError:
+            return None
+    return convert
+
+
+def _build_values_plan(model_class, entity_class, field_names=None) -> tuple:
+    """Columnas de values_list, campos del modelo para only() y, por campo de la entidad, su posición en la fila y su conversión"""
+    relations = _relation_fields(model_class)
+
+    columns, values, related, load_fields = ['pk'], [], [], []
+    for entity_field in fields(entity_class):
+        name = entity_field.name
+        if field_names is not None and name not in field_names:
+            continue
+
+        # ManyToMany o reverse FK: se cargan aparte (ver _related_ids)
+        if name in relations:
+            related.append((name, relations[name].name))
+            continue
+
+        try:
+            field_object = model_class._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+
+        # Propiedades, anotaciones, reverse OneToOne...: no son columnas
+        if not field_object.concrete:
+            continue
+
+        if isinstance(field_object, models.FileField):
+            column, convert = field_object.attname, _file_from_name(field_object.storage)
+        elif field_object.is_relation and not field_object.target_field.primary_key:
+            column, convert = f"{field_object.name}__pk", None
+        else:
+            column, convert = field_object.attname, None
+
+        if column not in columns:
+            columns.append(column)
+        if field_object.name not in load_fields:
+            load_fields.append(field_object.name)
+        values.append((name, columns.index(column), convert))
+
+    return tuple(columns), tuple(values), tuple(related), tuple(load_fields)
+
+
+def _related_ids(model_class, related, pks) -> dict:
+    """IDs de cada relación por fila, {campo: {pk: [ids]}}: una consulta por relación para todas las filas"""
+    result = {}
+    for field_name, lookup in related:
+        ids = {}
+        rows = model_class._default_manager.filter(pk__in=pks).order_by().values_list('pk', lookup)
+        for pk, related_pk in rows:
+            if related_pk is not None:
+                ids.setdefault(pk, []).append(related_pk)
+        result[field_name] = ids
+    return result
+
+
 class Mapper:
     
     @staticmethod
-    def model_to_entity(model_instance: models.Model, entity_class: Type[T]) -> T:
-        """Convierte modelo Django → entidad Dataclass con validación de tipos y manejo especial de campos."""
+    def model_to_entity(model_instance: models.Model, entity_class: Type[T], field_names: Optional[frozenset] = None) -> T:
+        """
+        Convierte modelo Django → entidad Dataclass con validación de tipos y manejo especial de campos.
+
+        Con field_names (ver Mapper.projection_fields) solo se leen esos campos; el resto queda con su valor por defecto.
+        """
 
         if not model_instance:
             raise [[ entity_name|capitalize_first ]]ValueError("Model_instance_cannot_be_None_Cannot_convert_None_to_entity")
 
-        entity_field_names = {f.name for f in fields(entity_class)}
-
         data = {}
-        for field_name in entity_field_names:
-            if not hasattr(model_instance, field_name):
-                continue
-            
-            try:
-                value = getattr(model_instance, field_name)
-            except AttributeError:
-                continue
-            
-            #mostrar el tipo de campo
-            field_object = model_instance._meta.get_field(field_name)
-
-            # Manejo especial para diferentes tipos de campo
-
-            # Para relaciones ManyToMany o reverse FK
-            if isinstance(value, models.Manager):
-                value = list(value.values_list('pk', flat=True)) if value else []
-
-            # UUIDField
-            elif isinstance(value, uuid.UUID):
-                # Dejar tal cual; que la entidad lo maneje
-                pass
-
-            # DateField / DateTimeField / TimeField
-            elif isinstance(value, (datetime, date, time)):
-                # Dejar tal cual; que la entidad lo maneje
-                pass 
-
-            # JSONField
-            elif isinstance(value, dict) or isinstance(value, list):
-                # JSONField ya devuelve dict/list, dejar intacto
-                pass
-                
-            # FileField / ImageField
-            elif isinstance(field_object, (models.FileField, models.ImageField)):
+        for field_name, get, convert, optional in Mapper.field_plan(type(model_instance), entity_class, field_names):
+            if optional:
                 try:
-                    if value and value.name and value.url:
-                        value = {"file_name": value.name, "url": value.url} # Esto lanza una excepción si el archivo no existe
-                    else:
-                        value = None
-                except ValueError:
-                    value = None
-
-            # ForeignKey / OneToOne
-            elif hasattr(value, 'pk'):
-                # Es una relación ForeignKey/OneToOne -> extraer ID
-                value = value.pk if value else None
-
-            # Otros tipos (CharField, IntegerField, BooleanField, etc.) se dejan tal cual
+                    value = get(model_instance)
+                except AttributeError:
+                    continue
             else:
-                pass
+                value = get(model_instance)
 
-            # Añadir al diccionario solo si es válido
-            data[field_name] = value
+            data[field_name] = convert(model_instance, value) if convert else value
 
         return entity_class(**data)
+
+    @staticmethod
+    def field_plan(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Plan de conversión modelo → entidad: (campo, lectura, conversión, opcional) por campo de la entidad.
+
+        Se calcula una vez por pareja (modelo, entidad) y queda en caché, así model_to_entity no vuelve a
+        inspeccionar los campos de la entidad ni los metadatos del modelo en cada fila.
+        """
+        key = (model_class, entity_class, field_names)
+        plan = _field_plans.get(key)
+        if plan is None:
+            plan = _field_plans[key] = _build_field_plan(model_class, entity_class, field_names)
+        return plan
+
+    @staticmethod
+    def values_plan(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Plan de lectura por columnas: (columnas de values_list, [(campo, posición, conversión)],
+        [(campo, lookup de la relación)], campos del modelo para only()).
+
+        Como field_plan, se calcula una vez por (modelo, entidad, campos) y queda en caché.
+        """
+        key = (model_class, entity_class, field_names)
+        plan = _values_plans.get(key)
+        if plan is None:
+            plan = _values_plans[key] = _build_values_plan(model_class, entity_class, field_names)
+        return plan
+
+    @staticmethod
+    def values_columns(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """Columnas que hay que pedir con queryset.values_list(...) para Mapper.rows_to_entities (la primera es la pk)"""
+        return Mapper.values_plan(model_class, entity_class, field_names)[0]
+
+    @staticmethod
+    def load_fields(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Campos del modelo que hay que cargar con queryset.only(...) para model_to_entity.
+
+        Se derivan de los campos de la entidad que son columnas del modelo (las relaciones Many-to-Many /
+        reverse FK van aparte con related_prefetches), así el mapper nunca toca un campo diferido:
+        sin esta lista, cada campo que faltara en only() costaría una consulta por fila.
+        """
+        return Mapper.values_plan(model_class, entity_class, field_names)[3]
+
+    @staticmethod
+    def projection_fields(entity_class, projection: Optional[str] = None) -> Optional[frozenset]:
+        """
+        Campos de la proyección declarada en Meta.projections de la entidad (ej: "list").
+
+        Incluye siempre Meta.required_fields (la entidad no se puede construir sin ellos).
+        Devuelve None (todos los campos) si no se pide proyección o la entidad no la declara.
+        """
+        meta = getattr(entity_class, 'Meta', None)
+        field_names = (getattr(meta, 'projections', None) or {}).get(projection) if projection else None
+        if field_names is None:
+            return None
+        return frozenset(field_names) | frozenset(getattr(meta, 'required_fields', ()))
+
+    @staticmethod
+    def rows_to_entities(model_class, entity_class: Type[T], rows, field_names: Optional[frozenset] = None) -> list:
+        """
+        Convierte filas de queryset.values_list(*Mapper.values_columns(Model, Entity, field_names)) → entidades, sin instanciar el modelo.
+
+        Ruta de solo lectura para listados: se evitan el __init__ del modelo, las señales y los descriptores.
+        - Las relaciones Many-to-Many / reverse FK se cargan con una consulta por relación para todas las filas.
+        - Los campos de la entidad que no son columnas (propiedades, anotaciones...) quedan con su valor por defecto.
+        - Las filas pueden traer columnas adicionales al final (ej: el campo de orden del cursor).
+        """
+        columns, values, related, load_fields = Mapper.values_plan(model_class, entity_class, field_names)
+        related_ids = _related_ids(model_class, related, [row[0] for row in rows]) if related and rows else {}
+
+        entities = []
+        for row in rows:
+            data = {}
+            for field_name, index, convert in values:
+                value = row[index]
+                # Sin instancia del modelo: las conversiones solo dependen del valor
+                data[field_name] = convert(None, value) if convert else value
+            for field_name, ids in related_ids.items():
+                data[field_name] = ids.get(row[0], [])
+            entities.append(entity_class(**data))
+
+        return entities
     
+    @staticmethod
+    def related_prefetches(model_class, entity_class, field_names: Optional[frozenset] = None) -> list:
+        """
+        Prefetch de las relaciones Many-to-Many / reverse FK del modelo que declara la entidad.
+
+        Con queryset.prefetch_related(*Mapper.related_prefetches(Model, Entity)) un listado de N
+        entidades hace una consulta por relación en lugar de una por relación y fila (N+1).
+        Solo se cargan los IDs, que es lo que model_to_entity guarda en la entidad.
+        """
+        entity_field_names = {f.name for f in fields(entity_class) if field_names is None or f.name in field_names}
+
+        prefetches = []
+        for name, field in _relation_fields(model_class).items():
+            if name not in entity_field_names:
+                continue
+
+            # En una reverse FK hace falta la clave foránea para repartir las filas entre las instancias
+            remote_field = getattr(field, 'field', None)
+            columns = ['pk', remote_field.attname] if field.one_to_many and remote_field is not None else ['pk']
+            prefetches.append(Prefetch(name, queryset=field.related_model._default_manager.only(*columns)))
+
+        return prefetches
+
+    @staticmethod
+    def column_fields(model_class, entity_class) -> frozenset:
+        """
+        Campos de la entidad que no son relaciones Many-to-Many / reverse FK.
+
+        Con model_to_entity(instance, Entity, Mapper.column_fields(Model, Entity)) la entidad se
+        construye solo con las columnas ya cargadas en la instancia, sin consultas adicionales.
+        """
+        relations = _relation_fields(model_class)
+        return frozenset(f.name for f in fields(entity_class) if f.name not in relations)
+
     @staticmethod
     def update_model_from_entity_dict(instance, entity_dict, excluded_fields=None):
         """
@@ -185,7 +439,7 @@ class Mapper:
                 value = getattr(model_instance, field.name)
                 
                 if isinstance(field, models.ManyToManyField):
-                    data[field.name] = list(value.values_list('pk', flat=True))
+                    data[field.name] = _related_pks(model_instance, value)
                 elif isinstance(field, models.ForeignKey) and value:
                     data[field.name] = value.pk
                 elif isinstance(value, uuid.UUID):
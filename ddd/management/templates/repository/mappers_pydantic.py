@@ -7,10 +7,12 @@ import datetime
 from uuid import UUID
 from decimal import Decimal
 from enum import Enum
-from typing import Type, TypeVar, Any, Union, get_origin, get_args, Annotated
+from operator import attrgetter
+from typing import Type, TypeVar, Any, Optional, Union, get_origin, get_args, Annotated
 from pydantic import BaseModel
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
-from django.db.models import JSONField, ManyToManyField, ForeignKey
+from django.db.models import JSONField, ManyToManyField, ForeignKey, Prefetch
 
 from ..domain.[[ entity_name.lower() ]]_exceptions import [[ entity_name|capitalize_first ]]ValueError
 from ..domain.[[ entity_name.lower() ]]_schemas import FileData
@@ -68,70 +70,389 @@ def _expects_date(annotation):
     ann = _unwrap(annotation)
     return ann is datetime.date
 
+def _related_pks(model_instance, manager) -> list:
+    """
+    IDs de una relación Many-to-Many / reverse FK.
+
+    Si la relación se cargó con prefetch_related (ver Mapper.related_prefetches) se leen del
+    caché del prefetch, sin consultas; si no, se obtienen con una consulta values_list.
+    """
+    cache = getattr(model_instance, '_prefetched_objects_cache', {})
+    prefetched = cache.get(getattr(manager, 'prefetch_cache_name', None))
+    if prefetched is not None:
+        return [related.pk for related in prefetched]
+    return list(manager.values_list('pk', flat=True))
+
+
+# Planes de conversión modelo → entidad por (clase de modelo, clase de entidad), ver Mapper.field_plan
+_field_plans = {}
+
+# Planes de lectura desde values_list por (clase de modelo, clase de entidad), ver Mapper.values_plan
+_values_plans = {}
+
+
+def _submodel(annotation):
+    """Clase del submodelo Pydantic si el campo de la Entity es uno (None si no)"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _value_converter(annotation):
+    """Conversión según el tipo del valor, para atributos que no son campos del modelo (ej: propiedades o anotaciones)"""
+    expects_date = _expects_date(annotation)
+    submodel = _submodel(annotation)
+
+    def convert(model_instance, value):
+        if expects_date and isinstance(value, datetime.datetime):
+            value = value.date()
+        if isinstance(value, models.Manager):
+            return _related_pks(model_instance, value)
+        if hasattr(value, 'pk') and value is not None:
+            return value.pk
+        if submodel is not None and isinstance(value, dict):
+            return submodel.model_validate(value)
+        return value
+
+    return convert
+
+
+def _file_converter(annotation):
+    """FileField / ImageField → FileData, {"file_name", "url"} o None"""
+    as_file_data = annotation == FileData
+
+    def convert(model_instance, value):
+        try:
+            if value and value.name and hasattr(value, 'url'):
+                file_info = {"file_name": value.name, "url": value.url}
+                return FileData(**file_info) if as_file_data else file_info
+            return None
+        except (ValueError, AttributeError):
+            return None
+
+    return convert
+
+
+def _field_converter(annotation):
+    """Conversión de un campo concreto del modelo: datetime → date o dict → submodelo (None si se deja tal cual)"""
+    submodel = _submodel(annotation)
+
+    if _expects_date(annotation):
+        return lambda model_instance, value: value.date() if isinstance(value, datetime.datetime) else value
+    if submodel is not None:
+        return lambda model_instance, value: submodel.model_validate(value) if isinstance(value, dict) else value
+    return None
+
+
+def _default_value(field_info):
+    """Función que da el default de un campo de la Entity que no está en la instancia (None si no tiene)"""
+    if field_info.default_factory:
+        return field_info.default_factory
+    if field_info.default is not None:
+        default = field_info.default
+        return lambda: default
+    return None
+
+
+def _relation_fields(model_class) -> dict:
+    """Relaciones Many-to-Many / reverse FK del modelo por nombre de acceso (las inversas por su accessor, ej: related_entities)"""
+    relations = {}
+    for field in model_class._meta.get_fields():
+        if field.many_to_many or field.one_to_many:
+            name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+            relations[name] = field
+    return relations
+
+
+def _prefetch_cache_name(field) -> str:
+    """Clave con la que prefetch_related guarda la relación en _prefetched_objects_cache"""
+    if not field.auto_created:
+        return field.name
+    if field.many_to_many:
+        return field.field.related_query_name()
+    return field.get_accessor_name()
+
+
+def _related_getter(name, cache_name):
+    """IDs de la relación leídos directamente del caché de prefetch_related, sin crear el manager en cada fila"""
+    def get(model_instance):
+        cache = getattr(model_instance, '_prefetched_objects_cache', None)
+        if cache and cache_name in cache:
+            return [related.pk for related in cache[cache_name]]
+        return _related_pks(model_instance, getattr(model_instance, name))
+    return get
+
+
+def _build_field_plan(model_class, entity_class, field_names=None) -> tuple:
+    """Decide una vez, con los metadatos del modelo y las anotaciones de la Entity, de dónde se lee y cómo se convierte cada campo"""
+    relations = _relation_fields(model_class)
+
+    plan = []
+    for field_name, field_info in entity_class.model_fields.items():
+        if field_names is not None and field_name not in field_names:
+            continue
+
+        model_field_name = field_info.alias or field_name
+        try:
+            field_object = model_class._meta.get_field(model_field_name)
+        except FieldDoesNotExist:
+            field_object = None
+
+        get, optional = attrgetter(model_field_name), False
+
+        # ManyToMany o reverse FK (del caché de prefetch_related si se cargó)
+        if model_field_name in relations:
+            get = _related_getter(model_field_name, _prefetch_cache_name(relations[model_field_name]))
+            convert = None
+
+        # Propiedades, anotaciones, reverse OneToOne...: pueden no existir en la instancia
+        elif field_object is None or not field_object.concrete:
+            convert, optional = _value_converter(field_info.annotation), True
+
+        # Archivos e Imágenes
+        elif isinstance(field_object, models.FileField):
+            convert = _file_converter(field_info.annotation)
+
+        # ForeignKey / OneToOne: se lee la columna (related_id) sin cargar el objeto relacionado
+        elif field_object.is_relation and field_object.target_field.primary_key:
+            get, convert = attrgetter(field_object.attname), None
+        elif field_object.is_relation:
+            convert = _value_converter(field_info.annotation)
+
+        # Resto de campos: datetime → date y submodelos Pydantic según la anotación
+        else:
+            convert = _field_converter(field_info.annotation)
+
+        plan.append((field_name, get, convert, optional, _default_value(field_info)))
+
+    return tuple(plan)
+
+
+def _file_from_name(storage, annotation):
+    """FileField / ImageField leído con values_list (solo el nombre del archivo) → FileData, {"file_name", "url"} o None"""
+    as_file_data = annotation == FileData
+
+    def convert(model_instance, value):
+        if not value:
+            return None
+        try:
+            file_info = {"file_name": value, "url": storage.url(value)}
+        except ValueError:
+            return None
+        return FileData(**file_info) if as_file_data else file_info
+
+    return convert
+
+
+def _build_values_plan(model_class, entity_class, field_names=None) -> tuple:
+    """Columnas de values_list, campos del modelo para only() y, por campo de la Entity, su posición en la fila y su conversión"""
+    relations = _relation_fields(model_class)
+
+    columns, values, related, load_fields = ['pk'], [], [], []
+    for field_name, field_info in entity_class.model_fields.items():
+        if field_names is not None and field_name not in field_names:
+            continue
+
+        model_field_name = field_info.alias or field_name
+
+        # ManyToMany o reverse FK: se cargan aparte (ver _related_ids)
+        if model_field_name in relations:
+            related.append((field_name, relations[model_field_name].name))
+            continue
+
+        try:
+            field_object = model_class._meta.get_field(model_field_name)
+        except FieldDoesNotExist:
+            continue
+
+        # Propiedades, anotaciones, reverse OneToOne...: no son columnas (la Entity aplica su default)
+        if not field_object.concrete:
+            continue
+
+        if isinstance(field_object, models.FileField):
+            column, convert = field_object.attname, _file_from_name(field_object.storage, field_info.annotation)
+        elif field_object.is_relation and not field_object.target_field.primary_key:
+            column, convert = f"{field_object.name}__pk", None
+        elif field_object.is_relation:
+            column, convert = field_object.attname, None
+        else:
+            column, convert = field_object.attname, _field_converter(field_info.annotation)
+
+        if column not in columns:
+            columns.append(column)
+        if field_object.name not in load_fields:
+            load_fields.append(field_object.name)
+        values.append((field_name, columns.index(column), convert))
+
+    return tuple(columns), tuple(values), tuple(related), tuple(load_fields)
+
+
+def _related_ids(model_class, related, pks) -> dict:
+    """IDs de cada relación por fila, {campo: {pk: [ids]}}: una consulta por relación para todas las filas"""
+    result = {}
+    for field_name, lookup in related:
+        ids = {}
+        rows = model_class._default_manager.filter(pk__in=pks).order_by().values_list('pk', lookup)
+        for pk, related_pk in rows:
+            if related_pk is not None:
+                ids.setdefault(pk, []).append(related_pk)
+        result[field_name] = ids
+    return result
+
 
 class Mapper:
 
     @staticmethod
-    def model_to_entity(model_instance: models.Model, entity_class: Type[T]) -> T:
-        """Convierte modelo Django → entidad Pydantic con validación y submodelos"""
+    def model_to_entity(model_instance: models.Model, entity_class: Type[T], field_names: Optional[frozenset] = None) -> T:
+        """
+        Convierte modelo Django → entidad Pydantic con validación y submodelos.
+
+        Con field_names (ver Mapper.projection_fields) solo se leen esos campos; el resto queda con su default.
+        """
 
         if not model_instance:
-            raise CompanyDailyMetricsValueError("Model_instance_cannot_be_None_Cannot_convert_None_to_entity")
+            raise [[ entity_name|capitalize_first ]]ValueError("Model_instance_cannot_be_None_Cannot_convert_None_to_entity")
 
         data = {}
+        for field_name, get, convert, optional, default in Mapper.field_plan(type(model_instance), entity_class, field_names):
+            if optional:
+                try:
+                    value = get(model_instance)
+                except AttributeError:
+                    # Usar default si está definido
+                    if default is not None:
+                        data[field_name] = default()
+                    continue
+            else:
+                value = get(model_instance)
+
+            data[field_name] = convert(model_instance, value) if convert else value
 
-        for field_name, field_info in entity_class.model_fields.items():
-            model_field_name = field_info.alias or field_name
+        return entity_class.model_validate(data)
 
-            if not hasattr(model_instance, model_field_name):
-                # Usar default si está definido
-                if field_info.default_factory:
-                    data[field_name] = field_info.default_factory()
-                elif field_info.default is not None:
-                    data[field_name] = field_info.default
+    @staticmethod
+    def field_plan(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Plan de conversión modelo → entidad: (campo, lectura, conversión, opcional, default) por campo de la Entity.
+
+        Se calcula una vez por pareja (modelo, entidad) y queda en caché, así model_to_entity no vuelve a
+        recorrer model_fields, desenvolver anotaciones ni consultar los metadatos del modelo en cada fila.
+        """
+        key = (model_class, entity_class, field_names)
+        plan = _field_plans.get(key)
+        if plan is None:
+            plan = _field_plans[key] = _build_field_plan(model_class, entity_class, field_names)
+        return plan
+
+    @staticmethod
+    def values_plan(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Plan de lectura por columnas: (columnas de values_list, [(campo, posición, conversión)],
+        [(campo, lookup de la relación)], campos del modelo para only()).
+
+        Como field_plan, se calcula una vez por (modelo, entidad, campos) y queda en caché.
+        """
+        key = (model_class, entity_class, field_names)
+        plan = _values_plans.get(key)
+        if plan is None:
+            plan = _values_plans[key] = _build_values_plan(model_class, entity_class, field_names)
+        return plan
+
+    @staticmethod
+    def values_columns(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """Columnas que hay que pedir con queryset.values_list(...) para Mapper.rows_to_entities (la primera es la pk)"""
+        return Mapper.values_plan(model_class, entity_class, field_names)[0]
+
+    @staticmethod
+    def load_fields(model_class, entity_class, field_names: Optional[frozenset] = None) -> tuple:
+        """
+        Campos del modelo que hay que cargar con queryset.only(...) para model_to_entity.
+
+        Se derivan de los campos de la Entity que son columnas del modelo (las relaciones Many-to-Many /
+        reverse FK van aparte con related_prefetches), así el mapper nunca toca un campo diferido:
+        sin esta lista, cada campo que faltara en only() costaría una consulta por fila.
+        """
+        return Mapper.values_plan(model_class, entity_class, field_names)[3]
+
+    @staticmethod
+    def projection_fields(entity_class, projection: Optional[str] = None) -> Optional[frozenset]:
+        """
+        Campos de la proyección declarada en Meta.projections de la Entity (ej: "list").
+
+        Incluye siempre Meta.required_fields (la Entity no se puede construir sin ellos).
+        Devuelve None (todos los campos) si no se pide proyección o la Entity no la declara.
+        """
+        meta = getattr(entity_class, 'Meta', None)
+        field_names = (getattr(meta, 'projections', None) or {}).get(projection) if projection else None
+        if field_names is None:
+            return None
+        return frozenset(field_names) | frozenset(getattr(meta, 'required_fields', ()))
+
+    @staticmethod
+    def rows_to_entities(model_class, entity_class: Type[T], rows, field_names: Optional[frozenset] = None) -> list:
+        """
+        Convierte filas de queryset.values_list(*Mapper.values_columns(Model, Entity, field_names)) → entidades, sin instanciar el modelo.
+
+        Ruta de solo lectura para listados: se evitan el __init__ del modelo, las señales y los descriptores.
+        - Las relaciones Many-to-Many / reverse FK se cargan con una consulta por relación para todas las filas.
+        - Los campos de la entidad que no son columnas (propiedades, anotaciones...) quedan con su valor por defecto.
+        - Las filas pueden traer columnas adicionales al final (ej: el campo de orden del cursor).
+        """
+        columns, values, related, load_fields = Mapper.values_plan(model_class, entity_class, field_names)
+        related_ids = _related_ids(model_class, related, [row[0] for row in rows]) if related and rows else {}
+
+        entities = []
+        for row in rows:
+            data = {}
+            for field_name, index, convert in values:
+                value = row[index]
+                # Sin instancia del modelo: las conversiones solo dependen del valor
+                data[field_name] = convert(None, value) if convert else value
+            for field_name, ids in related_ids.items():
+                data[field_name] = ids.get(row[0], [])
+            entities.append(entity_class.model_validate(data))
+
+        return entities
+
+    @staticmethod
+    def related_prefetches(model_class, entity_class, field_names: Optional[frozenset] = None) -> list:
+        """
+        Prefetch de las relaciones Many-to-Many / reverse FK del modelo que declara la entidad.
+
+        Con queryset.prefetch_related(*Mapper.related_prefetches(Model, Entity)) un listado de N
+        entidades hace una consulta por relación en lugar de una por relación y fila (N+1).
+        Solo se cargan los IDs, que es lo que model_to_entity guarda en la entidad.
+        """
+        entity_field_names = {
+            field_info.alias or field_name for field_name, field_info in entity_class.model_fields.items()
+            if field_names is None or field_name in field_names
+        }
+
+        prefetches = []
+        for name, field in _relation_fields(model_class).items():
+            if name not in entity_field_names:
                 continue
 
-            value = getattr(model_instance, model_field_name)
-            field_object = None
-            try:
-                field_object = model_instance._meta.get_field(model_field_name)
-            except Exception:
-                pass
-            
-            # Convertir datetime → date si el campo de la Entity es date
-            if isinstance(value, datetime.datetime) and _expects_date(field_info.annotation):
-                value = value.date()               
-
-            # ManyToMany
-            if isinstance(value, models.Manager):
-                value = list(value.values_list('pk', flat=True)) if value else []
-
-            # Archivos e Imágenes
-            elif field_object and isinstance(field_object, (models.FileField, models.ImageField)):
-                try:
-                    if value and value.name and hasattr(value, 'url'):
-                        file_info = {"file_name": value.name, "url": value.url}
-                        if field_info.annotation == FileData:
-                            value = FileData(**file_info)
-                        else:
-                            value = file_info
-                    else:
-                        value = None
-                except (ValueError, AttributeError):
-                    value = None
-                    
-            # ForeignKey / OneToOne
-            elif hasattr(value, 'pk') and value is not None:
-                value = value.pk                                     
+            # En una reverse FK hace falta la clave foránea para repartir las filas entre las instancias
+            remote_field = getattr(field, 'field', None)
+            columns = ['pk', remote_field.attname] if field.one_to_many and remote_field is not None else ['pk']
+            prefetches.append(Prefetch(name, queryset=field.related_model._default_manager.only(*columns)))
 
-            # Submodelos Pydantic
-            elif isinstance(field_info.annotation, type) and issubclass(field_info.annotation, BaseModel):
-                if isinstance(value, dict):
-                    value = field_info.annotation.model_validate(value)               
+        return prefetches
 
-            data[field_name] = value
+    @staticmethod
+    def column_fields(model_class, entity_class) -> frozenset:
+        """
+        Campos de la entidad que no son relaciones Many-to-Many / reverse FK.
 
-        return entity_class.model_validate(data)    
+        Con model_to_entity(instance, Entity, Mapper.column_fields(Model, Entity)) la entidad se
+        construye solo con las columnas ya cargadas en la instancia, sin consultas adicionales.
+        """
+        relations = _relation_fields(model_class)
+        return frozenset(
+            field_name for field_name, field_info in entity_class.model_fields.items()
+            if (field_info.alias or field_name) not in relations
+        )
 
     @staticmethod
     def update_model_from_entity_dict(instance, entity_dict, excluded_fields=None):
@@ -200,7 +521,7 @@ class Mapper:
             try:
                 value = getattr(model_instance, field.name)
                 if isinstance(field, models.ManyToManyField):
-                    data[field.name] = list(value.values_list('pk', flat=True))
+                    data[field.name] = _related_pks(model_instance, value)
                 elif isinstance(field, models.ForeignKey) and value:
                     data[field.name] = value.pk
                 else:
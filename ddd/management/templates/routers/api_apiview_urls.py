@@ -15,6 +15,9 @@ urlpatterns = [
     # Crear [[ entity_name.lower() ]] - POST /
     path('', [[ entity_name.lower() ]]_views.[[ entity_name|capitalize_first ]]APIView.as_view({'post': 'create'}), name='[[ entity_name.lower() ]]-create'),
     
+    # Exportar [[ entity_name.lower() ]]s (CSV o NDJSON por streaming) - GET /export/
+    path('export/', [[ entity_name.lower() ]]_views.[[ entity_name|capitalize_first ]]ExportAPIView.as_view(), name='[[ entity_name.lower() ]]-export'),
+    
     # Obtener [[ entity_name.lower() ]] específico - GET /<id>/
     path('<int:id>/', [[ entity_name.lower() ]]_views.[[ entity_name|capitalize_first ]]APIView.as_view({'get': 'retrieve'}), name='[[ entity_name.lower() ]]-retrieve'),
     
@@ -40,6 +43,7 @@ urlpatterns = [
 This will create the following endpoints with individual URL patterns:
     GET    /api/[[ entity_name.lower() ]]s/     - List all [[ entity_name.lower() ]]s ([[ entity_name.lower() ]]-list)
     POST   /api/[[ entity_name.lower() ]]s/     - Create new [[ entity_name.lower() ]] ([[ entity_name.lower() ]]-create)
+    GET    /api/[[ entity_name.lower() ]]s/export/ - Export [[ entity_name.lower() ]]s as CSV or NDJSON ([[ entity_name.lower() ]]-export)
     GET    /api/[[ entity_name.lower() ]]s/{id}/ - Retrieve [[ entity_name.lower() ]] ([[ entity_name.lower() ]]-retrieve)
     PUT    /api/[[ entity_name.lower() ]]s/{id}/ - Update [[ entity_name.lower() ]] ([[ entity_name.lower() ]]-update)
     PATCH  /api/[[ entity_name.lower() ]]s/{id}/ - Partial update [[ entity_name.lower() ]] ([[ entity_name.lower() ]]-partial-update)
@@ -29,6 +29,10 @@ urlpatterns = [
 The DefaultRouter will automatically generate the following endpoints:
     GET    /api/[[ entity_name.lower() ]]s/           - List [[ entity_name.lower() ]]s
     POST   /api/[[ entity_name.lower() ]]s/           - Create new [[ entity_name.lower() ]]
+    GET    /api/[[ entity_name.lower() ]]s/export/    - Export [[ entity_name.lower() ]]s as CSV or NDJSON (@action export)
+    POST   /api/[[ entity_name.lower() ]]s/bulk/      - Create many [[ entity_name.lower() ]]s (@action bulk_create)
+    PATCH  /api/[[ entity_name.lower() ]]s/bulk/      - Update many [[ entity_name.lower() ]]s (bulk_update)
+    DELETE /api/[[ entity_name.lower() ]]s/bulk/      - Delete many [[ entity_name.lower() ]]s by id (bulk_delete)
     GET    /api/[[ entity_name.lower() ]]s/{id}/      - Retrieve [[ entity_name.lower() ]]
     PUT    /api/[[ entity_name.lower() ]]s/{id}/      - Update [[ entity_name.lower() ]]
     PATCH  /api/[[ entity_name.lower() ]]s/{id}/      - Partial update [[ entity_name.lower() ]]
@@ -4,11 +4,14 @@ class [[ entity_name|capitalize_first ]]Service:
 
     Métodos disponibles:
         - list: Lista todas las instancias de [[ entity_name|decapitalize_first ]].
+        - list_page: Lista una página de instancias de [[ entity_name|decapitalize_first ]] (paginación por cursor).
+        - iter_list: Recorre todas las instancias de [[ entity_name|decapitalize_first ]] sin cargarlas a la vez en memoria.
         - count_all: Cuenta todas las instancias de [[ entity_name|decapitalize_first ]].
         - create: Crea una nueva instancia de [[ entity_name|decapitalize_first ]].
         - retrieve: Recupera una instancia de [[ entity_name|decapitalize_first ]] por ID.
         - update: Actualiza una instancia existente de [[ entity_name|decapitalize_first ]].
         - delete: Elimina una instancia de [[ entity_name|decapitalize_first ]].
+        - create_many / update_many / delete_many: Operaciones masivas (una transacción, consultas por lotes).
     """
 
     #Si necesitas mantener un estado de lista de entidades
@@ -26,12 +29,14 @@ class [[ entity_name|capitalize_first ]]Service:
         self.repository = repository or [[ entity_name|capitalize_first ]]Repository()
 
 
-    def list(self, filters: Optional[dict] = None) -> List[dict]:
+    def list(self, filters: Optional[dict] = None, readonly: bool = False, projection: Optional[str] = None) -> List[dict]:
         """
         Lista instancias de [[ entity_name|decapitalize_first ]].
 
         params:
             filters: Filtros opcionales para la consulta.
+            readonly: Lectura directa de columnas, sin instancias del modelo (para endpoints de solo lectura).
+            projection: Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
         return: 
             Lista de la entidad
         raises:
@@ -39,26 +44,86 @@ class [[ entity_name|capitalize_first ]]Service:
             ConnectionDataBaseError: Si hay un error al conectar a la base de datos.
             RepositoryError: Si ocurre un error inesperado (interno del sistema).
         """
-        entity_list = self.repository.get_all(filters=filters)
+        entity_list = self.repository.get_all(filters=filters, readonly=readonly, projection=projection)
 
         return [entity.to_dict() for entity in entity_list]      
 
 
-    def count_all(self, filters: Optional[dict] = None) -> int:
+    def list_page(self, cursor: Optional[str] = None, limit: int = 50, order_by: str = "-id", filters: Optional[dict] = None, readonly: bool = False, projection: Optional[str] = None, count_mode: Optional[str] = None) -> dict:
+        """
+        Lista una página de instancias de [[ entity_name|decapitalize_first ]] (paginación por cursor).
+
+        params:
+            cursor: Token de la página anterior (None para la primera página).
+            limit: Número de instancias por página.
+            order_by: Campo de orden ("-" para orden descendente).
+            filters: Filtros opcionales para la consulta.
+            readonly: Lectura directa de columnas, sin instancias del modelo (para endpoints de solo lectura).
+            projection: Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
+            count_mode: Modo de conteo del total ("exact", "estimated", "cached", "windowed", ver count_all del repositorio); None para no contar.
+        return: 
+            Diccionario con la página ("results") y el cursor de la siguiente ("next_cursor", None si es la última),
+            y el total ("count") si se pide count_mode
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si el cursor, el límite, el orden, los filtros o el modo de conteo no son válidos.
+            ConnectionDataBaseError: Si hay un error al conectar a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+        if count_mode == "windowed":
+            # El total se calcula en la misma consulta de la primera página y viaja en el cursor
+            entity_list, next_cursor, count = self.repository.get_page(cursor=cursor, limit=limit, order_by=order_by, filters=filters, readonly=readonly, projection=projection, with_total=True)
+        else:
+            count = self.repository.count_all(filters=filters, mode=count_mode) if count_mode is not None else None
+            entity_list, next_cursor = self.repository.get_page(cursor=cursor, limit=limit, order_by=order_by, filters=filters, readonly=readonly, projection=projection)
+
+        page = {
+            "results": [entity.to_dict() for entity in entity_list],
+            "next_cursor": next_cursor
+        }
+        if count_mode is not None:
+            page["count"] = count
+        return page
+
+
+    def iter_list(self, filters: Optional[dict] = None, chunk_size: int = 2000, readonly: bool = False, projection: Optional[str] = None) -> Iterator[dict]:
+        """
+        Recorre todas las instancias de [[ entity_name|decapitalize_first ]], una a una (generador).
+
+        A diferencia de list(), no construye la lista completa: la memoria se mantiene
+        constante sea cual sea el tamaño de la tabla (exportaciones, procesos por lotes).
+
+        params:
+            filters: Filtros opcionales para la consulta.
+            chunk_size: Filas que se leen de la base de datos en cada bloque.
+            readonly: Lectura directa de columnas, sin instancias del modelo (para endpoints de solo lectura).
+            projection: Proyección de Meta.projections de la entidad (ej: "list"); None para todos los campos.
+        yields: 
+            Cada entidad como diccionario
+        raises (al recorrer el generador):
+            [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
+            ConnectionDataBaseError: Si hay un error al conectar a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+        for entity in self.repository.iter_all(filters=filters, chunk_size=chunk_size, readonly=readonly, projection=projection):
+            yield entity.to_dict()
+
+
+    def count_all(self, filters: Optional[dict] = None, mode: str = "exact") -> int:
         """
         Cuenta todas las instancias de [[ entity_name|decapitalize_first ]].
 
         param: 
             filters: Filtros opcionales para la consulta.
+            mode: Modo de conteo ("exact", "estimated", "cached", ver count_all del repositorio; "windowed" solo en list_page).
         return: 
-            Número total de instancias.
+            Número total de instancias (aproximado en los modos "estimated" y "cached").
         raises: 
             [[ entity_name|capitalize_first ]]ValueError:  Si el valor de entrada no es válido.
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.       
             RepositoryError: Si ocurre un error inesperado (interno del sistema).             
         """
 
-        return self.repository.count_all(filters=filters)
+        return self.repository.count_all(filters=filters, mode=mode)
 
 
     def create(self, data, related_id: Optional[int]=None, relations: Optional[List[int]]=None, adicionalData=None) -> dict:
@@ -75,20 +140,17 @@ class [[ entity_name|capitalize_first ]]Service:
         raises: 
             [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
             [[ entity_name|capitalize_first ]]ValidationError: Si los datos no son válidos.
-            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si ya existe un registro con el mismo nombre.            
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si ya existe un registro con el mismo valor en un campo único.            
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
             RepositoryError: Si ocurre un error inesperado (interno del sistema).            
         """
 
-        # Validación de reglas de negocio (opcional)
-        if self.repository.exists_by_field(field_name="name", value=data.get("name")):
-            raise [[ entity_name|capitalize_first ]]ValueError(field="name", detail="An instance with this name already exists")
-
         #crear la entidad
         data['related_id'] = related_id
         entity = [[ entity_name|capitalize_first ]]Entity.from_dict(data)  
 
-        # Guardar en el repositorio
+        # Guardar en el repositorio: la unicidad la comprueba la base de datos en el mismo INSERT
+        # (sin exists_by_field previo: una consulta menos y sin carrera entre comprobar y crear)
         try:
             saved_entity = self.repository.create(entity=entity, relations=relations, adicionalData=adicionalData)
         except ValidationError as e:
@@ -99,6 +161,71 @@ class [[ entity_name|capitalize_first ]]Service:
         return saved_entity.to_dict()
 
 
+    def upsert(self, data, conflict_fields: List[str], related_id: Optional[int]=None, relations: Optional[List[int]]=None, update_fields: Optional[List[str]]=None) -> dict:
+        """
+        Crea una instancia de [[ entity_name|decapitalize_first ]] o, si ya existe una con los mismos `conflict_fields`, la actualiza (una sola sentencia).
+
+        params: 
+            data: Diccionario o DTO con los datos de la instancia.
+            conflict_fields: Campos únicos que identifican la instancia (ej: ["uuid"]).
+            related_id: ID del padre si es necesario (opcional).
+            relations: Lista de IDs de entidades relacionadas (opcional).
+            update_fields: Campos que se actualizan si ya existe (por defecto, los que admite update()).
+        return: 
+            La entidad guardada.
+        raises: 
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            [[ entity_name|capitalize_first ]]ValidationError: Si los datos no son válidos.
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si choca con otra instancia en un campo único distinto de conflict_fields.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        data['related_id'] = related_id
+        entity = [[ entity_name|capitalize_first ]]Entity.from_dict(data)
+
+        try:
+            saved_entity = self.repository.upsert(entity=entity, conflict_fields=conflict_fields, update_fields=update_fields, relations=relations)
+        except ValidationError as e:
+            raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
+        except AlreadyExistsError as e:
+            raise [[ entity_name|capitalize_first ]]AlreadyExistsError(field=e.field, detail=e.detail) from e
+
+        return saved_entity.to_dict()
+
+
+    def create_or_get(self, data, conflict_fields: List[str], related_id: Optional[int]=None, relations: Optional[List[int]]=None) -> Tuple[dict, bool]:
+        """
+        Crea una instancia de [[ entity_name|decapitalize_first ]] o, si ya existe una con los mismos `conflict_fields`, devuelve la existente.
+
+        params: 
+            data: Diccionario o DTO con los datos de la instancia.
+            conflict_fields: Campos únicos que identifican la instancia (ej: ["uuid"]).
+            related_id: ID del padre si es necesario (opcional).
+            relations: Lista de IDs de entidades relacionadas (opcional, solo al crear).
+        return: 
+            La entidad y si se ha creado.
+        raises: 
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            [[ entity_name|capitalize_first ]]ValidationError: Si los datos no son válidos.
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si choca con otra instancia en un campo único distinto de conflict_fields.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+
+        data['related_id'] = related_id
+        entity = [[ entity_name|capitalize_first ]]Entity.from_dict(data)
+
+        try:
+            saved_entity, created = self.repository.create_or_get(entity=entity, conflict_fields=conflict_fields, relations=relations)
+        except ValidationError as e:
+            raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
+        except AlreadyExistsError as e:
+            raise [[ entity_name|capitalize_first ]]AlreadyExistsError(field=e.field, detail=e.detail) from e
+
+        return saved_entity.to_dict(), created
+
+
     def retrieve(self, entity_id: int = None, entity_uuid: str = None) -> dict:
         """
         Recupera una instancia de [[ entity_name|decapitalize_first ]] por su ID o UUID.
@@ -139,6 +266,7 @@ class [[ entity_name|capitalize_first ]]Service:
             [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.                 
             [[ entity_name|capitalize_first ]]ValidationError: Si los datos no son válidos.   
             [[ entity_name|capitalize_first ]]NotFoundError: Si no existe el registro con el ID dado.         
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si ya existe otro registro con el mismo valor en un campo único.
             ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
             RepositoryError: Si ocurre un error inesperado (interno del sistema).
         """
@@ -149,23 +277,17 @@ class [[ entity_name|capitalize_first ]]Service:
         if not data:
             raise [[ entity_name|capitalize_first ]]ValueError(field="data", detail="The data field is required")
 
-        # Recuperar la entidad
-        try:
-            entity = self.repository.get_by_id(id=entity_id, uuid=entity_uuid)
-        except NotFoundError as e:
-            raise [[ entity_name|capitalize_first ]]NotFoundError(id=entity_id or entity_uuid) from e
-
-        # actualizar la instancia
         data['related_id'] = related_id
-        entity.update(data)     
 
-        # Guardar en el repositorio
+        # Leer, aplicar las reglas de dominio (entity.update) y guardar en el repositorio con una sola lectura
         try:
-            updated_entity = self.repository.update(entity=entity, relations=relations, adicionalData=adicionalData)
+            updated_entity = self.repository.update_by_id(id=entity_id, uuid=entity_uuid, changes=data, relations=relations, adicionalData=adicionalData)
         except NotFoundError as e:
             raise [[ entity_name|capitalize_first ]]NotFoundError(id=entity_id or entity_uuid) from e
         except ValidationError as e:
             raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
+        except AlreadyExistsError as e:
+            raise [[ entity_name|capitalize_first ]]AlreadyExistsError(field=e.field, detail=e.detail) from e
 
         return updated_entity.to_dict()
 
@@ -199,3 +321,114 @@ class [[ entity_name|capitalize_first ]]Service:
             raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
 
         return True
+
+
+    def create_many(self, items: List[dict], relations: Optional[List[Optional[List[int]]]] = None, batch_size: int = 1000) -> List[dict]:
+        """
+        Crea varias instancias de [[ entity_name|decapitalize_first ]] en bloque.
+
+        Primero se construyen y validan todas las entidades (reglas de dominio); si alguna no es
+        válida no se guarda ninguna. Después se guardan todas con una transacción y consultas por lotes.
+
+        params:
+            items: Lista de diccionarios con los datos de cada instancia (incluido related_id si aplica).
+            relations: Lista de IDs de entidades relacionadas por instancia, en el mismo orden (opcional).
+            batch_size: Registros por consulta.
+        return: 
+            Las entidades creadas.
+        raises: 
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            [[ entity_name|capitalize_first ]]ValidationError: Si algún elemento no es válido (errors: lista con el índice y el error de cada uno).
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si algún registro ya existe.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+        if not isinstance(items, list) or not items:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="items", detail="items must be a non empty list")
+
+        # Validar todas las entidades antes de guardar ninguna
+        entities = []
+        errors = []
+        for index, data in enumerate(items):
+            try:
+                entities.append([[ entity_name|capitalize_first ]]Entity.from_dict(data))
+            except [[ entity_name|capitalize_first ]]ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+
+        if errors:
+            raise [[ entity_name|capitalize_first ]]ValidationError(errors)
+
+        # Guardar en el repositorio
+        try:
+            saved_entities = self.repository.bulk_create(entities=entities, relations=relations, batch_size=batch_size)
+        except ValidationError as e:
+            raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
+        except AlreadyExistsError as e:
+            raise [[ entity_name|capitalize_first ]]AlreadyExistsError(field=e.field, detail=e.detail) from e
+
+        return [entity.to_dict() for entity in saved_entities]
+
+
+    def update_many(self, items: List[dict], relations: Optional[List[Optional[List[int]]]] = None, batch_size: int = 1000) -> List[dict]:
+        """
+        Actualiza varias instancias existentes de [[ entity_name|decapitalize_first ]] en bloque.
+
+        El repositorio lee todos los registros una sola vez (bloqueados), aplica y valida los cambios
+        de cada uno (si alguno no es válido o no existe no se guarda ninguno) y los guarda con
+        consultas por lotes.
+
+        params:
+            items: Lista de diccionarios con los datos a actualizar de cada instancia (deben traer el "id").
+            relations: Lista de IDs de entidades relacionadas por instancia, en el mismo orden (opcional).
+            batch_size: Registros por consulta.
+        return: 
+            Las entidades actualizadas.
+        raises: 
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            [[ entity_name|capitalize_first ]]ValidationError: Si algún elemento no es válido (errors: lista con el índice y el error de cada uno).
+            [[ entity_name|capitalize_first ]]NotFoundError: Si no existe alguno de los registros.
+            [[ entity_name|capitalize_first ]]AlreadyExistsError: Si algún registro ya existe.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+        if not isinstance(items, list) or not items:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="items", detail="items must be a non empty list")
+
+        ids = [data.get("id") if isinstance(data, dict) else None for data in items]
+        if not all(ids):
+            raise [[ entity_name|capitalize_first ]]ValueError(field="id", detail="Every item must have an id")
+
+        # Aplicar los cambios y guardar en el repositorio (una sola lectura de los registros)
+        try:
+            updated_entities = self.repository.bulk_update_by_ids(items=items, relations=relations, batch_size=batch_size)
+        except NotFoundError as e:
+            raise [[ entity_name|capitalize_first ]]NotFoundError(id=e.id) from e
+        except ValidationError as e:
+            raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
+        except AlreadyExistsError as e:
+            raise [[ entity_name|capitalize_first ]]AlreadyExistsError(field=e.field, detail=e.detail) from e
+
+        return [entity.to_dict() for entity in updated_entities]
+
+
+    def delete_many(self, ids: List[int]) -> List[int]:
+        """
+        Elimina varias instancias de [[ entity_name|decapitalize_first ]] en bloque.
+
+        params:
+            ids: IDs de las instancias a eliminar.
+        return: 
+            IDs de las instancias eliminadas (los IDs que no existen se ignoran).
+        raises:
+            [[ entity_name|capitalize_first ]]ValueError: Si el valor de entrada no es válido.
+            [[ entity_name|capitalize_first ]]ValidationError: Si alguna instancia no se puede eliminar.
+            ConnectionDataBaseError: Si ocurre un error al acceder a la base de datos.
+            RepositoryError: Si ocurre un error inesperado (interno del sistema).
+        """
+        if not isinstance(ids, list) or not ids:
+            raise [[ entity_name|capitalize_first ]]ValueError(field="ids", detail="ids must be a non empty list")
+
+        try:
+            return self.repository.delete_many(ids=ids)
+        except ValidationError as e:
+            raise [[ entity_name|capitalize_first ]]ValidationError(e.errors) from e
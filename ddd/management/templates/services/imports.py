@@ -16,7 +16,7 @@ son utiles para:
 - Proporcionar una interfaz coherente para interactuar con diferentes tipos de almacenamiento de datos (por ejemplo, bases de datos, servicios web, etc.).
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 # importa las entidades utilizadas aqui
 from ..domain.[[ entity_name.lower() ]]_entity import [[ entity_name|capitalize_first ]]Entity
@@ -0,0 +1,71 @@
+import hashlib
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from django.core import signing
+
+# Sal de la firma: un cursor de otra parte del proyecto no es válido aquí
+CURSOR_SALT = "ddd.pagination.cursor"
+
+
+def encode_cursor(values: dict) -> str:
+    """
+    Codifica la posición de una página como un token opaco y firmado (django.core.signing).
+
+    El cliente no puede leer ni alterar el token: solo devolverlo tal cual para pedir la siguiente página.
+
+    Args:
+        values (dict): Valores de la última fila de la página (campo de orden e id).
+
+    Returns:
+        str: Token del cursor.
+    """
+    return signing.dumps({key: _to_json(value) for key, value in values.items()}, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token: str) -> dict:
+    """
+    Decodifica un token creado con encode_cursor.
+
+    Args:
+        token (str): Token del cursor.
+
+    Returns:
+        dict: Valores de la última fila de la página anterior.
+
+    Raises:
+        ValueError: Si el token no es válido o fue alterado.
+    """
+    try:
+        values = signing.loads(token, salt=CURSOR_SALT)
+    except signing.BadSignature as e:
+        raise ValueError("Invalid cursor.") from e
+
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor.")
+    return values
+
+
+def filters_hash(filters: Optional[dict]) -> str:
+    """
+    Huella de los filtros de un listado (el cursor la guarda para que no se use con otros filtros).
+
+    Args:
+        filters (dict, optional): Filtros del listado (None equivale a sin filtros).
+
+    Returns:
+        str: Hash MD5 de los filtros en JSON con las claves ordenadas.
+    """
+    return hashlib.md5(json.dumps(filters or {}, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _to_json(value):
+    """Fechas, UUID y decimales viajan como texto (el ORM los acepta así en los filtros)"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
@@ -0,0 +1,175 @@
+import time
+from uuid import UUID
+
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+
+class EntityCache:
+    """
+    Caché de lectura (read-through) de entidades sobre el framework de caché de Django.
+
+    - La entidad se guarda por id (el backend la serializa) y, por uuid, solo su id:
+      así basta con invalidar el id para que las dos lecturas dejen de acertar.
+    - Cada entrada caduca a los `timeout` segundos (TTL) y las claves llevan `version`:
+      al cambiar la forma de la entidad se incrementa y lo guardado deja de leerse.
+    - Cada id tiene una generación que forma parte de la clave de la entidad. La invalidación
+      la incrementa con transaction.on_commit: si la transacción se deshace la caché no cambia,
+      y si se confirma nadie vuelve a leer el dato anterior. Un lector que leyó la fila antes
+      de la escritura la guarda con la generación anterior, que ya nadie lee.
+    - Dentro de una transacción (atomic) no se lee ni se escribe la caché: lo leído puede
+      no estar confirmado todavía, o ser anterior a las escrituras de la propia transacción.
+    - Los conteos (count) se guardan bajo una generación común: cualquier escritura la
+      incrementa y todos los conteos guardados dejan de leerse, sin tener que conocer sus claves.
+
+    Con LocMemCache (el backend por defecto) cada proceso tiene su propia caché: en
+    producción con varios procesos usa un backend compartido (Redis, Memcached).
+    Con ATOMIC_REQUESTS cada petición es una transacción, así que la caché no se usa en las vistas.
+    """
+
+    def __init__(self, prefix: str, timeout: int = 300, version: int = 1, alias: str = "default", enabled: bool = True, using: str = DEFAULT_DB_ALIAS):
+        self.prefix = prefix
+        self.timeout = timeout
+        self.version = version
+        self.alias = alias
+        self.enabled = enabled
+        self.using = using
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _id_key(self, id, generation) -> str:
+        return f"{self.prefix}:id:{int(id)}:{generation}"
+
+    def _generation_key(self, id) -> str:
+        return f"{self.prefix}:generation:{int(id)}"
+
+    def _uuid_key(self, uuid) -> str:
+        return f"{self.prefix}:uuid:{UUID(str(uuid))}"
+
+    def _count_generation_key(self) -> str:
+        return f"{self.prefix}:count:generation"
+
+    def _active(self) -> bool:
+        """La caché se usa si está activada y no hay una transacción abierta en la base de datos"""
+        return self.enabled and not connections[self.using].in_atomic_block
+
+    def get_or_load(self, load, id=None, uuid=None):
+        """
+        Entidad guardada por id (o por uuid si no se da el id) o, si no está, la que devuelve load().
+
+        La generación del id se lee antes de llamar a load(): si una escritura la incrementa
+        mientras tanto, la entidad leída se guarda con la anterior y no se vuelve a leer.
+        Si solo se conoce el uuid y aún no está su referencia, se guarda la referencia uuid -> id
+        (la entidad se guarda en la siguiente lectura, ya por id).
+        """
+        if not self._active():
+            return load()
+
+        if id is None and uuid is not None:
+            id = self.backend.get(self._uuid_key(uuid), version=self.version)
+
+        generation = None
+        if id is not None:
+            generation = self.backend.get(self._generation_key(id), 0, version=self.version)
+            entity = self.backend.get(self._id_key(id, generation), version=self.version)
+            if entity is not None:
+                self.hits += 1
+                return entity
+
+        self.misses += 1
+        entity = load()
+        if entity is None or not getattr(entity, "id", None):
+            return entity
+
+        if getattr(entity, "uuid", None):
+            self.backend.add(self._uuid_key(entity.uuid), entity.id, timeout=self.timeout, version=self.version)
+        if generation is not None:
+            self.backend.add(self._id_key(entity.id, generation), entity, timeout=self.timeout, version=self.version)
+        return entity
+
+    def invalidate(self, *ids):
+        """
+        Deja de servir las entidades (nueva generación de cada id) cuando se confirme la
+        transacción en curso (o ya, si no hay ninguna). Los conteos guardados también dejan de valer.
+        """
+        if not self.enabled or not ids:
+            return
+
+        ids = [int(id) for id in ids]
+        transaction.on_commit(lambda: self._next_generations(ids), using=self.using)
+        self.invalidate_counts()
+
+    def invalidate_uuid(self, *uuids):
+        """Como invalidate(), cuando solo se conoce el uuid: el id se toma de la referencia uuid -> id guardada en la caché"""
+        if not self.enabled or not uuids:
+            return
+
+        uuid_keys = [self._uuid_key(uuid) for uuid in uuids]
+        ids = list(self.backend.get_many(uuid_keys, version=self.version).values())
+
+        def run():
+            self.backend.delete_many(uuid_keys, version=self.version)
+            self._next_generations(ids)
+
+        transaction.on_commit(run, using=self.using)
+        self.invalidate_counts()
+
+    def _next_generations(self, ids):
+        """Borra las entradas actuales de los ids e incrementa su generación"""
+        if not ids:
+            return
+
+        generation_keys = {id: self._generation_key(id) for id in ids}
+        generations = self.backend.get_many(list(generation_keys.values()), version=self.version)
+        self.backend.delete_many([self._id_key(id, generations.get(key, 0)) for id, key in generation_keys.items()], version=self.version)
+        for key in generation_keys.values():
+            self._increment(key)
+
+    def _increment(self, key):
+        try:
+            self.backend.incr(key, version=self.version)
+        except ValueError:
+            # La generación aún no existe (o el backend la descartó): se empieza en un valor que no se haya usado
+            self.backend.set(key, time.time_ns(), timeout=None, version=self.version)
+
+    def count(self, key: str, compute, timeout: int) -> int:
+        """
+        Conteo guardado con la clave `key` (ej: hash de los filtros) o, si no está, el resultado
+        de compute(), que se guarda `timeout` segundos. Con la caché desactivada (o dentro de una
+        transacción) se llama a compute().
+        """
+        if not self._active():
+            return compute()
+
+        generation = self.backend.get(self._count_generation_key(), 0, version=self.version)
+        count_key = f"{self.prefix}:count:{generation}:{key}"
+        count = self.backend.get(count_key, version=self.version)
+        if count is None:
+            count = compute()
+            self.backend.add(count_key, count, timeout=timeout, version=self.version)
+        return count
+
+    def invalidate_counts(self):
+        """Descarta los conteos guardados (nueva generación) cuando se confirme la transacción en curso"""
+        if not self.enabled:
+            return
+
+        transaction.on_commit(lambda: self._increment(self._count_generation_key()), using=self.using)
+
+    def stats(self) -> dict:
+        """Aciertos y fallos de lectura de este proceso"""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
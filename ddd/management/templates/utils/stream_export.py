@@ -0,0 +1,99 @@
+import csv
+import json
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Formatos de exportación: formato -> tipo de contenido de la respuesta
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class _Echo:
+    """Buffer que devuelve lo que se escribe en él (csv.writer escribe una fila y la recuperamos sin acumularla)"""
+    def write(self, value):
+        return value
+
+
+def start_rows(rows: Iterable[dict]) -> Iterator[dict]:
+    """
+    Lee la primera fila antes de empezar la respuesta.
+
+    Así los errores de validación o de base de datos se lanzan en la vista (y se pueden
+    responder con su código HTTP) en lugar de cortar una respuesta ya enviada a medias.
+
+    Args:
+        rows: Filas a exportar (normalmente un generador).
+
+    Returns:
+        Iterator[dict]: Las mismas filas.
+    """
+    rows = iter(rows)
+    first = list(islice(rows, 1))
+    return chain(first, rows)
+
+
+def serializer_fields(serializer_class) -> list:
+    """
+    Campos que devuelve un serializer de DRF (sin los write_only), en su orden.
+
+    Args:
+        serializer_class: Clase del serializer (ej: el DTOSerializer de la entidad).
+
+    Returns:
+        list: Nombres de los campos, para usarlos como columnas de la exportación.
+    """
+    return [name for name, field in serializer_class().fields.items() if not field.write_only]
+
+
+def stream_csv(rows: Iterable[dict], fields: Optional[list] = None) -> Iterator[str]:
+    """
+    Codifica las filas como CSV, una línea cada vez.
+
+    Con `fields` la cabecera es fija (también sin filas) y los campos que falten en una fila
+    quedan vacíos. Sin `fields` se toman las claves de la primera fila: una columna que no
+    tenga (ej: to_dict() omite los valores None) no aparece en el archivo.
+
+    Args:
+        rows: Filas a exportar.
+        fields: Columnas, en orden.
+
+    Returns:
+        Iterator[str]: Cabecera y una línea por fila.
+    """
+    writer = csv.writer(_Echo())
+    if fields is not None:
+        yield writer.writerow(fields)
+
+    for row in rows:
+        if fields is None:
+            fields = list(row.keys())
+            yield writer.writerow(fields)
+        yield writer.writerow([_to_cell(row.get(field)) for field in fields])
+
+
+def stream_ndjson(rows: Iterable[dict], fields: Optional[list] = None) -> Iterator[str]:
+    """
+    Codifica las filas como NDJSON (un objeto JSON por línea).
+
+    Args:
+        rows: Filas a exportar.
+        fields: Campos de cada objeto, en orden (los que falten en una fila son null); por defecto, toda la fila.
+
+    Returns:
+        Iterator[str]: Una línea por fila.
+    """
+    for row in rows:
+        if fields is not None:
+            row = {field: row.get(field) for field in fields}
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def _to_cell(value):
+    """Listas y diccionarios se exportan como JSON dentro de la celda"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    return "" if value is None else value
@@ -36,14 +36,17 @@ from [[ app_name.lower() ]].services.[[ entity_name.lower() ]]_service import [[
 
 def list(request):
     """
-    Vista genérica para mostrar una lista de todas las instancias de [[ entity_name|decapitalize_first ]].
+    Vista genérica para mostrar una lista paginada (por cursor) de las instancias de [[ entity_name|decapitalize_first ]].
     """
 
     [[ entity_name|decapitalize_first ]]List = [] #inicialize list
+    next_cursor = None
 
-    # Obtener la lista del repositorio
+    # Obtener una página del repositorio (?cursor= con el cursor de la página anterior)
     try:
-        [[ entity_name|decapitalize_first ]]List = [[ entity_name|capitalize_first ]]Service().list()
+        page = [[ entity_name|capitalize_first ]]Service().list_page(cursor=request.GET.get('cursor'), readonly=True)
+        [[ entity_name|decapitalize_first ]]List = page["results"]
+        next_cursor = page["next_cursor"]
 
     except ([[ entity_name|capitalize_first ]]ValueError) as e:
         messages.error(request,  str(e))
@@ -54,7 +57,8 @@ def list(request):
 
     # Renderizar la plantilla con la lista
     return render(request, '[[ relative_app_path.lower() ]]/[[ entity_name.lower() ]]_web_list.html', {
-        '[[ entity_name|decapitalize_first ]]List': [[ entity_name|decapitalize_first ]]List
+        '[[ entity_name|decapitalize_first ]]List': [[ entity_name|decapitalize_first ]]List,
+        'next_cursor': next_cursor
     })
 
 
@@ -187,6 +191,8 @@ def edit(request, id=None):
 
             except [[ entity_name|capitalize_first ]]NotFoundError as e:
                 messages.error(request,  "Not Found Error: " + str(e))                
+            except [[ entity_name|capitalize_first ]]AlreadyExistsError as e:
+                messages.error(request, "Already Exists Error: " + str(e))
             except ([[ entity_name|capitalize_first ]]ValueError, [[ entity_name|capitalize_first ]]ValidationError) as e:
                 form.add_error(None, "Validation Error: " + str(e))
             except (ConnectionDataBaseError, RepositoryError) as e:
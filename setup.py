@@ -15,6 +15,10 @@ setup(
     packages=find_packages(),
     include_package_data=True,  
     install_requires=['django', 'jinja2', 'colorama'],
+    extras_require={
+        'yaml': ['pyyaml'],
+        'watch': ['inotify_simple'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Framework :: Django',